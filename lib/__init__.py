@@ -6,9 +6,11 @@ Core utilities for the Android Recon reconnaissance radar.
 
 from .json_utils import (
     create_scan_result,
+    dumps_json,
     get_latest_scan,
     get_timestamp,
     load_json,
+    loads_json,
     merge_scans,
     print_json,
     save_json,
@@ -17,9 +19,11 @@ from .json_utils import (
 
 __all__ = [
     'create_scan_result',
+    'dumps_json',
     'get_latest_scan',
     'get_timestamp',
     'load_json',
+    'loads_json',
     'merge_scans',
     'print_json',
     'save_json',
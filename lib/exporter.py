@@ -7,50 +7,130 @@ Export scan results to various formats (JSON, CSV).
 
 import argparse
 import csv
+import itertools
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+# Add lib to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib.json_utils import dumps_json, load_json
 
-def load_all_scans(output_dir: str) -> List[Dict[str, Any]]:
+# Size of the write buffer used for export files
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Number of CSV rows buffered before each writerows() call
+CSV_BATCH_SIZE = 1024
+
+# Number of scan files parsed concurrently per batch
+LOAD_BATCH_SIZE = 32
+
+# Columns that always lead CSV exports
+CSV_PRIORITY_KEYS = ["scan_type", "scan_timestamp"]
+
+# Flattened item columns produced by each scanner, in CSV column order
+SCAN_SCHEMAS: Dict[str, List[str]] = {
+    "network": ["ip", "mac", "hostname", "alive", "latency_ms", "open_ports"],
+    "wifi": [
+        "ssid", "bssid", "frequency", "channel", "signal_dbm",
+        "signal_quality", "security", "encryption"
+    ],
+    "bluetooth": ["address", "name", "type", "device_class", "device_type", "rssi"],
+}
+
+
+def _load_scan_file(entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+    """Load a single scan file, warning and returning None on failure."""
+    try:
+        return load_json(entry.path)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not load {entry.name}: {e}", file=sys.stderr)
+        return None
+
+
+def iter_all_scans(output_dir: str, sort: bool = False) -> Iterator[Dict[str, Any]]:
     """
-    Load all scan results from output directory.
+    Iterate over scan results in output directory.
+    
+    Files are parsed on a small thread pool, LOAD_BATCH_SIZE at a time, so
+    disk reads overlap with parsing while memory stays bounded to one
+    batch. Scans are yielded in directory order unless sort is set.
     
     Args:
         output_dir: Directory containing scan results
+        sort: Yield scans in filename order
     
-    Returns:
-        List of scan results
+    Yields:
+        Scan result dictionaries
     """
-    scans = []
-    
     if not os.path.exists(output_dir):
-        return scans
+        return
+    
+    with os.scandir(output_dir) as it:
+        entries = [entry for entry in it
+                   if entry.name.endswith('.json') and entry.is_file()]
+    
+    if sort:
+        entries.sort(key=lambda entry: entry.name)
     
-    for filename in sorted(os.listdir(output_dir)):
-        if filename.endswith('.json'):
-            filepath = os.path.join(output_dir, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    scans.append(json.load(f))
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load {filename}: {e}", file=sys.stderr)
+    if not entries:
+        return
     
-    return scans
+    max_workers = min(8, os.cpu_count() or 4, len(entries))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for start in range(0, len(entries), LOAD_BATCH_SIZE):
+            batch = entries[start:start + LOAD_BATCH_SIZE]
+            for scan in executor.map(_load_scan_file, batch):
+                if scan is not None:
+                    yield scan
 
 
-def flatten_scan_data(scan: Dict[str, Any]) -> List[Dict[str, Any]]:
+def load_all_scans(output_dir: str, sort: bool = False) -> List[Dict[str, Any]]:
     """
-    Flatten scan data for CSV export.
+    Load all scan results from output directory.
+    
+    Args:
+        output_dir: Directory containing scan results
+        sort: Return scans in filename order
+    
+    Returns:
+        List of scan results
+    """
+    return list(iter_all_scans(output_dir, sort=sort))
+
+
+def _join_values(values: List[Any]) -> str:
+    """Join list values into a single CSV cell."""
+    # Lists of strings (encryption types, addresses) can be joined directly
+    if all(type(v) is str for v in values):
+        return ", ".join(values)
+    return ", ".join(map(str, values))
+
+
+def flatten_scan_rows(scan: Dict[str, Any], fieldnames: List[str]) -> List[List[Any]]:
+    """
+    Flatten scan data into CSV rows ordered by fieldnames.
+    
+    Each item becomes one row led by the scan's type and timestamp.
+    Nested dicts are flattened into key_subkey columns and lists are
+    joined into a single cell. Values are written straight into positional
+    rows for csv.writer; keys without a matching column are dropped.
     
     Args:
         scan: Scan result dictionary
+        fieldnames: Column names, in output order
     
     Returns:
-        List of flattened dictionaries
+        List of rows (missing values are None, written as empty cells)
     """
+    column_index = {name: i for i, name in enumerate(fieldnames)}
+    width = len(fieldnames)
+    type_col = column_index.get("scan_type")
+    timestamp_col = column_index.get("scan_timestamp")
+    
     scan_type = scan.get("scan_type", "unknown")
     timestamp = scan.get("timestamp", "")
     data = scan.get("data", [])
@@ -58,87 +138,233 @@ def flatten_scan_data(scan: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not isinstance(data, list):
         data = [data]
     
-    flattened = []
+    rows = []
     for item in data:
-        flat_item = {
-            "scan_type": scan_type,
-            "scan_timestamp": timestamp
-        }
+        row = [None] * width
+        if type_col is not None:
+            row[type_col] = scan_type
+        if timestamp_col is not None:
+            row[timestamp_col] = timestamp
         
-        # Flatten nested dictionaries
         for key, value in item.items():
             if isinstance(value, dict):
                 for sub_key, sub_value in value.items():
-                    flat_item[f"{key}_{sub_key}"] = sub_value
-            elif isinstance(value, list):
-                flat_item[key] = ", ".join(str(v) for v in value)
+                    col = column_index.get(f"{key}_{sub_key}")
+                    if col is not None:
+                        row[col] = sub_value
+                continue
+            
+            col = column_index.get(key)
+            if col is None:
+                continue
+            if isinstance(value, list):
+                row[col] = _join_values(value)
             else:
-                flat_item[key] = value
+                row[col] = value
         
-        flattened.append(flat_item)
+        rows.append(row)
     
-    return flattened
+    return rows
 
 
-def export_to_json(scans: List[Dict[str, Any]], output_path: str) -> str:
+def export_to_json(
+    scans: Iterable[Dict[str, Any]],
+    output_path: str,
+    pretty: bool = False
+) -> Tuple[str, int]:
     """
     Export scans to a combined JSON file.
     
+    The envelope is written by hand so scans are streamed to disk one at
+    a time instead of being collected into a single combined dict. Output
+    is compact unless pretty is set.
+    
     Args:
-        scans: List of scan results
+        scans: Iterable of scan results
         output_path: Path to output file
+        pretty: Whether to indent the output
     
     Returns:
-        Path to exported file
+        Tuple of (path to exported file, number of scans exported)
     """
-    combined = {
-        "export_timestamp": datetime.now().isoformat(),
-        "total_scans": len(scans),
-        "scans": scans
-    }
+    count = 0
+    separator = b',\n' if pretty else b','
     
-    with open(output_path, 'w') as f:
-        json.dump(combined, f, indent=2, default=str)
+    with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write(b'{"export_timestamp":')
+        f.write(dumps_json(datetime.now().isoformat()))
+        f.write(b',"scans":[\n' if pretty else b',"scans":[')
+        
+        for scan in scans:
+            if count:
+                f.write(separator)
+            f.write(dumps_json(scan, pretty=pretty))
+            count += 1
+        
+        f.write(b'],"total_scans":%d}' % count)
     
-    return output_path
+    return output_path, count
 
 
-def export_to_csv(scans: List[Dict[str, Any]], output_path: str) -> str:
+def schema_fieldnames(scan_types: Optional[Iterable[str]] = None) -> List[str]:
     """
-    Export scans to a CSV file.
+    Build CSV column names from the registered scan schemas.
     
     Args:
-        scans: List of scan results
-        output_path: Path to output file
+        scan_types: Scan types to include (default: all in SCAN_SCHEMAS)
+    
+    Returns:
+        Column names, priority columns first
+    """
+    if scan_types is None:
+        scan_types = SCAN_SCHEMAS.keys()
+    
+    fieldnames = list(CSV_PRIORITY_KEYS)
+    for scan_type in scan_types:
+        for key in SCAN_SCHEMAS.get(scan_type, []):
+            if key not in fieldnames:
+                fieldnames.append(key)
+    
+    return fieldnames
+
+
+def _flat_keys(item: Dict[str, Any]) -> Iterator[str]:
+    """Yield the column names flatten_scan_rows fills for an item."""
+    for key, value in item.items():
+        if isinstance(value, dict):
+            for sub_key in value:
+                yield f"{key}_{sub_key}"
+        else:
+            yield key
+
+
+def collect_csv_fieldnames(scans: Iterable[Dict[str, Any]]) -> List[str]:
+    """
+    Collect the CSV column names needed for a set of scans.
+    
+    The columns of every SCAN_SCHEMAS entry come first, in schema order.
+    Keys outside the schema of their scan type, including every key of an
+    unknown scan type, are discovered from the items and follow in sorted
+    order. Only key names are kept, not row data.
+    
+    Args:
+        scans: Iterable of scan results
     
     Returns:
-        Path to exported file
+        Column names, or an empty list if the scans contain no data
     """
-    # Flatten all scan data
-    all_data = []
+    extra_keys = set()
+    has_data = False
+    
     for scan in scans:
-        all_data.extend(flatten_scan_data(scan))
+        scan_type = scan.get("scan_type", "unknown")
+        data = scan.get("data", [])
+        if not isinstance(data, list):
+            data = [data]
+        if not data:
+            continue
+        
+        has_data = True
+        schema = SCAN_SCHEMAS.get(scan_type, ())
+        for item in data:
+            for key in _flat_keys(item):
+                if key not in schema:
+                    extra_keys.add(key)
     
-    if not all_data:
-        print("No data to export", file=sys.stderr)
-        return output_path
+    if not has_data:
+        return []
+    
+    fieldnames = schema_fieldnames()
+    known = set(fieldnames)
+    return fieldnames + sorted(k for k in extra_keys if k not in known)
+
+
+def _until_uncovered(
+    scans: Iterable[Dict[str, Any]],
+    fieldnames: List[str],
+    uncovered: List[Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Pass scans through until one has a column missing from fieldnames.
     
-    # Get all unique keys
-    all_keys = set()
-    for item in all_data:
-        all_keys.update(item.keys())
+    That scan is still yielded, then recorded in uncovered and iteration
+    stops, so the caller knows the export has to be redone with
+    collect_csv_fieldnames() output.
     
-    # Sort keys with scan_type and timestamp first
-    priority_keys = ["scan_type", "scan_timestamp"]
-    sorted_keys = priority_keys + sorted(k for k in all_keys if k not in priority_keys)
+    Args:
+        scans: Iterable of scan results
+        fieldnames: Column names being exported
+        uncovered: List that receives the first scan not covered
+    
+    Yields:
+        Scan result dictionaries
+    """
+    known = set(fieldnames)
+    for scan in scans:
+        yield scan
+        data = scan.get("data", [])
+        if not isinstance(data, list):
+            data = [data]
+        for item in data:
+            if any(key not in known for key in _flat_keys(item)):
+                uncovered.append(scan)
+                return
+
+
+def export_to_csv(
+    scans: Iterable[Dict[str, Any]],
+    output_path: str,
+    fieldnames: Optional[List[str]] = None
+) -> Tuple[str, int]:
+    """
+    Export scans to a CSV file in a single streaming pass.
+    
+    Rows are written in batches of CSV_BATCH_SIZE as scans are read. When
+    fieldnames is not given they are collected from the scans first, which
+    means reading them into memory; pass collect_csv_fieldnames() output
+    from a separate pass to keep the export streaming.
+    
+    Args:
+        scans: Iterable of scan results
+        output_path: Path to output file
+        fieldnames: Optional column names (see collect_csv_fieldnames)
+    
+    Returns:
+        Tuple of (path to exported file, number of scans exported)
+    """
+    if fieldnames is None:
+        scans = list(scans)
+        fieldnames = collect_csv_fieldnames(scans)
+    
+    if not fieldnames:
+        print("No data to export", file=sys.stderr)
+        return output_path, 0
+    
+    count = 0
+    row_count = 0
     
     # Write CSV
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=sorted_keys, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(all_data)
+    with open(output_path, 'w', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        
+        batch = []
+        for scan in scans:
+            batch.extend(flatten_scan_rows(scan, fieldnames))
+            count += 1
+            if len(batch) >= CSV_BATCH_SIZE:
+                writer.writerows(batch)
+                row_count += len(batch)
+                batch.clear()
+        
+        if batch:
+            writer.writerows(batch)
+            row_count += len(batch)
     
-    return output_path
+    if not row_count:
+        print("No data to export", file=sys.stderr)
+    
+    return output_path, count
 
 
 def main():
@@ -159,16 +385,24 @@ def main():
         "--export-path", "-e",
         help="Path for exported file (default: auto-generated)"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="JSON only: indent the exported file (default: compact)"
+    )
     
     args = parser.parse_args()
     
-    # Load all scans
-    scans = load_all_scans(args.output)
+    # Stream scans from disk; peek at the first one to detect an empty directory
+    scans = iter_all_scans(args.output)
+    first_scan = next(scans, None)
     
-    if not scans:
+    if first_scan is None:
         print("No scan results found to export", file=sys.stderr)
         sys.exit(1)
     
+    scans = itertools.chain([first_scan], scans)
+    
     # Generate export path if not provided
     if args.export_path:
         export_path = args.export_path
@@ -178,11 +412,23 @@ def main():
     
     # Export based on format
     if args.format == "json":
-        result_path = export_to_json(scans, export_path)
+        result_path, scan_count = export_to_json(scans, export_path, pretty=args.pretty)
     else:
-        result_path = export_to_csv(scans, export_path)
+        # Stream the rows under the schema columns; only if a scan turns out
+        # to have other columns are they discovered in a separate pass and
+        # the file written again
+        fieldnames = schema_fieldnames()
+        uncovered = []
+        result_path, scan_count = export_to_csv(
+            _until_uncovered(scans, fieldnames, uncovered), export_path, fieldnames
+        )
+        if uncovered:
+            fieldnames = collect_csv_fieldnames(iter_all_scans(args.output))
+            result_path, scan_count = export_to_csv(
+                iter_all_scans(args.output), export_path, fieldnames
+            )
     
-    print(f"Exported {len(scans)} scan(s) to: {result_path}")
+    print(f"Exported {scan_count} scan(s) to: {result_path}")
 
 
 if __name__ == "__main__":
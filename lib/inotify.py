@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Android Recon - inotify Utilities
+=================================
+Minimal directory change notification over the Linux inotify API (through
+ctypes, no extra packages), so callers can react to new scan results
+instead of polling the output directory.
+"""
+
+import ctypes
+import os
+import select
+from typing import Optional
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_DELETE = 0x200
+
+# A scan file was written, renamed into/out of the directory, or removed
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+
+def watch_directory(path: str, mask: int = WATCH_MASK) -> Optional[int]:
+    """
+    Start watching a directory for changes.
+    
+    Args:
+        path: Directory to watch
+        mask: inotify event mask
+    
+    Returns:
+        inotify file descriptor (close with os.close), or None if inotify
+        is unavailable or the directory can't be watched
+    """
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    
+    inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+    
+    fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    
+    if inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+        os.close(fd)
+        return None
+    
+    return fd
+
+
+def wait_for_events(fd: int, timeout: Optional[float] = None) -> bool:
+    """
+    Wait for events on an inotify descriptor and drain them.
+    
+    Args:
+        fd: Descriptor from watch_directory()
+        timeout: Seconds to wait (None waits forever)
+    
+    Returns:
+        True if any events arrived, False on timeout
+    """
+    readable, _, _ = select.select([fd], [], [], timeout)
+    if not readable:
+        return False
+    
+    # Events are only used as a wake-up, so their contents are discarded
+    try:
+        while os.read(fd, 4096):
+            pass
+    except BlockingIOError:
+        pass
+    
+    return True
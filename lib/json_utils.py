@@ -6,10 +6,20 @@ Provides consistent JSON formatting and output functions for all scanner modules
 """
 
 import json
+import mmap
 import os
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+# orjson is optional; fall back to the stdlib json module when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files larger than this are memory-mapped when loading with orjson
+MMAP_THRESHOLD = 1 << 20
 
 
 def get_timestamp() -> str:
@@ -20,7 +30,8 @@ def get_timestamp() -> str:
 def create_scan_result(
     scan_type: str,
     data: Union[List, Dict],
-    metadata: Optional[Dict] = None
+    metadata: Optional[Dict] = None,
+    timestamp: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Create a standardized scan result structure.
@@ -29,13 +40,14 @@ def create_scan_result(
         scan_type: Type of scan (network, wifi, bluetooth)
         data: Scan results data
         metadata: Optional additional metadata
+        timestamp: Optional ISO timestamp to reuse (default: now)
     
     Returns:
         Standardized scan result dictionary
     """
     result = {
         "scan_type": scan_type,
-        "timestamp": get_timestamp(),
+        "timestamp": timestamp or get_timestamp(),
         "version": "1.0.0",
         "data": data,
         "metadata": metadata or {}
@@ -48,11 +60,49 @@ def create_scan_result(
     return result
 
 
+def dumps_json(data: Any, pretty: bool = True) -> bytes:
+    """
+    Serialize data to JSON bytes, using orjson when available.
+    
+    Args:
+        data: Data to serialize
+        pretty: Whether to indent the output
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    
+    if pretty:
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON text, using orjson when available.
+    
+    Args:
+        data: JSON document as bytes or str
+    
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def save_json(
     data: Dict[str, Any],
     output_dir: str,
     filename: Optional[str] = None,
-    scan_type: Optional[str] = None
+    scan_type: Optional[str] = None,
+    pretty: bool = True
 ) -> str:
     """
     Save scan results to a JSON file.
@@ -62,6 +112,7 @@ def save_json(
         output_dir: Directory to save to
         filename: Optional custom filename
         scan_type: Type of scan (used for default filename)
+        pretty: Whether to indent the output (compact otherwise)
     
     Returns:
         Path to saved file
@@ -77,8 +128,8 @@ def save_json(
     
     filepath = os.path.join(output_dir, filename)
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+    with open(filepath, 'wb') as f:
+        f.write(dumps_json(data, pretty=pretty))
     
     return filepath
 
@@ -93,8 +144,20 @@ def load_json(filepath: str) -> Dict[str, Any]:
     Returns:
         Loaded data dictionary
     """
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+        
+        # Parse large files straight from a memory map instead of copying
+        # them into a bytes object first
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        
+        return orjson.loads(f.read())
 
 
 def print_json(data: Dict[str, Any], pretty: bool = True) -> None:
@@ -122,37 +185,50 @@ def get_latest_scan(output_dir: str, scan_type: Optional[str] = None) -> Optiona
     Returns:
         Latest scan result or None if no scans found
     """
-    if not os.path.exists(output_dir):
-        return None
+    latest_path = None
+    latest_mtime = None
     
-    # Get all JSON files
-    json_files = []
-    for f in os.listdir(output_dir):
-        if f.endswith('.json'):
-            if scan_type is None or f.startswith(scan_type):
-                json_files.append(os.path.join(output_dir, f))
+    # Track the newest matching file in a single scandir pass; DirEntry.stat()
+    # is cached, so each file is stat'ed at most once
+    try:
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json'):
+                    continue
+                if scan_type is not None and not entry.name.startswith(scan_type):
+                    continue
+                
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_path = entry.path
+                    latest_mtime = mtime
+    except FileNotFoundError:
+        return None
     
-    if not json_files:
+    if latest_path is None:
         return None
     
-    # Sort by modification time and get the latest
-    latest_file = max(json_files, key=os.path.getmtime)
-    return load_json(latest_file)
+    return load_json(latest_path)
 
 
-def merge_scans(scans: List[Dict[str, Any]]) -> Dict[str, Any]:
+def merge_scans(scans: List[Dict[str, Any]], timestamp: Optional[str] = None) -> Dict[str, Any]:
     """
     Merge multiple scan results into a single combined result.
     
     Args:
         scans: List of scan results to merge
+        timestamp: Optional ISO timestamp to reuse (default: now)
     
     Returns:
         Combined scan result
     """
     combined = {
         "scan_type": "combined",
-        "timestamp": get_timestamp(),
+        "timestamp": timestamp or get_timestamp(),
         "version": "1.0.0",
         "scans": {},
         "metadata": {
@@ -170,9 +246,12 @@ def merge_scans(scans: List[Dict[str, Any]]) -> Dict[str, Any]:
 class ScanResultBuilder:
     """Builder class for creating scan results with consistent structure."""
     
+    __slots__ = ('scan_type', 'items', 'metadata', 'errors', 'warnings', 'timestamp')
+    
     def __init__(self, scan_type: str):
         """Initialize builder with scan type."""
         self.scan_type = scan_type
+        self.timestamp: Optional[str] = None
         self.items: List[Dict[str, Any]] = []
         self.metadata: Dict[str, Any] = {}
         self.errors: List[str] = []
@@ -183,6 +262,11 @@ class ScanResultBuilder:
         self.items.append(item)
         return self
     
+    def add_items(self, items: Iterable[Dict[str, Any]]) -> 'ScanResultBuilder':
+        """Add several items to the scan results at once."""
+        self.items.extend(items)
+        return self
+    
     def add_metadata(self, key: str, value: Any) -> 'ScanResultBuilder':
         """Add metadata to the scan results."""
         self.metadata[key] = value
@@ -199,11 +283,20 @@ class ScanResultBuilder:
         return self
     
     def build(self) -> Dict[str, Any]:
-        """Build and return the final scan result."""
+        """
+        Build and return the final scan result.
+        
+        The clock is read on the first build only, so build() and a later
+        save() stamp the returned and saved results identically.
+        """
+        if self.timestamp is None:
+            self.timestamp = get_timestamp()
+        
         result = create_scan_result(
             scan_type=self.scan_type,
             data=self.items,
-            metadata=self.metadata
+            metadata=self.metadata,
+            timestamp=self.timestamp
         )
         
         if self.errors:
@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+Android Recon - Netlink Utilities
+=================================
+Reads links, addresses, routes and neighbours straight from the kernel over
+a single NETLINK_ROUTE socket, without spawning the 'ip' binary, and WiFi
+scan results over generic netlink (nl80211) without spawning 'iw'.
+"""
+
+import errno
+import os
+import select
+import socket
+import struct
+import time
+from typing import Any, Dict, List, Optional
+
+# Netlink message header: length, type, flags, sequence, port id
+_NLMSG_HDR = struct.Struct('=IHHII')
+
+# Route attribute header: length, type
+_RTA_HDR = struct.Struct('=HH')
+
+# Family-specific message headers
+_IFINFOMSG = struct.Struct('=BxHiII')
+_IFADDRMSG = struct.Struct('=BBBBI')
+_RTMSG = struct.Struct('=BBBBBBBBI')
+_NDMSG = struct.Struct('=BBHiHBB')
+
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x01
+NLM_F_DUMP = 0x300
+
+RTM_NEWLINK, RTM_GETLINK = 16, 18
+RTM_NEWADDR, RTM_GETADDR = 20, 22
+RTM_NEWROUTE, RTM_GETROUTE = 24, 26
+RTM_NEWNEIGH, RTM_GETNEIGH = 28, 30
+
+IFLA_ADDRESS = 1
+IFLA_IFNAME = 3
+IFLA_OPERSTATE = 16
+
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFA_BROADCAST = 4
+
+RTA_DST = 1
+RTA_OIF = 4
+RTA_GATEWAY = 5
+RTA_TABLE = 15
+
+NDA_DST = 1
+NDA_LLADDR = 2
+
+IFF_POINTOPOINT = 0x10
+
+RT_TABLE_MAIN = 254
+
+# Names used by 'ip' for IFLA_OPERSTATE values
+OPERSTATES = ['UNKNOWN', 'NOTPRESENT', 'DOWN', 'LOWERLAYERDOWN', 'TESTING', 'DORMANT', 'UP']
+
+# Names used by 'ip' for neighbour (NUD_*) states
+NEIGH_STATES = {
+    0x01: 'INCOMPLETE',
+    0x02: 'REACHABLE',
+    0x04: 'STALE',
+    0x08: 'DELAY',
+    0x10: 'PROBE',
+    0x20: 'FAILED',
+    0x40: 'NOARP',
+    0x80: 'PERMANENT',
+}
+
+RECV_BUFFER_SIZE = 1 << 16
+
+# Generic netlink header: command, version, reserved
+_GENL_HDR = struct.Struct('=BBH')
+
+NLM_F_ACK = 0x04
+SOL_NETLINK = 270
+NETLINK_ADD_MEMBERSHIP = 1
+NETLINK_GENERIC = 16
+
+GENL_ID_CTRL = 0x10
+CTRL_CMD_GETFAMILY = 3
+CTRL_ATTR_FAMILY_ID = 1
+CTRL_ATTR_FAMILY_NAME = 2
+CTRL_ATTR_MCAST_GROUPS = 7
+CTRL_ATTR_MCAST_GRP_NAME = 1
+CTRL_ATTR_MCAST_GRP_ID = 2
+
+NL80211_CMD_GET_SCAN = 32
+NL80211_CMD_TRIGGER_SCAN = 33
+NL80211_CMD_NEW_SCAN_RESULTS = 34
+NL80211_CMD_SCAN_ABORTED = 35
+
+NL80211_ATTR_IFINDEX = 3
+NL80211_ATTR_SCAN_SSIDS = 45
+NL80211_ATTR_BSS = 47
+
+NL80211_BSS_BSSID = 1
+NL80211_BSS_FREQUENCY = 2
+NL80211_BSS_CAPABILITY = 5
+NL80211_BSS_INFORMATION_ELEMENTS = 6
+NL80211_BSS_SIGNAL_MBM = 7
+NL80211_BSS_STATUS = 9
+NL80211_BSS_BEACON_IES = 11
+
+NL80211_BSS_STATUS_ASSOCIATED = 1
+
+# 802.11 capability bit set by networks that require encryption
+WLAN_CAPABILITY_PRIVACY = 0x0010
+
+# 802.11 information element IDs
+WLAN_EID_SSID = 0
+WLAN_EID_RSN = 48
+WLAN_EID_VENDOR_SPECIFIC = 221
+
+# Vendor-specific element prefix (Microsoft OUI, type 1) used for WPA1
+_WPA_IE_PREFIX = b'\x00\x50\xf2\x01'
+
+
+def _align(length: int) -> int:
+    """Round a length up to the 4-byte netlink alignment."""
+    return (length + 3) & ~3
+
+
+def _parse_attrs(data: bytes, offset: int, end: int) -> Dict[int, bytes]:
+    """Parse the route attributes between offset and end into {type: payload}."""
+    attrs = {}
+    while offset + _RTA_HDR.size <= end:
+        rta_len, rta_type = _RTA_HDR.unpack_from(data, offset)
+        if rta_len < _RTA_HDR.size:
+            break
+        attrs[rta_type & 0x3FFF] = data[offset + _RTA_HDR.size:offset + rta_len]
+        offset += _align(rta_len)
+    return attrs
+
+
+def _format_mac(value: bytes) -> str:
+    """Format a link-layer address as colon-separated hex."""
+    return ':'.join('%02x' % b for b in value)
+
+
+def _format_ip(family: int, value: bytes) -> str:
+    """Format a packed IPv4/IPv6 address."""
+    return socket.inet_ntop(family, value)
+
+
+def _dump(sock: socket.socket, msg_type: int, payload: bytes, seq: int) -> List[tuple]:
+    """
+    Issue one dump request and collect the replies.
+    
+    Args:
+        sock: Open NETLINK_ROUTE socket
+        msg_type: RTM_GET* request type
+        payload: Family-specific request header
+        seq: Sequence number for this request
+    
+    Returns:
+        List of (message type, message bytes, payload offset) tuples
+    """
+    header = _NLMSG_HDR.pack(
+        _NLMSG_HDR.size + len(payload), msg_type,
+        NLM_F_REQUEST | NLM_F_DUMP, seq, 0
+    )
+    sock.send(header + payload)
+    
+    messages = []
+    while True:
+        data = sock.recv(RECV_BUFFER_SIZE)
+        offset = 0
+        while offset + _NLMSG_HDR.size <= len(data):
+            length, nl_type, _, nl_seq, _ = _NLMSG_HDR.unpack_from(data, offset)
+            if length < _NLMSG_HDR.size:
+                return messages
+            if nl_seq == seq:
+                if nl_type == NLMSG_DONE:
+                    return messages
+                if nl_type == NLMSG_ERROR:
+                    error = struct.unpack_from('=i', data, offset + _NLMSG_HDR.size)[0]
+                    if error:
+                        raise OSError(-error, os.strerror(-error))
+                    return messages
+                messages.append((nl_type, data[offset:offset + length], _NLMSG_HDR.size))
+            offset += _align(length)
+
+
+def _attr(attr_type: int, payload: bytes) -> bytes:
+    """Encode one netlink attribute, padded to the 4-byte alignment."""
+    length = _RTA_HDR.size + len(payload)
+    return _RTA_HDR.pack(length, attr_type) + payload + b'\0' * (_align(length) - length)
+
+
+def _request(sock: socket.socket, msg_type: int, payload: bytes, seq: int) -> List[tuple]:
+    """
+    Send one acknowledged request and collect the replies.
+    
+    Args:
+        sock: Open netlink socket
+        msg_type: Request message type (family ID for generic netlink)
+        payload: Request body
+        seq: Sequence number for this request
+    
+    Returns:
+        List of (message type, message bytes, payload offset) tuples
+    
+    Raises:
+        OSError: If the kernel rejects the request
+    """
+    header = _NLMSG_HDR.pack(
+        _NLMSG_HDR.size + len(payload), msg_type,
+        NLM_F_REQUEST | NLM_F_ACK, seq, 0
+    )
+    sock.send(header + payload)
+    
+    messages = []
+    while True:
+        data = sock.recv(RECV_BUFFER_SIZE)
+        offset = 0
+        while offset + _NLMSG_HDR.size <= len(data):
+            length, nl_type, _, nl_seq, _ = _NLMSG_HDR.unpack_from(data, offset)
+            if length < _NLMSG_HDR.size:
+                return messages
+            if nl_seq == seq:
+                if nl_type == NLMSG_ERROR:
+                    error = struct.unpack_from('=i', data, offset + _NLMSG_HDR.size)[0]
+                    if error:
+                        raise OSError(-error, os.strerror(-error))
+                    return messages
+                messages.append((nl_type, data[offset:offset + length], _NLMSG_HDR.size))
+            offset += _align(length)
+
+
+def _parse_links(messages: List[tuple]) -> List[Dict[str, Any]]:
+    """Parse RTM_NEWLINK messages."""
+    links = []
+    for nl_type, msg, offset in messages:
+        if nl_type != RTM_NEWLINK:
+            continue
+        _, _, index, flags, _ = _IFINFOMSG.unpack_from(msg, offset)
+        attrs = _parse_attrs(msg, offset + _IFINFOMSG.size, len(msg))
+        
+        operstate = attrs.get(IFLA_OPERSTATE)
+        state = OPERSTATES[operstate[0]] if operstate and operstate[0] < len(OPERSTATES) else 'UNKNOWN'
+        address = attrs.get(IFLA_ADDRESS)
+        
+        links.append({
+            'index': index,
+            'name': attrs.get(IFLA_IFNAME, b'').rstrip(b'\0').decode('utf-8', 'replace'),
+            'state': state,
+            'point_to_point': bool(flags & IFF_POINTOPOINT),
+            'mac': _format_mac(address) if address and len(address) == 6 else None,
+        })
+    return links
+
+
+def _parse_addrs(messages: List[tuple]) -> List[Dict[str, Any]]:
+    """Parse RTM_NEWADDR messages."""
+    addrs = []
+    for nl_type, msg, offset in messages:
+        if nl_type != RTM_NEWADDR:
+            continue
+        family, prefixlen, _, _, index = _IFADDRMSG.unpack_from(msg, offset)
+        if family not in (socket.AF_INET, socket.AF_INET6):
+            continue
+        attrs = _parse_attrs(msg, offset + _IFADDRMSG.size, len(msg))
+        
+        local = attrs.get(IFA_LOCAL) or attrs.get(IFA_ADDRESS)
+        if not local:
+            continue
+        broadcast = attrs.get(IFA_BROADCAST)
+        
+        addrs.append({
+            'index': index,
+            'family': family,
+            'address': _format_ip(family, local),
+            'prefix': prefixlen,
+            'broadcast': _format_ip(family, broadcast) if broadcast else None,
+        })
+    return addrs
+
+
+def _parse_routes(messages: List[tuple]) -> List[Dict[str, Any]]:
+    """Parse RTM_NEWROUTE messages."""
+    routes = []
+    for nl_type, msg, offset in messages:
+        if nl_type != RTM_NEWROUTE:
+            continue
+        family, dst_len, _, _, table, _, _, _, _ = _RTMSG.unpack_from(msg, offset)
+        attrs = _parse_attrs(msg, offset + _RTMSG.size, len(msg))
+        
+        if RTA_TABLE in attrs:
+            table = struct.unpack('=I', attrs[RTA_TABLE])[0]
+        dst = attrs.get(RTA_DST)
+        gateway = attrs.get(RTA_GATEWAY)
+        oif = attrs.get(RTA_OIF)
+        
+        routes.append({
+            'family': family,
+            'table': table,
+            'dst': _format_ip(family, dst) if dst else None,
+            'dst_len': dst_len,
+            'gateway': _format_ip(family, gateway) if gateway else None,
+            'oif': struct.unpack('=i', oif)[0] if oif else None,
+        })
+    return routes
+
+
+def _parse_neighs(messages: List[tuple]) -> List[Dict[str, Any]]:
+    """Parse RTM_NEWNEIGH messages."""
+    neighs = []
+    for nl_type, msg, offset in messages:
+        if nl_type != RTM_NEWNEIGH:
+            continue
+        family, _, _, index, state, _, _ = _NDMSG.unpack_from(msg, offset)
+        if family not in (socket.AF_INET, socket.AF_INET6):
+            continue
+        attrs = _parse_attrs(msg, offset + _NDMSG.size, len(msg))
+        
+        dst = attrs.get(NDA_DST)
+        if not dst:
+            continue
+        lladdr = attrs.get(NDA_LLADDR)
+        
+        neighs.append({
+            'index': index,
+            'ip': _format_ip(family, dst),
+            'mac': _format_mac(lladdr) if lladdr else None,
+            'state': NEIGH_STATES.get(state),
+        })
+    return neighs
+
+
+def dump_all() -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Dump links, addresses, routes and neighbours over one netlink socket.
+    
+    Returns:
+        Dictionary with 'links', 'addrs', 'routes' and 'neighs' lists, or
+        None if netlink is unavailable (non-Linux, or blocked by the
+        platform as it is for apps on newer Android releases)
+    """
+    if not hasattr(socket, 'AF_NETLINK'):
+        return None
+    
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+    except OSError:
+        return None
+    
+    try:
+        sock.settimeout(2.0)
+        sock.bind((0, 0))
+        
+        return {
+            'links': _parse_links(_dump(
+                sock, RTM_GETLINK, _IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0), 1)),
+            'addrs': _parse_addrs(_dump(
+                sock, RTM_GETADDR, _IFADDRMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0), 2)),
+            'routes': _parse_routes(_dump(
+                sock, RTM_GETROUTE, _RTMSG.pack(socket.AF_INET, 0, 0, 0, 0, 0, 0, 0, 0), 3)),
+            'neighs': _parse_neighs(_dump(
+                sock, RTM_GETNEIGH, _NDMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0, 0, 0), 4)),
+        }
+    except (OSError, struct.error, IndexError):
+        return None
+    finally:
+        sock.close()
+
+
+def _resolve_genl_family(sock: socket.socket, name: str) -> Optional[tuple]:
+    """
+    Look up a generic netlink family.
+    
+    Args:
+        sock: Open NETLINK_GENERIC socket
+        name: Family name (e.g. 'nl80211')
+    
+    Returns:
+        Tuple of (family ID, {multicast group name: group ID}), or None if
+        the family is not registered
+    """
+    payload = (
+        _GENL_HDR.pack(CTRL_CMD_GETFAMILY, 1, 0) +
+        _attr(CTRL_ATTR_FAMILY_NAME, name.encode() + b'\0')
+    )
+    try:
+        messages = _request(sock, GENL_ID_CTRL, payload, 1)
+    except OSError as e:
+        if e.errno == errno.ENOENT:
+            return None
+        raise
+    
+    for _, msg, offset in messages:
+        attrs = _parse_attrs(msg, offset + _GENL_HDR.size, len(msg))
+        if CTRL_ATTR_FAMILY_ID not in attrs:
+            continue
+        
+        groups = {}
+        nested = attrs.get(CTRL_ATTR_MCAST_GROUPS, b'')
+        for group in _parse_attrs(nested, 0, len(nested)).values():
+            group_attrs = _parse_attrs(group, 0, len(group))
+            if CTRL_ATTR_MCAST_GRP_NAME in group_attrs and CTRL_ATTR_MCAST_GRP_ID in group_attrs:
+                group_name = group_attrs[CTRL_ATTR_MCAST_GRP_NAME].rstrip(b'\0').decode()
+                groups[group_name] = struct.unpack('=I', group_attrs[CTRL_ATTR_MCAST_GRP_ID])[0]
+        
+        return struct.unpack('=H', attrs[CTRL_ATTR_FAMILY_ID])[0], groups
+    
+    return None
+
+
+def _wait_scan_done(sock: socket.socket, family: int, ifindex: int, timeout: float) -> bool:
+    """
+    Wait for the nl80211 'scan' group to report a finished or aborted scan.
+    
+    Args:
+        sock: NETLINK_GENERIC socket subscribed to the scan group
+        family: nl80211 family ID
+        ifindex: Interface index to wait for
+        timeout: Maximum seconds to wait
+    
+    Returns:
+        True if the scan ended before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+            return False
+        
+        data = sock.recv(RECV_BUFFER_SIZE)
+        offset = 0
+        while offset + _NLMSG_HDR.size <= len(data):
+            length, nl_type, _, _, _ = _NLMSG_HDR.unpack_from(data, offset)
+            if length < _NLMSG_HDR.size:
+                break
+            body = offset + _NLMSG_HDR.size
+            if nl_type == family:
+                cmd = data[body]
+                if cmd in (NL80211_CMD_NEW_SCAN_RESULTS, NL80211_CMD_SCAN_ABORTED):
+                    attrs = _parse_attrs(data, body + _GENL_HDR.size, offset + length)
+                    index = attrs.get(NL80211_ATTR_IFINDEX)
+                    if index and struct.unpack('=I', index)[0] == ifindex:
+                        return True
+            offset += _align(length)
+
+
+def _parse_ies(data: bytes) -> Dict[str, Any]:
+    """Pull the SSID and WPA/RSN elements out of raw 802.11 information elements."""
+    ssid = None
+    security = []
+    offset = 0
+    while offset + 2 <= len(data):
+        eid, length = data[offset], data[offset + 1]
+        value = data[offset + 2:offset + 2 + length]
+        offset += 2 + length
+        
+        if eid == WLAN_EID_SSID and ssid is None:
+            ssid = value
+        elif eid == WLAN_EID_RSN:
+            security.append('RSN')
+        elif eid == WLAN_EID_VENDOR_SPECIFIC and value.startswith(_WPA_IE_PREFIX):
+            security.append('WPA')
+    
+    # Hidden networks send an empty or NUL-filled SSID
+    if ssid is not None and not ssid.strip(b'\0'):
+        ssid = b''
+    
+    return {
+        'ssid': ssid.decode('utf-8', 'backslashreplace') if ssid is not None else None,
+        'security': security,
+    }
+
+
+def _parse_scan_results(messages: List[tuple]) -> List[Dict[str, Any]]:
+    """Parse NL80211_CMD_NEW_SCAN_RESULTS dump messages."""
+    results = []
+    for _, msg, offset in messages:
+        attrs = _parse_attrs(msg, offset + _GENL_HDR.size, len(msg))
+        nested = attrs.get(NL80211_ATTR_BSS)
+        if not nested:
+            continue
+        bss = _parse_attrs(nested, 0, len(nested))
+        
+        bssid = bss.get(NL80211_BSS_BSSID)
+        if not bssid or len(bssid) != 6:
+            continue
+        
+        frequency = bss.get(NL80211_BSS_FREQUENCY)
+        signal = bss.get(NL80211_BSS_SIGNAL_MBM)
+        capability = bss.get(NL80211_BSS_CAPABILITY)
+        status = bss.get(NL80211_BSS_STATUS)
+        ies = _parse_ies(
+            bss.get(NL80211_BSS_INFORMATION_ELEMENTS) or bss.get(NL80211_BSS_BEACON_IES) or b''
+        )
+        
+        results.append({
+            'bssid': _format_mac(bssid),
+            'ssid': ies['ssid'],
+            'frequency': struct.unpack('=I', frequency)[0] if frequency else None,
+            'signal_dbm': struct.unpack('=i', signal)[0] / 100 if signal else None,
+            'privacy': bool(capability and struct.unpack('=H', capability)[0] & WLAN_CAPABILITY_PRIVACY),
+            'security': ies['security'],
+            'associated': bool(status) and struct.unpack('=I', status)[0] == NL80211_BSS_STATUS_ASSOCIATED,
+        })
+    return results
+
+
+def scan_wifi(interface: str, trigger: bool = True, timeout: float = 30.0) -> Optional[List[Dict[str, Any]]]:
+    """
+    Scan for WiFi networks over nl80211, as 'iw <interface> scan' does.
+    
+    A fresh scan is triggered and awaited when allowed (triggering needs
+    CAP_NET_ADMIN); otherwise, or if it fails, the kernel's cached results
+    from the last scan are returned.
+    
+    Args:
+        interface: Wireless interface name
+        trigger: Trigger a new scan before reading results
+        timeout: Maximum seconds to wait for a triggered scan
+    
+    Returns:
+        List of BSS dictionaries in kernel order, or None if nl80211 is
+        unavailable (no cfg80211 driver, unknown interface, or netlink
+        blocked by the platform)
+    """
+    if not hasattr(socket, 'AF_NETLINK'):
+        return None
+    
+    try:
+        ifindex = socket.if_nametoindex(interface)
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_GENERIC)
+    except OSError:
+        return None
+    
+    events = None
+    try:
+        sock.settimeout(2.0)
+        sock.bind((0, 0))
+        
+        family = _resolve_genl_family(sock, 'nl80211')
+        if family is None:
+            return None
+        family_id, groups = family
+        ifindex_attr = _attr(NL80211_ATTR_IFINDEX, struct.pack('=I', ifindex))
+        
+        if trigger and 'scan' in groups:
+            # Subscribe before triggering so the completion event cannot be missed
+            events = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_GENERIC)
+            events.bind((0, 0))
+            events.setsockopt(SOL_NETLINK, NETLINK_ADD_MEMBERSHIP, groups['scan'])
+            
+            # One wildcard SSID requests an active scan, as 'iw scan' does
+            payload = (
+                _GENL_HDR.pack(NL80211_CMD_TRIGGER_SCAN, 0, 0) + ifindex_attr +
+                _attr(NL80211_ATTR_SCAN_SSIDS | 0x8000, _attr(1, b''))
+            )
+            try:
+                _request(sock, family_id, payload, 2)
+                scanning = True
+            except OSError as e:
+                # Busy means another client's scan is running; wait for it too
+                scanning = e.errno == errno.EBUSY
+            
+            if scanning:
+                _wait_scan_done(events, family_id, ifindex, timeout)
+        
+        messages = _dump(
+            sock, family_id, _GENL_HDR.pack(NL80211_CMD_GET_SCAN, 0, 0) + ifindex_attr, 3
+        )
+        return _parse_scan_results(messages)
+    except (OSError, struct.error, IndexError):
+        return None
+    finally:
+        if events is not None:
+            events.close()
+        sock.close()
@@ -14,12 +14,16 @@ Features:
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import selectors
+import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 # Add lib to path
@@ -75,6 +79,20 @@ BT_DEVICE_CLASSES = {
     0x0714: "Glasses",
 }
 
+# BlueZ tools, resolved once so missing binaries are skipped without a fork
+_HCITOOL = shutil.which('hcitool')
+_HCICONFIG = shutil.which('hciconfig')
+_BLUETOOTHCTL = shutil.which('bluetoothctl')
+
+# Precompiled patterns for parsing hciconfig/hcitool output
+_ADAPTER_RE = re.compile(rb'^(hci\d+):')
+_BD_ADDR_RE = re.compile(rb'BD Address:\s*([0-9A-Fa-f:]{17})')
+_CLASSIC_RE = re.compile(r'\s*([0-9A-Fa-f:]{17})\s+(.*)')
+_BLE_RE = re.compile(r'([0-9A-Fa-f:]{17})\s+(.*)')
+_DEV_CLASS_RE = re.compile(r'Device Class:\s*0x([0-9a-fA-F]+)')
+_CTL_DEVICE_RE = re.compile(r'^Device ([0-9A-Fa-f:]{17})')
+_CTL_CLASS_RE = re.compile(r'^Class:\s*0x([0-9a-fA-F]+)')
+
 
 def get_bluetooth_adapters() -> List[Dict[str, Any]]:
     """
@@ -86,46 +104,48 @@ def get_bluetooth_adapters() -> List[Dict[str, Any]]:
     adapters = []
     
     # Try hciconfig
-    try:
-        result = subprocess.run(
-            ['hciconfig', '-a'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            current_adapter = None
+    if _HCICONFIG:
+        try:
+            # Parse raw bytes; only matched fields are decoded
+            result = subprocess.run(
+                [_HCICONFIG, '-a'],
+                capture_output=True,
+                timeout=5
+            )
             
-            for line in result.stdout.split('\n'):
-                # New adapter
-                adapter_match = re.match(r'^(hci\d+):', line)
-                if adapter_match:
-                    if current_adapter:
-                        adapters.append(current_adapter)
-                    current_adapter = {
-                        'name': adapter_match.group(1),
-                        'address': None,
-                        'state': 'unknown'
-                    }
-                    if 'UP RUNNING' in line:
-                        current_adapter['state'] = 'UP'
-                    elif 'DOWN' in line:
-                        current_adapter['state'] = 'DOWN'
-                    continue
+            if result.returncode == 0:
+                current_adapter = None
+                
+                for line in result.stdout.split(b'\n'):
+                    # New adapter
+                    if line.startswith(b'hci'):
+                        adapter_match = _ADAPTER_RE.match(line)
+                        if adapter_match:
+                            if current_adapter:
+                                adapters.append(current_adapter)
+                            current_adapter = {
+                                'name': adapter_match.group(1).decode('ascii'),
+                                'address': None,
+                                'state': 'unknown'
+                            }
+                            if b'UP RUNNING' in line:
+                                current_adapter['state'] = 'UP'
+                            elif b'DOWN' in line:
+                                current_adapter['state'] = 'DOWN'
+                            continue
+                    
+                    if current_adapter and b'BD Address' in line:
+                        # BD Address
+                        addr_match = _BD_ADDR_RE.search(line)
+                        if addr_match:
+                            current_adapter['address'] = addr_match.group(1).decode('ascii').upper()
                 
                 if current_adapter:
-                    # BD Address
-                    addr_match = re.search(r'BD Address:\s*([0-9A-Fa-f:]{17})', line)
-                    if addr_match:
-                        current_adapter['address'] = addr_match.group(1).upper()
-            
-            if current_adapter:
-                adapters.append(current_adapter)
-    
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-    
+                    adapters.append(current_adapter)
+        
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
+        
     # Fallback: check /sys
     if not adapters:
         try:
@@ -153,9 +173,12 @@ def bring_adapter_up(adapter: str) -> bool:
     Returns:
         True if successful
     """
+    if not _HCICONFIG:
+        return False
+    
     try:
         result = subprocess.run(
-            ['hciconfig', adapter, 'up'],
+            [_HCICONFIG, adapter, 'up'],
             capture_output=True,
             timeout=5
         )
@@ -177,10 +200,13 @@ def scan_classic_bluetooth(adapter: str = 'hci0', duration: int = 10) -> List[Di
     """
     devices = []
     
+    if not _HCITOOL:
+        return devices
+    
     try:
         # Run inquiry scan
         result = subprocess.run(
-            ['hcitool', '-i', adapter, 'scan', '--length', str(duration)],
+            [_HCITOOL, '-i', adapter, 'scan', '--length', str(duration)],
             capture_output=True,
             text=True,
             timeout=duration + 10
@@ -189,31 +215,49 @@ def scan_classic_bluetooth(adapter: str = 'hci0', duration: int = 10) -> List[Di
         if result.returncode == 0:
             for line in result.stdout.split('\n'):
                 # Parse device entries
-                match = re.match(r'\s*([0-9A-Fa-f:]{17})\s+(.*)', line)
+                match = _CLASSIC_RE.match(line)
                 if match:
                     addr = match.group(1).upper()
                     name = match.group(2).strip() or '<unknown>'
                     
-                    device = {
+                    devices.append({
                         'address': addr,
                         'name': name,
                         'type': 'Classic',
                         'rssi': None,
                         'device_class': None,
                         'device_type': None
-                    }
-                    
-                    # Try to get device class
-                    device_class = get_device_class(adapter, addr)
-                    if device_class:
-                        device['device_class'] = device_class
-                        device['device_type'] = classify_device(device_class)
-                    
-                    devices.append(device)
+                    })
     
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
     
+    if not devices:
+        return devices
+    
+    # Look up all device classes with one bluetoothctl session first
+    known_classes = get_device_classes([device['address'] for device in devices])
+    for device in devices:
+        device_class = known_classes.get(device['address'])
+        if device_class:
+            device['device_class'] = device_class
+            device['device_type'] = classify_device(device_class)
+    
+    # Query the rest concurrently; each lookup is a separate hcitool call
+    pending = [device for device in devices if not device['device_class']]
+    if not pending:
+        return devices
+    
+    with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+        device_classes = executor.map(
+            lambda device: get_device_class(adapter, device['address']), pending
+        )
+        
+        for device, device_class in zip(pending, device_classes):
+            if device_class:
+                device['device_class'] = device_class
+                device['device_type'] = classify_device(device_class)
+    
     return devices
 
 
@@ -228,56 +272,76 @@ def scan_ble_devices(adapter: str = 'hci0', duration: int = 10) -> List[Dict[str
     Returns:
         List of discovered BLE devices
     """
-    devices = []
-    seen_addresses = set()
+    devices_by_addr: Dict[str, Dict[str, Any]] = {}
+    
+    if not _HCITOOL:
+        return []
     
     try:
         # Start LE scan
         process = subprocess.Popen(
-            ['hcitool', '-i', adapter, 'lescan', '--duplicates'],
+            [_HCITOOL, '-i', adapter, 'lescan', '--duplicates'],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.PIPE
         )
         
-        import time
-        start_time = time.time()
+        # Read output without blocking so the scan stops on time even when
+        # hcitool prints nothing
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+        deadline = time.monotonic() + duration
+        pending = b''
         
         try:
-            while time.time() - start_time < duration:
-                line = process.stdout.readline()
-                if not line:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
                 
-                # Parse BLE device entries
-                match = re.match(r'([0-9A-Fa-f:]{17})\s+(.*)', line.strip())
-                if match:
+                if not selector.select(timeout=remaining):
+                    continue
+                
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                
+                if not chunk:
+                    break
+                
+                pending += chunk
+                *lines, pending = pending.split(b'\n')
+                
+                for raw_line in lines:
+                    # Parse BLE device entries
+                    match = _BLE_RE.match(raw_line.decode('utf-8', 'replace').strip())
+                    if not match:
+                        continue
+                    
                     addr = match.group(1).upper()
                     name = match.group(2).strip()
+                    if not name or name == '(unknown)':
+                        name = '<unknown>'
                     
-                    # Skip if we've seen this device
-                    if addr in seen_addresses and name in ('(unknown)', ''):
+                    # Update a device we've already seen (filling in its name)
+                    existing = devices_by_addr.get(addr)
+                    if existing:
+                        if name != '<unknown>' and existing['name'] == '<unknown>':
+                            existing['name'] = name
                         continue
                     
-                    seen_addresses.add(addr)
-                    
-                    device = {
+                    devices_by_addr[addr] = {
                         'address': addr,
-                        'name': name if name and name != '(unknown)' else '<unknown>',
+                        'name': name,
                         'type': 'BLE',
                         'rssi': None,
                         'device_class': None,
                         'device_type': 'BLE Device'
                     }
-                    
-                    # Check if device already in list
-                    existing = next((d for d in devices if d['address'] == addr), None)
-                    if existing:
-                        if device['name'] != '<unknown>' and existing['name'] == '<unknown>':
-                            existing['name'] = device['name']
-                    else:
-                        devices.append(device)
         finally:
+            selector.close()
             process.terminate()
             try:
                 process.wait(timeout=2)
@@ -287,7 +351,7 @@ def scan_ble_devices(adapter: str = 'hci0', duration: int = 10) -> List[Dict[str
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
     
-    return devices
+    return list(devices_by_addr.values())
 
 
 def scan_bluetooth_termux() -> List[Dict[str, Any]]:
@@ -339,16 +403,19 @@ def get_device_class(adapter: str, address: str) -> Optional[int]:
     Returns:
         Device class code or None
     """
+    if not _HCITOOL:
+        return None
+    
     try:
         result = subprocess.run(
-            ['hcitool', '-i', adapter, 'info', address],
+            [_HCITOOL, '-i', adapter, 'info', address],
             capture_output=True,
             text=True,
             timeout=10
         )
         
         if result.returncode == 0:
-            match = re.search(r'Device Class:\s*0x([0-9a-fA-F]+)', result.stdout)
+            match = _DEV_CLASS_RE.search(result.stdout)
             if match:
                 return int(match.group(1), 16)
     
@@ -358,6 +425,62 @@ def get_device_class(adapter: str, address: str) -> Optional[int]:
     return None
 
 
+def get_device_classes(addresses: List[str]) -> Dict[str, int]:
+    """
+    Get device classes for several Bluetooth devices in one bluetoothctl run.
+    
+    Only devices already known to bluetoothd report a class; callers should
+    fall back to get_device_class() for the rest.
+    
+    Args:
+        addresses: Device MAC addresses (uppercase)
+    
+    Returns:
+        Mapping of address to device class code
+    """
+    classes: Dict[str, int] = {}
+    
+    if not _BLUETOOTHCTL or not addresses:
+        return classes
+    
+    commands = ''.join(f'info {addr}\n' for addr in addresses) + 'quit\n'
+    
+    try:
+        result = subprocess.run(
+            [_BLUETOOTHCTL],
+            input=commands,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return classes
+    
+    # Each 'info' reply starts with a "Device <addr>" line followed by its
+    # properties, so attribute Class lines to the most recent device.
+    # Asynchronous "[CHG] Device ..." / "[NEW] Device ..." events can be
+    # interleaved with the replies; the anchored patterns skip them (and
+    # any colored variants), so they never change the current device
+    wanted = set(addresses)
+    current = None
+    for line in result.stdout.split('\n'):
+        line = line.strip()
+        if line.startswith('['):
+            continue
+        
+        device_match = _CTL_DEVICE_RE.match(line)
+        if device_match:
+            current = device_match.group(1).upper()
+            continue
+        
+        class_match = _CTL_CLASS_RE.match(line)
+        if class_match and current in wanted:
+            classes[current] = int(class_match.group(1), 16)
+    
+    return classes
+
+
+@functools.lru_cache(maxsize=256)
 def classify_device(device_class: int) -> str:
     """
     Get human-readable device type from class code.
@@ -371,14 +494,11 @@ def classify_device(device_class: int) -> str:
     if not device_class:
         return "Unknown"
     
-    # Check specific minor classes first
-    for code, name in BT_DEVICE_CLASSES.items():
-        if device_class & 0x0FFC == code:
-            return name
-    
-    # Fall back to major class
-    major_class = device_class & 0x1F00
-    return BT_DEVICE_CLASSES.get(major_class, "Unknown")
+    # Check specific minor classes first, then fall back to major class
+    name = BT_DEVICE_CLASSES.get(device_class & 0x0FFC)
+    if name:
+        return name
+    return BT_DEVICE_CLASSES.get(device_class & 0x1F00, "Unknown")
 
 
 def run_bluetooth_scan(
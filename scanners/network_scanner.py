@@ -14,26 +14,192 @@ Features:
 """
 
 import argparse
+import copy
+import errno
+import functools
 import ipaddress
 import json
+import operator
 import os
 import re
+import select
+import selectors
+import shutil
+import signal
 import socket
+import struct
 import subprocess
 import sys
+import threading
+import time
+from array import array
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Add lib to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from lib.json_utils import ScanResultBuilder, print_json
+from lib.json_utils import ScanResultBuilder, loads_json, print_json
+from lib import netlink
 
 
 # Common service ports to check
 COMMON_PORTS = [21, 22, 23, 25, 53, 80, 110, 143, 443, 445, 993, 995, 3306, 3389, 5432, 8080, 8443]
 
+# Service names for common ports (others come from the services database)
+_SERVICE_NAMES = {
+    21: 'ftp',
+    22: 'ssh',
+    23: 'telnet',
+    25: 'smtp',
+    53: 'dns',
+    80: 'http',
+    110: 'pop3',
+    143: 'imap',
+    443: 'https',
+    445: 'smb',
+    993: 'imaps',
+    995: 'pop3s',
+    3306: 'mysql',
+    3389: 'rdp',
+    5432: 'postgresql',
+    8080: 'http-alt',
+    8443: 'https-alt'
+}
 
+# Carrier-grade NAT range used by mobile carriers; sweeping it probes the carrier
+CGNAT_NETWORK = ipaddress.ip_network('100.64.0.0/10')
+
+# ARP/neighbour states treated as proof that a host is up; PROBE and DELAY
+# mean the kernel is still waiting for the host to answer
+ARP_ALIVE_STATES = ('REACHABLE', 'STALE', 'PERMANENT')
+
+# /proc/net/arp flag bits (ATF_COM, ATF_PERM)
+ARP_FLAG_COMPLETE = 0x2
+ARP_FLAG_PERMANENT = 0x4
+
+# Lower bound on ping/PTR workers; these threads mostly wait on I/O
+MIN_HOST_WORKERS = 32
+
+# Maximum number of networks swept at once (each sweep has its own pool)
+MAX_CONCURRENT_NETWORKS = 4
+
+# Maximum number of sockets connecting at once during a port scan
+PORT_SCAN_BATCH_SIZE = 256
+
+# Held for each port scan batch, so networks swept concurrently still have
+# at most PORT_SCAN_BATCH_SIZE connects in flight between them
+_PORT_SCAN_LOCK = threading.Lock()
+
+# Absolute tool paths, resolved once. subprocess only takes the posix_spawn
+# (vfork) path for executables given with a directory and close_fds=False;
+# our own descriptors are non-inheritable, so nothing leaks into the child.
+_PING = shutil.which('ping')
+_SS = shutil.which('ss')
+
+# Latency field in ping replies
+_PING_LATENCY_RE = re.compile(rb'time=(\d+\.?\d*)\s*ms')
+
+# Big-endian IPv4 address as an integer
+_UINT32 = struct.Struct('>I')
+
+# Seconds that interface, gateway and stats lookups are reused for
+NETWORK_CACHE_TTL = 5.0
+
+# Cached lookups: function name -> (expiry, value)
+_network_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _ttl_cache(ttl: float = NETWORK_CACHE_TTL) -> Callable:
+    """
+    Cache a no-argument lookup for ttl seconds.
+    
+    The wrapped function accepts use_cache=False to force a fresh lookup,
+    which also drops every other cached entry (they may share a netlink
+    dump). Callers get a copy of the cached value, so they are free to
+    modify it.
+    
+    Args:
+        ttl: Seconds before the cached value expires
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(use_cache: bool = True):
+            now = time.monotonic()
+            if not use_cache:
+                _network_cache.clear()
+            
+            cached = _network_cache.get(func.__name__)
+            if cached is not None and cached[0] > now:
+                return copy.deepcopy(cached[1])
+            
+            value = func()
+            _network_cache[func.__name__] = (now + ttl, value)
+            return copy.deepcopy(value)
+        return wrapper
+    return decorator
+
+
+def clear_network_cache(*_args) -> None:
+    """Drop cached interface, gateway and stats lookups (also a SIGHUP handler)."""
+    _network_cache.clear()
+
+
+@_ttl_cache()
+def _netlink_dump() -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Dump links/addresses/routes/neighbours once for all lookups below."""
+    return netlink.dump_all()
+
+
+def _interfaces_from_netlink(dump: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Join netlink link and address tables into interface dictionaries.
+    
+    Args:
+        dump: Result of netlink.dump_all()
+    
+    Returns:
+        List of interface dictionaries, as built from 'ip -j addr show'
+    """
+    interfaces = []
+    by_index = {}
+    
+    for link in dump['links']:
+        iface_info = {
+            'name': link['name'],
+            'state': link['state'],
+            'point_to_point': link['point_to_point'],
+            'mac': link['mac'],
+            'ipv4': [],
+            'ipv6': []
+        }
+        by_index[link['index']] = iface_info
+        interfaces.append(iface_info)
+    
+    for addr in dump['addrs']:
+        iface_info = by_index.get(addr['index'])
+        if iface_info is None:
+            continue
+        
+        if addr['family'] == socket.AF_INET:
+            iface_info['ipv4'].append({
+                'address': addr['address'],
+                'prefix': addr['prefix'],
+                'broadcast': addr['broadcast']
+            })
+        else:
+            iface_info['ipv6'].append({
+                'address': addr['address'],
+                'prefix': addr['prefix']
+            })
+    
+    return interfaces
+
+
+@_ttl_cache()
 def get_network_interfaces() -> List[Dict[str, Any]]:
     """
     Get all network interfaces and their IP addresses.
@@ -43,22 +209,28 @@ def get_network_interfaces() -> List[Dict[str, Any]]:
     """
     interfaces = []
     
+    # Read straight from netlink when the platform allows it
+    dump = _netlink_dump()
+    if dump is not None:
+        return _interfaces_from_netlink(dump)
+    
     try:
         # Try using 'ip' command (Linux/Termux)
         result = subprocess.run(
             ['ip', '-j', 'addr', 'show'],
             capture_output=True,
-            text=True,
             timeout=10
         )
         
         if result.returncode == 0:
             try:
-                data = json.loads(result.stdout)
+                # Parse the raw bytes; orjson needs no decode step
+                data = loads_json(result.stdout)
                 for iface in data:
                     iface_info = {
                         'name': iface.get('ifname', 'unknown'),
                         'state': iface.get('operstate', 'unknown'),
+                        'point_to_point': 'POINTOPOINT' in iface.get('flags', []),
                         'mac': None,
                         'ipv4': [],
                         'ipv6': []
@@ -103,14 +275,14 @@ def get_network_interfaces() -> List[Dict[str, Any]]:
             current_iface = None
             
             for line in result.stdout.split('\n'):
-                # Interface line
-                iface_match = re.match(r'^\d+:\s+(\S+):', line)
-                if iface_match:
+                # Interface line ("2: wlan0: <...> ... state UP ...")
+                if line and line[0].isdigit():
                     if current_iface:
                         interfaces.append(current_iface)
                     current_iface = {
-                        'name': iface_match.group(1),
+                        'name': line.split(':', 2)[1].strip(),
                         'state': 'unknown',
+                        'point_to_point': 'POINTOPOINT' in line,
                         'mac': None,
                         'ipv4': [],
                         'ipv6': []
@@ -119,27 +291,28 @@ def get_network_interfaces() -> List[Dict[str, Any]]:
                         current_iface['state'] = 'UP'
                     elif 'state DOWN' in line:
                         current_iface['state'] = 'DOWN'
+                    continue
+                
+                if not current_iface:
+                    continue
+                
+                # Detail lines are keyed by their first token
+                tokens = line.split()
+                if len(tokens) < 2:
+                    continue
+                key = tokens[0]
                 
-                if current_iface:
+                if key.startswith('link/'):
                     # MAC address
-                    mac_match = re.search(r'link/\S+\s+([0-9a-fA-F:]{17})', line)
-                    if mac_match:
-                        current_iface['mac'] = mac_match.group(1)
-                    
-                    # IPv4 address
-                    ipv4_match = re.search(r'inet\s+(\d+\.\d+\.\d+\.\d+)/(\d+)', line)
-                    if ipv4_match:
-                        current_iface['ipv4'].append({
-                            'address': ipv4_match.group(1),
-                            'prefix': int(ipv4_match.group(2))
-                        })
-                    
-                    # IPv6 address
-                    ipv6_match = re.search(r'inet6\s+([0-9a-fA-F:]+)/(\d+)', line)
-                    if ipv6_match:
-                        current_iface['ipv6'].append({
-                            'address': ipv6_match.group(1),
-                            'prefix': int(ipv6_match.group(2))
+                    if len(tokens[1]) == 17:
+                        current_iface['mac'] = tokens[1]
+                elif key == 'inet' or key == 'inet6':
+                    # IPv4/IPv6 address as "address/prefix"
+                    address, _, prefix = tokens[1].partition('/')
+                    if prefix.isdigit():
+                        current_iface['ipv4' if key == 'inet' else 'ipv6'].append({
+                            'address': address,
+                            'prefix': int(prefix)
                         })
             
             if current_iface:
@@ -150,16 +323,86 @@ def get_network_interfaces() -> List[Dict[str, Any]]:
     return interfaces
 
 
+def _read_proc_arp() -> Optional[List[Dict[str, str]]]:
+    """
+    Read the kernel ARP cache from /proc/net/arp.
+    
+    The file is small, so it is read as bytes with a single os.read, which
+    also gives a consistent snapshot. Entries are given a neighbour state
+    from their flags so they can be checked against ARP_ALIVE_STATES.
+    
+    Returns:
+        List of ARP entries, or None if the file is unavailable (non-Linux,
+        or restricted as on newer Android releases)
+    """
+    try:
+        fd = os.open('/proc/net/arp', os.O_RDONLY)
+    except OSError:
+        return None
+    
+    try:
+        data = os.read(fd, 1 << 16)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    
+    arp_entries = []
+    for line in data.split(b'\n')[1:]:  # Skip header
+        parts = line.split()
+        if len(parts) >= 4 and parts[3] != b'00:00:00:00:00:00':
+            # The file has no reachability state, only whether the entry
+            # was ever resolved; complete entries are reported as STALE
+            try:
+                flags = int(parts[2], 16)
+            except ValueError:
+                flags = 0
+            if flags & ARP_FLAG_PERMANENT:
+                state = 'PERMANENT'
+            elif flags & ARP_FLAG_COMPLETE:
+                state = 'STALE'
+            else:
+                state = 'INCOMPLETE'
+            
+            arp_entries.append({
+                'ip': parts[0].decode('ascii'),
+                'mac': parts[3].decode('ascii'),
+                'state': state
+            })
+    
+    return arp_entries
+
+
 def get_arp_table() -> List[Dict[str, str]]:
     """
     Get ARP table entries.
     
+    Sources are tried in order (netlink, /proc/net/arp, 'ip neigh') and
+    the first one available is used.
+    
     Returns:
         List of ARP entries with IP and MAC addresses
     """
     arp_entries = []
     
-    # Try 'ip neigh' command
+    # Same entries 'ip neigh show' would list, read straight from netlink
+    dump = _netlink_dump()
+    if dump is not None:
+        for neigh in dump['neighs']:
+            if neigh['mac'] and neigh['state'] != 'NOARP':
+                arp_entries.append({
+                    'ip': neigh['ip'],
+                    'mac': neigh['mac'],
+                    'state': neigh['state'] or 'unknown'
+                })
+        return arp_entries
+    
+    # Read the proc file without forking
+    proc_entries = _read_proc_arp()
+    if proc_entries is not None:
+        return proc_entries
+    
+    # Fallback to 'ip neigh' command
     try:
         result = subprocess.run(
             ['ip', 'neigh', 'show'],
@@ -194,27 +437,10 @@ def get_arp_table() -> List[Dict[str, str]]:
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
     
-    # Fallback to /proc/net/arp
-    try:
-        with open('/proc/net/arp', 'r') as f:
-            lines = f.readlines()[1:]  # Skip header
-            for line in lines:
-                parts = line.split()
-                if len(parts) >= 4:
-                    ip_addr = parts[0]
-                    mac_addr = parts[3]
-                    if mac_addr != '00:00:00:00:00:00':
-                        arp_entries.append({
-                            'ip': ip_addr,
-                            'mac': mac_addr,
-                            'state': 'ARP'
-                        })
-    except (IOError, IndexError):
-        pass
-    
     return arp_entries
 
 
+@_ttl_cache()
 def get_default_gateway() -> Optional[Dict[str, str]]:
     """
     Get the default gateway.
@@ -222,6 +448,18 @@ def get_default_gateway() -> Optional[Dict[str, str]]:
     Returns:
         Gateway info dictionary or None
     """
+    dump = _netlink_dump()
+    if dump is not None:
+        names = {link['index']: link['name'] for link in dump['links']}
+        for route in dump['routes']:
+            if (route['family'] == socket.AF_INET and route['dst_len'] == 0
+                    and route['table'] == netlink.RT_TABLE_MAIN and route['gateway']):
+                return {
+                    'ip': route['gateway'],
+                    'interface': names.get(route['oif'])
+                }
+        return None
+    
     try:
         result = subprocess.run(
             ['ip', 'route', 'show', 'default'],
@@ -262,17 +500,20 @@ def ping_host(ip: str, timeout: int = 1, count: int = 1) -> Tuple[str, bool, Opt
     Returns:
         Tuple of (ip, is_alive, latency_ms)
     """
+    if not _PING:
+        return (ip, False, None)
+    
     try:
         result = subprocess.run(
-            ['ping', '-c', str(count), '-W', str(timeout), ip],
+            [_PING, '-c', str(count), '-W', str(timeout), ip],
             capture_output=True,
-            text=True,
+            close_fds=False,
             timeout=timeout + 2
         )
         
         if result.returncode == 0:
-            # Extract latency
-            latency_match = re.search(r'time=(\d+\.?\d*)\s*ms', result.stdout)
+            # Extract latency (output is left as bytes; no decode needed)
+            latency_match = _PING_LATENCY_RE.search(result.stdout)
             latency = float(latency_match.group(1)) if latency_match else None
             return (ip, True, latency)
     except (subprocess.TimeoutExpired, FileNotFoundError):
@@ -281,6 +522,117 @@ def ping_host(ip: str, timeout: int = 1, count: int = 1) -> Tuple[str, bool, Opt
     return (ip, False, None)
 
 
+def _icmp_checksum(packet: bytes) -> int:
+    """Compute the Internet checksum of an ICMP packet."""
+    if len(packet) % 2:
+        packet += b'\x00'
+    total = sum(struct.unpack(f'!{len(packet) // 2}H', packet))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _open_icmp_socket() -> Optional[Tuple[socket.socket, bool]]:
+    """
+    Open a socket for sending ICMP echo requests.
+    
+    Tries an unprivileged datagram ICMP socket first, then a raw socket
+    (root only).
+    
+    Returns:
+        Tuple of (socket, is_raw) or None if neither is permitted
+    """
+    for sock_type, is_raw in ((socket.SOCK_DGRAM, False), (socket.SOCK_RAW, True)):
+        try:
+            return socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP), is_raw
+        except (PermissionError, OSError):
+            continue
+    return None
+
+
+def _ping_sweep_batch(
+    ip_list: Iterable[str],
+    timeout: float = 1.0,
+    on_reply: Optional[Callable[[str, float], None]] = None
+) -> Optional[Dict[str, float]]:
+    """
+    Ping many hosts at once from a single ICMP socket.
+    
+    All echo requests are sent up front, then replies are collected with
+    select() until the timeout expires.
+    
+    Args:
+        ip_list: IP addresses to ping
+        timeout: Seconds to wait for replies after the last request
+        on_reply: Optional callback invoked with (ip, latency_ms) per reply
+    
+    Returns:
+        Mapping of responding IP to latency in ms, or None if ICMP sockets
+        are not available (callers should fall back to ping_host)
+    """
+    opened = _open_icmp_socket()
+    if opened is None:
+        return None
+    
+    sock, is_raw = opened
+    ident = os.getpid() & 0xFFFF
+    sent_at: Dict[int, Tuple[str, float]] = {}
+    alive: Dict[str, float] = {}
+    
+    try:
+        for seq, ip in enumerate(ip_list):
+            seq &= 0xFFFF
+            header = struct.pack('!BBHHH', 8, 0, 0, ident, seq)
+            payload = b'android-recon'
+            checksum = _icmp_checksum(header + payload)
+            packet = struct.pack('!BBHHH', 8, 0, checksum, ident, seq) + payload
+            try:
+                sock.sendto(packet, (ip, 0))
+            except OSError:
+                continue
+            sent_at[seq] = (ip, time.monotonic())
+        
+        deadline = time.monotonic() + timeout
+        while len(alive) < len(sent_at):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            readable, _, _ = select.select([sock], [], [], remaining)
+            if not readable:
+                break
+            
+            try:
+                data, (src, _) = sock.recvfrom(1024)
+            except OSError:
+                continue
+            received = time.monotonic()
+            
+            # Raw sockets (and some platforms) include the IP header
+            if data and data[0] >> 4 == 4:
+                data = data[(data[0] & 0x0F) * 4:]
+            if len(data) < 8:
+                continue
+            
+            icmp_type, _, _, reply_ident, seq = struct.unpack('!BBHHH', data[:8])
+            if icmp_type != 0:
+                continue
+            # The kernel assigns the identifier on datagram sockets
+            if is_raw and reply_ident != ident:
+                continue
+            
+            entry = sent_at.get(seq)
+            if entry is None or entry[0] != src or src in alive:
+                continue
+            alive[src] = round((received - entry[1]) * 1000, 3)
+            if on_reply is not None:
+                on_reply(src, alive[src])
+    finally:
+        sock.close()
+    
+    return alive
+
+
 def scan_port(ip: str, port: int, timeout: float = 1.0) -> Tuple[int, bool]:
     """
     Check if a specific port is open.
@@ -320,14 +672,78 @@ def get_hostname(ip: str) -> Optional[str]:
         return None
 
 
-def discover_hosts(network: str, timeout: int = 1, max_workers: int = 50) -> List[Dict[str, Any]]:
+def _iter_host_addresses(net: ipaddress.IPv4Network) -> Iterator[str]:
+    """
+    Yield the usable host addresses of a network as dotted strings.
+    
+    Equivalent to str(ip) for ip in net.hosts(), but counts over plain
+    integers instead of allocating an IPv4Address per host.
+    
+    Args:
+        net: IPv4 network
+    
+    Yields:
+        Host IP addresses
+    """
+    base = int(net.network_address)
+    size = net.num_addresses
+    
+    # /31 and /32 have no network/broadcast addresses to skip
+    if size > 2:
+        addresses = range(base + 1, base + size - 1)
+    else:
+        addresses = range(base, base + size)
+    
+    pack = _UINT32.pack
+    inet_ntoa = socket.inet_ntoa
+    for address in addresses:
+        yield inet_ntoa(pack(address))
+
+
+def _default_workers(task_count: int) -> int:
+    """
+    Pick a worker count for blocking per-host operations (ping, PTR).
+    
+    Scales with the CPU count, with a floor of MIN_HOST_WORKERS, and never
+    exceeds the number of tasks.
+    
+    Args:
+        task_count: Number of hosts to process
+    
+    Returns:
+        Worker count (at least 1)
+    """
+    return max(1, min(task_count, max(MIN_HOST_WORKERS, (os.cpu_count() or 4) * 8)))
+
+
+def discover_hosts(
+    network: str,
+    timeout: int = 1,
+    max_workers: Optional[int] = None,
+    resolve_hostnames: bool = True,
+    known_hosts: Optional[Dict[str, str]] = None,
+    ports: Optional[List[int]] = None,
+    on_warning: Optional[Callable[[str], None]] = None
+) -> List[Dict[str, Any]]:
     """
     Discover live hosts on a network using ping sweep.
     
+    Each live host's PTR lookup starts as soon as it answers, while the
+    sweep is still running. Live hosts are then port-scanned together in
+    one batched sweep.
+    
     Args:
         network: Network in CIDR notation (e.g., '192.168.1.0/24')
         timeout: Ping timeout in seconds
-        max_workers: Maximum concurrent ping operations
+        max_workers: Maximum concurrent ping/PTR lookup operations
+            (default: sized from the network and CPU count)
+        resolve_hostnames: Look up PTR hostnames for live hosts
+        known_hosts: IP -> MAC of hosts already known to be alive (e.g. from
+            the ARP table); these are reported without being pinged
+        ports: Ports to scan on each live host (default: no port scan)
+        on_warning: Called with a message when the port scan fails; the
+            hosts are still returned, without open_ports (default: print
+            to stderr)
     
     Returns:
         List of discovered hosts
@@ -346,25 +762,93 @@ def discover_hosts(network: str, timeout: int = 1, max_workers: int = 50) -> Lis
               file=sys.stderr)
         net = ipaddress.ip_network(f"{net.network_address}/24", strict=False)
     
-    ip_list = [str(ip) for ip in net.hosts()]
+    # Hosts in the ARP cache are already known to be up; only probe the rest
+    known = {}
+    if known_hosts:
+        known = {ip: mac for ip, mac in known_hosts.items()
+                 if ipaddress.ip_address(ip) in net}
     
-    print(f"Scanning {len(ip_list)} hosts in {network}...")
+    def targets() -> Iterator[str]:
+        # Addresses are streamed rather than built into a list
+        for ip in _iter_host_addresses(net):
+            if ip not in known:
+                yield ip
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_ip = {executor.submit(ping_host, ip, timeout): ip for ip in ip_list}
+    host_count = net.num_addresses - 2 if net.num_addresses > 2 else net.num_addresses
+    if max_workers is None:
+        max_workers = _default_workers(host_count)
+    
+    print(f"Scanning {host_count - len(known)} hosts in {network} "
+          f"({len(known)} known from ARP, {max_workers} workers)...")
+    
+    # PTR lookups start as soon as a host is seen alive, overlapping with
+    # the rest of the sweep
+    ptr_futures: Dict[str, Any] = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as follow_up_executor:
+        def on_alive(ip: str, _latency: Optional[float] = None) -> None:
+            if resolve_hostnames and ip not in ptr_futures:
+                ptr_futures[ip] = follow_up_executor.submit(get_hostname, ip)
         
-        for future in as_completed(future_to_ip):
-            ip, is_alive, latency = future.result()
-            if is_alive:
-                hostname = get_hostname(ip)
-                hosts.append({
-                    'ip': ip,
-                    'alive': True,
-                    'latency_ms': latency,
-                    'hostname': hostname
-                })
+        for ip in known:
+            on_alive(ip)
+        
+        # Sweep from one ICMP socket; fall back to one ping process per host
+        alive = _ping_sweep_batch(targets(), timeout, on_reply=on_alive)
+        
+        if alive is None:
+            print(f"ICMP sockets unavailable; pinging with {max_workers} workers")
+            alive = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_ip = {}
+                for ip in targets():
+                    future_to_ip[executor.submit(ping_host, ip, timeout)] = ip
+                
+                for future in as_completed(future_to_ip):
+                    ip, is_alive, latency = future.result()
+                    if is_alive:
+                        alive[ip] = latency
+                        on_alive(ip)
+        
+        for ip in known:
+            alive.setdefault(ip, None)
+        
+        # Results stay column-wise until the end: addresses as integers, with
+        # latencies and follow-up futures in parallel lists
+        ips = list(alive)
+        ip_ints = array('L', (_UINT32.unpack(socket.inet_aton(ip))[0] for ip in ips))
+        
+        # One connect sweep over every live host, so open sockets stay
+        # bounded by PORT_SCAN_BATCH_SIZE; PTR lookups finish meanwhile
+        open_ports = None
+        if ports is not None and ips:
+            try:
+                open_ports = scan_hosts_ports(ips, ports)
+            except OSError as e:
+                # e.g. out of file descriptors; keep the hosts already found
+                message = f"Port scan of {network} failed: {e}"
+                if on_warning is not None:
+                    on_warning(message)
+                else:
+                    print(f"Warning: {message}", file=sys.stderr)
+        
+        # Sort on the integer column, then build the host dicts once, in order
+        for i in sorted(range(len(ips)), key=ip_ints.__getitem__):
+            ip = ips[i]
+            ptr_future = ptr_futures.get(ip)
+            host = {
+                'ip': ip,
+                'alive': True,
+                'latency_ms': alive[ip],
+                'hostname': ptr_future.result() if ptr_future else None
+            }
+            if ip in known:
+                host['mac'] = known[ip]
+            if open_ports is not None:
+                host['open_ports'] = open_ports[ip]
+            hosts.append(host)
     
-    return sorted(hosts, key=lambda x: ipaddress.ip_address(x['ip']))
+    return hosts
 
 
 def scan_host_ports(ip: str, ports: List[int] = None, timeout: float = 1.0) -> List[Dict[str, Any]]:
@@ -379,51 +863,168 @@ def scan_host_ports(ip: str, ports: List[int] = None, timeout: float = 1.0) -> L
     Returns:
         List of open ports
     """
+    return scan_hosts_ports([ip], ports, timeout)[ip]
+
+
+def scan_hosts_ports(
+    ips: List[str],
+    ports: List[int] = None,
+    timeout: float = 1.0
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Scan the same ports on several hosts in one pass.
+    
+    Every (host, port) pair goes through a single connect sweep, so hosts
+    share batches and timeouts instead of each waiting out its own.
+    
+    Args:
+        ips: Target IP addresses
+        ports: List of ports to scan (default: common ports)
+        timeout: Connection timeout
+    
+    Returns:
+        Mapping of IP to its open ports
+    """
     if ports is None:
         ports = COMMON_PORTS
     
+    results = {ip: [] for ip in ips}
+    targets = [(ip, port) for ip in ips for port in ports]
+    
+    for ip, port in _scan_ports_select(targets, timeout):
+        results[ip].append({
+            'port': port,
+            'service': get_service_name(port),
+            'protocol': 'tcp'
+        })
+    
+    for open_ports in results.values():
+        open_ports.sort(key=operator.itemgetter('port'))
+    
+    return results
+
+
+def _scan_ports_select(targets: List[Tuple[str, int]], timeout: float = 1.0) -> List[Tuple[str, int]]:
+    """
+    Check many TCP endpoints at once with non-blocking connects.
+    
+    Connects are issued on non-blocking sockets and completed through a
+    single selector, PORT_SCAN_BATCH_SIZE sockets at a time. Batches from
+    concurrent callers take turns, so the bound holds process-wide.
+    
+    If the process runs out of file descriptors, the batch is cut short
+    and the remaining targets are retried in the next one; the error is
+    only raised when no connects are left in flight to free any.
+    
+    Args:
+        targets: (ip, port) pairs to check
+        timeout: Seconds to wait for each batch of connects
+    
+    Returns:
+        List of open (ip, port) pairs
+    
+    Raises:
+        OSError: If a socket can't be created (e.g. EMFILE with nothing
+            left to wait for)
+    """
     open_ports = []
     
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        future_to_port = {executor.submit(scan_port, ip, port, timeout): port for port in ports}
-        
-        for future in as_completed(future_to_port):
-            port, is_open = future.result()
-            if is_open:
-                service = get_service_name(port)
-                open_ports.append({
-                    'port': port,
-                    'service': service,
-                    'protocol': 'tcp'
-                })
+    next_target = 0
     
-    return sorted(open_ports, key=lambda x: x['port'])
+    with selectors.DefaultSelector() as selector:
+        while next_target < len(targets):
+            with _PORT_SCAN_LOCK:
+                while (next_target < len(targets)
+                       and len(selector.get_map()) < PORT_SCAN_BATCH_SIZE):
+                    target = targets[next_target]
+                    try:
+                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    except OSError as e:
+                        # Out of descriptors: finish the connects already in
+                        # flight to free some, then retry this target
+                        if e.errno in (errno.EMFILE, errno.ENFILE) and selector.get_map():
+                            break
+                        raise
+                    next_target += 1
+                    sock.setblocking(False)
+                    
+                    result = sock.connect_ex(target)
+                    if result == 0:
+                        open_ports.append(target)
+                        sock.close()
+                    elif result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, target)
+                    else:
+                        sock.close()
+                
+                deadline = time.monotonic() + timeout
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    
+                    for key, _ in selector.select(remaining):
+                        sock = key.fileobj
+                        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                            open_ports.append(key.data)
+                        selector.unregister(sock)
+                        sock.close()
+                
+                # Anything still pending timed out (filtered)
+                for key in list(selector.get_map().values()):
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+    
+    return open_ports
+
+
+@functools.lru_cache(maxsize=None)
+def _getservbyport(port: int) -> str:
+    """Look up a TCP service name in the system services database."""
+    try:
+        return socket.getservbyport(port, 'tcp')
+    except (OSError, OverflowError):
+        return 'unknown'
 
 
 def get_service_name(port: int) -> str:
     """Get common service name for a port."""
-    services = {
-        21: 'ftp',
-        22: 'ssh',
-        23: 'telnet',
-        25: 'smtp',
-        53: 'dns',
-        80: 'http',
-        110: 'pop3',
-        143: 'imap',
-        443: 'https',
-        445: 'smb',
-        993: 'imaps',
-        995: 'pop3s',
-        3306: 'mysql',
-        3389: 'rdp',
-        5432: 'postgresql',
-        8080: 'http-alt',
-        8443: 'https-alt'
-    }
-    return services.get(port, 'unknown')
+    return _SERVICE_NAMES.get(port) or _getservbyport(port)
+
+
+def _read_sockstat() -> Dict[str, Dict[str, int]]:
+    """
+    Parse /proc/net/sockstat and /proc/net/sockstat6.
+    
+    Lines such as 'TCP: inuse 7 orphan 0 tw 12 alloc 9 mem 2' become
+    {'TCP': {'inuse': 7, 'orphan': 0, ...}}.
+    
+    Returns:
+        Socket counters by protocol (empty if the files are unavailable)
+    """
+    sockstat = {}
+    
+    for path in ('/proc/net/sockstat', '/proc/net/sockstat6'):
+        try:
+            with open(path, 'r') as f:
+                data = f.read()
+        except IOError:
+            continue
+        
+        for line in data.splitlines():
+            protocol, _, fields = line.partition(':')
+            values = fields.split()
+            try:
+                sockstat[protocol] = {
+                    values[i]: int(values[i + 1]) for i in range(0, len(values) - 1, 2)
+                }
+            except ValueError:
+                continue
+    
+    return sockstat
 
 
+@_ttl_cache()
 def get_network_stats() -> Dict[str, Any]:
     """
     Get network statistics.
@@ -433,19 +1034,24 @@ def get_network_stats() -> Dict[str, Any]:
     """
     stats = {}
     
-    # Try to get connection stats
-    try:
-        result = subprocess.run(
-            ['ss', '-s'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            stats['socket_stats'] = result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    # Socket counters straight from the kernel; if /proc/net is restricted,
+    # keep the 'ss -s' text summary under its own key instead
+    socket_stats = _read_sockstat()
+    if socket_stats:
+        stats['socket_stats'] = socket_stats
+    elif _SS:
+        try:
+            result = subprocess.run(
+                [_SS, '-s'],
+                capture_output=True,
+                close_fds=False,
+                timeout=5
+            )
+            
+            if result.returncode == 0:
+                stats['socket_summary'] = result.stdout.decode('utf-8', 'replace').strip()
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
     
     # Get DNS servers
     try:
@@ -461,10 +1067,42 @@ def get_network_stats() -> Dict[str, Any]:
     return stats
 
 
+def _sweep_skip_reason(iface: Dict[str, Any], network: str, include_cgnat: bool = False) -> Optional[str]:
+    """
+    Decide whether a network is not worth ping-sweeping.
+    
+    Args:
+        iface: Interface dictionary the network belongs to
+        network: Network in CIDR notation
+        include_cgnat: Sweep carrier-grade NAT (100.64.0.0/10) networks
+    
+    Returns:
+        Reason to skip the network, or None to sweep it
+    """
+    try:
+        net = ipaddress.ip_network(network, strict=False)
+    except ValueError:
+        return 'invalid network'
+    
+    # Cellular links (rmnet*) are typically point-to-point /32s with no neighbours
+    if iface.get('point_to_point') or net.num_addresses <= 2:
+        return 'point-to-point or single-host link'
+    if net.is_link_local:
+        return 'link-local network'
+    if not include_cgnat and net.subnet_of(CGNAT_NETWORK):
+        return 'carrier-grade NAT (use --include-cgnat to sweep)'
+    
+    return None
+
+
 def run_network_scan(
     output_dir: str,
     port_scan: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    cache: bool = True,
+    resolve_hostnames: bool = True,
+    max_workers: Optional[int] = None,
+    include_cgnat: bool = False
 ) -> Dict[str, Any]:
     """
     Run a complete network scan.
@@ -473,12 +1111,21 @@ def run_network_scan(
         output_dir: Directory to save results
         port_scan: Whether to scan ports on discovered hosts
         verbose: Print verbose output
+        cache: Reuse interface/gateway lookups from the last NETWORK_CACHE_TTL seconds
+        resolve_hostnames: Look up PTR hostnames for discovered hosts
+        max_workers: Ping/PTR workers per network (default: automatic)
+        include_cgnat: Also sweep carrier-grade NAT (100.64.0.0/10) networks
     
     Returns:
         Scan results dictionary
     """
     builder = ScanResultBuilder("network")
     
+    # Drop stale lookups once up front; the getters below then share a
+    # single fresh netlink dump
+    if not cache:
+        clear_network_cache()
+    
     if verbose:
         print("=" * 60)
         print("Network Scanner")
@@ -513,8 +1160,14 @@ def run_network_scan(
     if verbose:
         print(f"    Found {len(arp_table)} ARP entries")
     
-    # Host discovery on each active interface
-    discovered_hosts = []
+    # Neighbours the kernel recently confirmed don't need to be pinged again
+    known_hosts = {
+        entry['ip']: entry['mac'] for entry in arp_table
+        if entry['state'] in ARP_ALIVE_STATES
+    }
+    
+    # Collect the IPv4 networks of active interfaces
+    networks = []
     
     for iface in interfaces:
         if iface['state'] != 'UP':
@@ -528,24 +1181,40 @@ def run_network_scan(
                 continue
             
             network = f"{ip_addr}/{prefix}"
+            reason = _sweep_skip_reason(iface, network, include_cgnat)
+            if reason:
+                if verbose:
+                    print(f"\n[*] Skipping {network} on {iface['name']}: {reason}")
+                continue
             
-            if verbose:
+            networks.append(network)
+    
+    # Sweep the networks concurrently; each sweep is independent
+    discovered_hosts = []
+    
+    if networks:
+        if verbose:
+            for network in networks:
                 print(f"\n[*] Scanning network: {network}")
-            
-            hosts = discover_hosts(network)
-            
-            # Optionally scan ports on discovered hosts
             if port_scan:
-                for host in hosts:
-                    if verbose:
-                        print(f"    Scanning ports on {host['ip']}...")
-                    host['open_ports'] = scan_host_ports(host['ip'])
-            
-            discovered_hosts.extend(hosts)
+                print("    Live hosts are port-scanned after the sweep")
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_NETWORKS, len(networks))) as executor:
+            for hosts in executor.map(
+                lambda network: discover_hosts(
+                    network,
+                    max_workers=max_workers,
+                    resolve_hostnames=resolve_hostnames,
+                    known_hosts=known_hosts,
+                    ports=COMMON_PORTS if port_scan else None,
+                    on_warning=builder.add_warning
+                ),
+                networks
+            ):
+                discovered_hosts.extend(hosts)
     
     # Add discovered hosts to results
-    for host in discovered_hosts:
-        builder.add_item(host)
+    builder.add_items(discovered_hosts)
     
     if verbose:
         print(f"\n[+] Discovered {len(discovered_hosts)} live hosts")
@@ -576,6 +1245,21 @@ def main():
         action="store_true",
         help="Enable port scanning on discovered hosts"
     )
+    parser.add_argument(
+        "--no-ptr",
+        action="store_true",
+        help="Skip reverse DNS (PTR) hostname lookups"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Concurrent ping/PTR workers per network (default: based on CPU count)"
+    )
+    parser.add_argument(
+        "--include-cgnat",
+        action="store_true",
+        help="Also sweep carrier-grade NAT (100.64.0.0/10) networks"
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -597,10 +1281,17 @@ def main():
     
     verbose = args.verbose and not args.quiet
     
+    # Let long-running callers force fresh interface lookups
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, clear_network_cache)
+    
     result = run_network_scan(
         output_dir=args.output,
         port_scan=args.ports,
-        verbose=verbose
+        verbose=verbose,
+        resolve_hostnames=not args.no_ptr,
+        max_workers=args.workers,
+        include_cgnat=args.include_cgnat
     )
     
     if args.json:
@@ -14,55 +14,188 @@ Features:
 """
 
 import argparse
+import errno
+import functools
+import heapq
 import json
 import os
 import re
+import select
+import shutil
+import signal
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # Add lib to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from lib.json_utils import ScanResultBuilder, print_json
+from lib.json_utils import ScanResultBuilder, loads_json, print_json
+from lib import netlink
 
 
-def get_wireless_interfaces() -> List[str]:
+# Absolute tool paths, resolved once instead of searching PATH on every
+# call (None when the tool is not installed)
+_IW = shutil.which('iw')
+_IWLIST = shutil.which('iwlist')
+_TERMUX_WIFI_SCANINFO = shutil.which('termux-wifi-scaninfo')
+
+# Exit status of 'iw' when the device is busy (it exits with -EBUSY)
+IW_STATUS_EBUSY = 256 - errno.EBUSY
+
+# Maximum seconds to wait for a scan already in progress to finish
+SCAN_WAIT_TIMEOUT = 5.0
+
+# Patterns for 'iw' output; lines are prefix-checked before matching
+_BSS_RE = re.compile(r'BSS\s+([0-9a-fA-F:]{17})')
+_SSID_RE = re.compile(r'SSID:\s*(.*)')
+_FREQ_RE = re.compile(r'freq:\s*(\d+)')
+_SIGNAL_RE = re.compile(r'signal:\s*(-?\d+\.?\d*)\s*dBm')
+
+# Patterns for 'iwlist' output
+_CELL_RE = re.compile(r'Cell\s+\d+\s+-\s+Address:\s*([0-9a-fA-F:]{17})')
+_ESSID_RE = re.compile(r'ESSID:"(.*)"')
+_CHAN_RE = re.compile(r'Channel:(\d+)')
+_FREQ_GHZ_RE = re.compile(r'Frequency:(\d+\.?\d*)\s*GHz')
+_SIGNAL_LEVEL_RE = re.compile(r'Signal level[=:]?\s*(-?\d+)\s*dBm')
+_QUALITY_RE = re.compile(r'Quality[=:]?\s*(\d+)/(\d+)')
+_ENC_KEY_RE = re.compile(r'Encryption key:(on|off)')
+
+# Encryption tokens in Android capability strings, in report order
+_CAPABILITY_ORDER = ('WPA3', 'WPA2', 'WPA', 'WEP')
+_CAPABILITY_RE = re.compile('|'.join(_CAPABILITY_ORDER))
+
+
+def _normalize_bssid(bssid: str) -> str:
+    """Upper-case and intern a BSSID so repeated lookups compare by identity."""
+    return sys.intern(bssid.upper())
+
+
+class WifiNetwork:
+    """
+    A discovered WiFi network, stored as a compact slotted record.
+    
+    The associated flag marks the network the interface is connected to;
+    it is used to derive the current connection and is not saved.
+    """
+    
+    __slots__ = (
+        'bssid', 'ssid', 'frequency', 'channel', 'signal_dbm',
+        'signal_quality', 'security', 'encryption', 'associated'
+    )
+    
+    def __init__(
+        self,
+        bssid: str,
+        ssid: Optional[str] = None,
+        frequency: Optional[int] = None,
+        channel: Optional[int] = None,
+        signal_dbm: Optional[float] = None,
+        signal_quality: Optional[int] = None,
+        security: str = 'Open',
+        encryption: Optional[List[str]] = None,
+        associated: bool = False
+    ):
+        """Initialize a network record."""
+        self.bssid = bssid
+        self.ssid = ssid
+        self.frequency = frequency
+        self.channel = channel
+        self.signal_dbm = signal_dbm
+        self.signal_quality = signal_quality
+        self.security = security
+        self.encryption = encryption if encryption is not None else []
+        self.associated = associated
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary format used in scan results."""
+        return {
+            'bssid': self.bssid,
+            'ssid': self.ssid,
+            'frequency': self.frequency,
+            'channel': self.channel,
+            'signal_dbm': self.signal_dbm,
+            'signal_quality': self.signal_quality,
+            'security': self.security,
+            'encryption': self.encryption
+        }
+
+
+# Seconds a detected interface list is reused before probing again
+INTERFACE_CACHE_TTL = 30.0
+
+# Cached interface list: (expiry, interface names)
+_interface_cache: Optional[Tuple[float, List[str]]] = None
+
+
+def clear_interface_cache(*_args) -> None:
+    """Drop the cached wireless interface list (also a SIGHUP handler)."""
+    global _interface_cache
+    _interface_cache = None
+
+
+def get_wireless_interfaces(use_cache: bool = True) -> List[str]:
     """
     Get list of wireless interfaces.
     
+    The list is cached for INTERFACE_CACHE_TTL seconds, so repeated scans
+    do not run 'iw dev' and walk /sys/class/net every time.
+    
+    Args:
+        use_cache: Reuse a recently detected list (False forces a fresh probe)
+    
     Returns:
         List of wireless interface names
     """
+    global _interface_cache
+    now = time.monotonic()
+    
+    if use_cache and _interface_cache is not None and _interface_cache[0] > now:
+        return list(_interface_cache[1])
+    
+    interfaces = _detect_wireless_interfaces()
+    _interface_cache = (now + INTERFACE_CACHE_TTL, interfaces)
+    return list(interfaces)
+
+
+def _detect_wireless_interfaces() -> List[str]:
+    """Probe 'iw dev' and /sys/class/net for wireless interface names."""
     interfaces = []
     
     # Try iw command
-    try:
-        result = subprocess.run(
-            ['iw', 'dev'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'Interface' in line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        interfaces.append(parts[1])
+    if _IW:
+        try:
+            result = subprocess.run(
+                [_IW, 'dev'],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
             
-            if interfaces:
-                return interfaces
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+            if result.returncode == 0:
+                for line in result.stdout.split('\n'):
+                    if 'Interface' in line:
+                        parts = line.split()
+                        if len(parts) >= 2:
+                            interfaces.append(parts[1])
+                
+                if interfaces:
+                    return interfaces
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
     
     # Fallback: Check /sys/class/net/*/wireless
     try:
-        for iface in os.listdir('/sys/class/net'):
-            wireless_path = f'/sys/class/net/{iface}/wireless'
-            if os.path.exists(wireless_path):
-                interfaces.append(iface)
+        with os.scandir('/sys/class/net') as it:
+            for entry in it:
+                # One stat per interface doubles as the existence check
+                try:
+                    os.stat(os.path.join(entry.path, 'wireless'))
+                except OSError:
+                    continue
+                interfaces.append(entry.name)
     except (IOError, OSError):
         pass
     
@@ -86,12 +219,15 @@ def get_current_connection(interface: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary with connection info or None
     """
+    if not _IW:
+        return None
+    
     connection = {}
     
     # Try iw command
     try:
         result = subprocess.run(
-            ['iw', interface, 'link'],
+            [_IW, interface, 'link'],
             capture_output=True,
             text=True,
             timeout=5
@@ -101,7 +237,7 @@ def get_current_connection(interface: str) -> Optional[Dict[str, Any]]:
             # Parse BSSID
             bssid_match = re.search(r'Connected to ([0-9a-fA-F:]{17})', result.stdout)
             if bssid_match:
-                connection['bssid'] = bssid_match.group(1).upper()
+                connection['bssid'] = _normalize_bssid(bssid_match.group(1))
             
             # Parse SSID
             ssid_match = re.search(r'SSID:\s*(.+)', result.stdout)
@@ -125,111 +261,308 @@ def get_current_connection(interface: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def scan_wifi_networks_iw(interface: str) -> List[Dict[str, Any]]:
+def _normalize_filters(
+    ssid_filter: Optional[Iterable[str]],
+    bssid_filter: Optional[Iterable[str]]
+) -> Tuple[Optional[set], Optional[set]]:
+    """Turn SSID/BSSID filters into sets, normalizing BSSIDs as the parsers do."""
+    if ssid_filter is not None:
+        ssid_filter = set(ssid_filter)
+    if bssid_filter is not None:
+        bssid_filter = {_normalize_bssid(bssid) for bssid in bssid_filter}
+    return ssid_filter, bssid_filter
+
+
+def _stream_command(
+    cmd: List[str],
+    parse: Callable[[Iterable[str]], List[WifiNetwork]],
+    timeout: float = 30
+) -> Tuple[int, List[WifiNetwork]]:
     """
-    Scan for WiFi networks using iw command.
+    Run a command and parse its stdout line by line as it is produced.
+    
+    Args:
+        cmd: Command and arguments
+        parse: Parser taking an iterable of lines
+        timeout: Seconds before the command is killed
+    
+    Returns:
+        Tuple of (exit status, parser result); the result should be
+        ignored when the exit status is non-zero
+    
+    Raises:
+        FileNotFoundError: If the command is not installed
+        subprocess.TimeoutExpired: If the command was killed on timeout
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    
+    # Reading stdout blocks until the command exits, so enforce the
+    # timeout by killing it from a timer thread
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    try:
+        with proc.stdout:
+            result = parse(proc.stdout)
+        proc.wait()
+        timed_out = watchdog.finished.is_set()
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    
+    if timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    return proc.returncode, result
+
+
+def _wait_for_scan(interface: str, timeout: float = SCAN_WAIT_TIMEOUT) -> bool:
+    """
+    Wait for a scan that is already running on an interface to finish.
+    
+    Follows 'iw event' for the kernel's scan finished/aborted notification
+    instead of sleeping for a fixed time.
     
     Args:
         interface: Wireless interface name
+        timeout: Maximum seconds to wait
     
     Returns:
-        List of discovered networks
+        True if the scan ended before the timeout
     """
-    networks = []
+    if not _IW:
+        return False
     
     try:
-        # Trigger a scan
-        subprocess.run(
-            ['iw', interface, 'scan', 'trigger'],
-            capture_output=True,
-            timeout=5
+        proc = subprocess.Popen(
+            [_IW, 'event'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
+    except FileNotFoundError:
+        return False
+    
+    prefix = interface.encode() + b' '
+    deadline = time.monotonic() + timeout
+    pending = b''
+    
+    try:
+        fd = proc.stdout.fileno()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return False
+            
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return False
+            
+            *lines, pending = (pending + chunk).split(b'\n')
+            for line in lines:
+                # e.g. "wlan0 (phy #0): scan finished: 2412 2417 ..."
+                if line.startswith(prefix) and (
+                    b'scan finished' in line or b'scan aborted' in line
+                ):
+                    return True
+    finally:
+        proc.kill()
+        proc.wait()
+        proc.stdout.close()
+
+
+def _parse_iw_scan(
+    lines: Iterable[str],
+    ssid_filter: Optional[Iterable[str]] = None,
+    bssid_filter: Optional[Iterable[str]] = None
+) -> List[WifiNetwork]:
+    """
+    Parse 'iw scan' output into network records.
+    
+    Networks rejected by a filter are dropped as soon as their BSSID or SSID
+    line is read, and the rest of their block is skipped.
+    
+    Args:
+        lines: Lines printed by 'iw <interface> scan'
+        ssid_filter: Only keep networks with one of these SSIDs
+        bssid_filter: Only keep networks with one of these BSSIDs
+    
+    Returns:
+        List of networks, in the order they were reported
+    """
+    ssid_filter, bssid_filter = _normalize_filters(ssid_filter, bssid_filter)
+    networks = []
+    current_network = None
+    
+    # Encryption types of the current network; a dict keeps them unique
+    # and in the order they were seen
+    encryption: Dict[str, None] = {}
+    
+    for line in lines:
+        line = line.strip()
         
-        # Wait a moment for scan to complete
-        time.sleep(2)
+        # New BSS (network)
+        bss_match = _BSS_RE.match(line) if line.startswith('BSS') else None
+        if bss_match:
+            if current_network and (ssid_filter is None or current_network.ssid in ssid_filter):
+                current_network.encryption = list(encryption)
+                networks.append(current_network)
+            encryption = {}
+            bssid = _normalize_bssid(bss_match.group(1))
+            if bssid_filter is not None and bssid not in bssid_filter:
+                current_network = None
+                continue
+            current_network = WifiNetwork(bssid, associated=line.endswith('-- associated'))
+            continue
         
-        # Get scan results
-        result = subprocess.run(
-            ['iw', interface, 'scan', 'dump'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        if current_network is None:
+            continue
         
-        if result.returncode != 0:
-            # Try without dump
-            result = subprocess.run(
-                ['iw', interface, 'scan'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        # SSID
+        if line.startswith('SSID:'):
+            ssid = _SSID_RE.match(line).group(1).strip()
+            current_network.ssid = ssid if ssid else '<hidden>'
+            if ssid_filter is not None and current_network.ssid not in ssid_filter:
+                current_network = None
+            continue
         
-        if result.returncode == 0:
-            current_network = None
-            
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                
-                # New BSS (network)
-                bss_match = re.match(r'BSS\s+([0-9a-fA-F:]{17})', line)
-                if bss_match:
-                    if current_network:
-                        networks.append(current_network)
-                    current_network = {
-                        'bssid': bss_match.group(1).upper(),
-                        'ssid': None,
-                        'frequency': None,
-                        'channel': None,
-                        'signal_dbm': None,
-                        'signal_quality': None,
-                        'security': 'Open',
-                        'encryption': []
-                    }
-                    continue
-                
-                if current_network is None:
-                    continue
-                
-                # SSID
-                ssid_match = re.match(r'SSID:\s*(.*)', line)
-                if ssid_match:
-                    ssid = ssid_match.group(1).strip()
-                    current_network['ssid'] = ssid if ssid else '<hidden>'
-                    continue
-                
-                # Frequency and channel
-                freq_match = re.match(r'freq:\s*(\d+)', line)
-                if freq_match:
-                    freq = int(freq_match.group(1))
-                    current_network['frequency'] = freq
-                    current_network['channel'] = freq_to_channel(freq)
-                    continue
-                
-                # Signal strength
-                signal_match = re.match(r'signal:\s*(-?\d+\.?\d*)\s*dBm', line)
-                if signal_match:
-                    signal = float(signal_match.group(1))
-                    current_network['signal_dbm'] = signal
-                    current_network['signal_quality'] = dbm_to_quality(signal)
-                    continue
-                
-                # Security - WPA/WPA2/WPA3
-                if 'WPA:' in line or 'RSN:' in line:
-                    if 'WPA:' in line and 'WPA' not in current_network['encryption']:
-                        current_network['encryption'].append('WPA')
-                    if 'RSN:' in line:
-                        current_network['encryption'].append('WPA2')
-                    current_network['security'] = 'Secured'
-                
-                # WEP
-                if 'Privacy' in line and not current_network['encryption']:
-                    current_network['encryption'].append('WEP')
-                    current_network['security'] = 'Secured'
+        # Frequency and channel
+        freq_match = _FREQ_RE.match(line) if line.startswith('freq:') else None
+        if freq_match:
+            freq = int(freq_match.group(1))
+            current_network.frequency = freq
+            current_network.channel = freq_to_channel(freq)
+            continue
+        
+        # Signal strength
+        signal_match = _SIGNAL_RE.match(line) if line.startswith('signal:') else None
+        if signal_match:
+            signal = float(signal_match.group(1))
+            current_network.signal_dbm = signal
+            current_network.signal_quality = dbm_to_quality(signal)
+            continue
+        
+        # Security - WPA/WPA2/WPA3
+        if 'WPA:' in line or 'RSN:' in line:
+            if 'WPA:' in line:
+                encryption['WPA'] = None
+            if 'RSN:' in line:
+                encryption['WPA2'] = None
+            current_network.security = 'Secured'
+        
+        # WEP
+        if 'Privacy' in line and not encryption:
+            encryption['WEP'] = None
+            current_network.security = 'Secured'
+    
+    # Add last network
+    if current_network and (ssid_filter is None or current_network.ssid in ssid_filter):
+        current_network.encryption = list(encryption)
+        networks.append(current_network)
+    
+    return networks
+
+
+def scan_wifi_networks_netlink(
+    interface: str,
+    *,
+    ssid_filter: Optional[Iterable[str]] = None,
+    bssid_filter: Optional[Iterable[str]] = None
+) -> Optional[List[WifiNetwork]]:
+    """
+    Scan for WiFi networks over nl80211, without running iw.
+    
+    Args:
+        interface: Wireless interface name
+        ssid_filter: Only return networks with one of these SSIDs
+        bssid_filter: Only return networks with one of these BSSIDs
+    
+    Returns:
+        List of discovered networks, or None if nl80211 is unavailable
+    """
+    results = netlink.scan_wifi(interface)
+    if results is None:
+        return None
+    
+    ssid_filter, bssid_filter = _normalize_filters(ssid_filter, bssid_filter)
+    networks = []
+    
+    for bss in results:
+        bssid = _normalize_bssid(bss['bssid'])
+        if bssid_filter is not None and bssid not in bssid_filter:
+            continue
+        
+        ssid = bss['ssid'] or '<hidden>'
+        if ssid_filter is not None and ssid not in ssid_filter:
+            continue
+        
+        # Security elements are reported in frame order, as iw prints them
+        encryption = ['WPA2' if element == 'RSN' else 'WPA' for element in bss['security']]
+        if not encryption and bss['privacy']:
+            encryption.append('WEP')
+        
+        frequency = bss['frequency']
+        signal = bss['signal_dbm']
+        networks.append(WifiNetwork(
+            bssid,
+            ssid=ssid,
+            frequency=frequency,
+            channel=freq_to_channel(frequency) if frequency else None,
+            signal_dbm=signal,
+            signal_quality=dbm_to_quality(signal) if signal is not None else None,
+            security='Secured' if encryption else 'Open',
+            encryption=encryption,
+            associated=bss['associated']
+        ))
+    
+    return networks
+
+
+def scan_wifi_networks_iw(
+    interface: str,
+    *,
+    ssid_filter: Optional[Iterable[str]] = None,
+    bssid_filter: Optional[Iterable[str]] = None
+) -> List[WifiNetwork]:
+    """
+    Scan for WiFi networks using iw command.
+    
+    Args:
+        interface: Wireless interface name
+        ssid_filter: Only return networks with one of these SSIDs
+        bssid_filter: Only return networks with one of these BSSIDs
+    
+    Returns:
+        List of discovered networks
+    """
+    networks = []
+    if not _IW:
+        return networks
+    
+    parse = functools.partial(
+        _parse_iw_scan, ssid_filter=ssid_filter, bssid_filter=bssid_filter
+    )
+    
+    try:
+        # 'iw scan' triggers a scan and blocks until the results are ready
+        status, result = _stream_command([_IW, interface, 'scan'], parse)
+        
+        if status != 0:
+            # Another scan is in flight (e.g. from wpa_supplicant): wait for
+            # it to finish so the dump below returns its fresh results
+            if status == IW_STATUS_EBUSY:
+                _wait_for_scan(interface)
             
-            # Add last network
-            if current_network:
-                networks.append(current_network)
+            # Fall back to the results cached from the last scan
+            status, result = _stream_command([_IW, interface, 'scan', 'dump'], parse)
+        
+        if status == 0:
+            networks = result
     
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
@@ -237,109 +570,140 @@ def scan_wifi_networks_iw(interface: str) -> List[Dict[str, Any]]:
     return networks
 
 
-def scan_wifi_networks_iwlist(interface: str) -> List[Dict[str, Any]]:
+def _parse_iwlist_scan(
+    lines: Iterable[str],
+    ssid_filter: Optional[Iterable[str]] = None,
+    bssid_filter: Optional[Iterable[str]] = None
+) -> List[WifiNetwork]:
+    """
+    Parse 'iwlist scan' output into network records.
+    
+    Networks rejected by a filter are dropped as soon as their BSSID or SSID
+    line is read, and the rest of their block is skipped.
+    
+    Args:
+        lines: Lines printed by 'iwlist <interface> scan'
+        ssid_filter: Only keep networks with one of these SSIDs
+        bssid_filter: Only keep networks with one of these BSSIDs
+    
+    Returns:
+        List of networks, in the order they were reported
+    """
+    ssid_filter, bssid_filter = _normalize_filters(ssid_filter, bssid_filter)
+    networks = []
+    current_network = None
+    
+    for line in lines:
+        line = line.strip()
+        
+        # New cell (network)
+        cell_match = _CELL_RE.match(line) if line.startswith('Cell') else None
+        if cell_match:
+            if current_network and (ssid_filter is None or current_network.ssid in ssid_filter):
+                networks.append(current_network)
+            bssid = _normalize_bssid(cell_match.group(1))
+            if bssid_filter is not None and bssid not in bssid_filter:
+                current_network = None
+                continue
+            current_network = WifiNetwork(bssid)
+            continue
+        
+        if current_network is None:
+            continue
+        
+        # ESSID (SSID)
+        essid_match = _ESSID_RE.match(line) if line.startswith('ESSID:') else None
+        if essid_match:
+            ssid = essid_match.group(1)
+            current_network.ssid = ssid if ssid else '<hidden>'
+            if ssid_filter is not None and current_network.ssid not in ssid_filter:
+                current_network = None
+            continue
+        
+        # Channel
+        channel_match = _CHAN_RE.match(line) if line.startswith('Channel:') else None
+        if channel_match:
+            channel = int(channel_match.group(1))
+            current_network.channel = channel
+            current_network.frequency = channel_to_freq(channel)
+            continue
+        
+        # Frequency
+        freq_match = _FREQ_GHZ_RE.match(line) if line.startswith('Frequency:') else None
+        if freq_match:
+            freq = int(float(freq_match.group(1)) * 1000)
+            current_network.frequency = freq
+            if not current_network.channel:
+                current_network.channel = freq_to_channel(freq)
+            continue
+        
+        # Signal level
+        signal_match = _SIGNAL_LEVEL_RE.search(line) if 'Signal level' in line else None
+        if signal_match:
+            signal = int(signal_match.group(1))
+            current_network.signal_dbm = signal
+            current_network.signal_quality = dbm_to_quality(signal)
+            continue
+        
+        # Quality
+        quality_match = _QUALITY_RE.search(line) if 'Quality' in line else None
+        if quality_match and not current_network.signal_quality:
+            quality = int(int(quality_match.group(1)) / int(quality_match.group(2)) * 100)
+            current_network.signal_quality = quality
+            continue
+        
+        # Encryption
+        enc_match = _ENC_KEY_RE.match(line) if line.startswith('Encryption key:') else None
+        if enc_match:
+            if enc_match.group(1) == 'on':
+                current_network.security = 'Secured'
+            continue
+        
+        # IE type
+        if 'WPA Version 1' in line:
+            current_network.encryption.append('WPA')
+        elif 'WPA2' in line or 'IEEE 802.11i/WPA2' in line:
+            current_network.encryption.append('WPA2')
+        elif 'WEP' in line:
+            current_network.encryption.append('WEP')
+    
+    # Add last network
+    if current_network and (ssid_filter is None or current_network.ssid in ssid_filter):
+        networks.append(current_network)
+    
+    return networks
+
+
+def scan_wifi_networks_iwlist(
+    interface: str,
+    *,
+    ssid_filter: Optional[Iterable[str]] = None,
+    bssid_filter: Optional[Iterable[str]] = None
+) -> List[WifiNetwork]:
     """
     Scan for WiFi networks using iwlist command (fallback).
     
     Args:
         interface: Wireless interface name
+        ssid_filter: Only return networks with one of these SSIDs
+        bssid_filter: Only return networks with one of these BSSIDs
     
     Returns:
         List of discovered networks
     """
     networks = []
+    if not _IWLIST:
+        return networks
+    
+    parse = functools.partial(
+        _parse_iwlist_scan, ssid_filter=ssid_filter, bssid_filter=bssid_filter
+    )
     
     try:
-        result = subprocess.run(
-            ['iwlist', interface, 'scan'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        status, result = _stream_command([_IWLIST, interface, 'scan'], parse)
         
-        if result.returncode == 0:
-            current_network = None
-            
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                
-                # New cell (network)
-                cell_match = re.match(r'Cell\s+\d+\s+-\s+Address:\s*([0-9a-fA-F:]{17})', line)
-                if cell_match:
-                    if current_network:
-                        networks.append(current_network)
-                    current_network = {
-                        'bssid': cell_match.group(1).upper(),
-                        'ssid': None,
-                        'frequency': None,
-                        'channel': None,
-                        'signal_dbm': None,
-                        'signal_quality': None,
-                        'security': 'Open',
-                        'encryption': []
-                    }
-                    continue
-                
-                if current_network is None:
-                    continue
-                
-                # ESSID (SSID)
-                essid_match = re.match(r'ESSID:"(.*)"', line)
-                if essid_match:
-                    ssid = essid_match.group(1)
-                    current_network['ssid'] = ssid if ssid else '<hidden>'
-                    continue
-                
-                # Channel
-                channel_match = re.match(r'Channel:(\d+)', line)
-                if channel_match:
-                    channel = int(channel_match.group(1))
-                    current_network['channel'] = channel
-                    current_network['frequency'] = channel_to_freq(channel)
-                    continue
-                
-                # Frequency
-                freq_match = re.match(r'Frequency:(\d+\.?\d*)\s*GHz', line)
-                if freq_match:
-                    freq = int(float(freq_match.group(1)) * 1000)
-                    current_network['frequency'] = freq
-                    if not current_network['channel']:
-                        current_network['channel'] = freq_to_channel(freq)
-                    continue
-                
-                # Signal level
-                signal_match = re.search(r'Signal level[=:]?\s*(-?\d+)\s*dBm', line)
-                if signal_match:
-                    signal = int(signal_match.group(1))
-                    current_network['signal_dbm'] = signal
-                    current_network['signal_quality'] = dbm_to_quality(signal)
-                    continue
-                
-                # Quality
-                quality_match = re.search(r'Quality[=:]?\s*(\d+)/(\d+)', line)
-                if quality_match and not current_network['signal_quality']:
-                    quality = int(int(quality_match.group(1)) / int(quality_match.group(2)) * 100)
-                    current_network['signal_quality'] = quality
-                    continue
-                
-                # Encryption
-                enc_match = re.match(r'Encryption key:(on|off)', line)
-                if enc_match:
-                    if enc_match.group(1) == 'on':
-                        current_network['security'] = 'Secured'
-                    continue
-                
-                # IE type
-                if 'WPA Version 1' in line:
-                    current_network['encryption'].append('WPA')
-                elif 'WPA2' in line or 'IEEE 802.11i/WPA2' in line:
-                    current_network['encryption'].append('WPA2')
-                elif 'WEP' in line:
-                    current_network['encryption'].append('WEP')
-            
-            # Add last network
-            if current_network:
-                networks.append(current_network)
+        if status == 0:
+            networks = result
     
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
@@ -347,37 +711,55 @@ def scan_wifi_networks_iwlist(interface: str) -> List[Dict[str, Any]]:
     return networks
 
 
-def scan_wifi_networks_termux() -> List[Dict[str, Any]]:
+def scan_wifi_networks_termux(
+    *,
+    ssid_filter: Optional[Iterable[str]] = None,
+    bssid_filter: Optional[Iterable[str]] = None
+) -> List[WifiNetwork]:
     """
     Scan for WiFi networks using Termux-API (Android specific).
     
+    Args:
+        ssid_filter: Only return networks with one of these SSIDs
+        bssid_filter: Only return networks with one of these BSSIDs
+    
     Returns:
         List of discovered networks
     """
     networks = []
+    if not _TERMUX_WIFI_SCANINFO:
+        return networks
+    
+    ssid_filter, bssid_filter = _normalize_filters(ssid_filter, bssid_filter)
     
     try:
         result = subprocess.run(
-            ['termux-wifi-scaninfo'],
+            [_TERMUX_WIFI_SCANINFO],
             capture_output=True,
-            text=True,
             timeout=30
         )
         
         if result.returncode == 0:
             try:
-                data = json.loads(result.stdout)
+                # Parse the raw bytes; orjson does not need them decoded first
+                data = loads_json(result.stdout)
                 for net in data:
-                    networks.append({
-                        'bssid': net.get('bssid', '').upper(),
-                        'ssid': net.get('ssid') or '<hidden>',
-                        'frequency': net.get('frequency_mhz'),
-                        'channel': freq_to_channel(net.get('frequency_mhz', 0)),
-                        'signal_dbm': net.get('rssi'),
-                        'signal_quality': dbm_to_quality(net.get('rssi', -100)),
-                        'security': 'Secured' if net.get('capabilities') else 'Open',
-                        'encryption': parse_capabilities(net.get('capabilities', ''))
-                    })
+                    bssid = _normalize_bssid(net.get('bssid', ''))
+                    ssid = net.get('ssid') or '<hidden>'
+                    if bssid_filter is not None and bssid not in bssid_filter:
+                        continue
+                    if ssid_filter is not None and ssid not in ssid_filter:
+                        continue
+                    networks.append(WifiNetwork(
+                        bssid=bssid,
+                        ssid=ssid,
+                        frequency=net.get('frequency_mhz'),
+                        channel=freq_to_channel(net.get('frequency_mhz', 0)),
+                        signal_dbm=net.get('rssi'),
+                        signal_quality=dbm_to_quality(net.get('rssi', -100)),
+                        security='Secured' if net.get('capabilities') else 'Open',
+                        encryption=parse_capabilities(net.get('capabilities', ''))
+                    ))
             except json.JSONDecodeError:
                 pass
     
@@ -387,11 +769,8 @@ def scan_wifi_networks_termux() -> List[Dict[str, Any]]:
     return networks
 
 
-def freq_to_channel(freq: int) -> Optional[int]:
-    """Convert frequency (MHz) to WiFi channel number."""
-    if not freq:
-        return None
-    
+def _freq_to_channel_formula(freq: int) -> Optional[int]:
+    """Compute the WiFi channel for a frequency (MHz) from the band formulas."""
     # 2.4 GHz band
     if 2412 <= freq <= 2484:
         if freq == 2484:
@@ -405,8 +784,26 @@ def freq_to_channel(freq: int) -> Optional[int]:
     return None
 
 
-def channel_to_freq(channel: int) -> Optional[int]:
-    """Convert WiFi channel to frequency (MHz)."""
+# Channel for every integer frequency (MHz) the band formulas cover
+_FREQ_TO_CHANNEL = {
+    freq: _freq_to_channel_formula(freq)
+    for band in (range(2412, 2485), range(5180, 5826))
+    for freq in band
+}
+
+
+def freq_to_channel(freq: int) -> Optional[int]:
+    """Convert frequency (MHz) to WiFi channel number."""
+    if not freq:
+        return None
+    
+    if freq in _FREQ_TO_CHANNEL:
+        return _FREQ_TO_CHANNEL[freq]
+    return _freq_to_channel_formula(freq)
+
+
+def _channel_to_freq_formula(channel: int) -> Optional[int]:
+    """Compute the frequency (MHz) of a WiFi channel from the band formulas."""
     # 2.4 GHz band
     if 1 <= channel <= 13:
         return 2407 + channel * 5
@@ -420,6 +817,28 @@ def channel_to_freq(channel: int) -> Optional[int]:
     return None
 
 
+# Frequency for every channel the band formulas cover
+_CHANNEL_TO_FREQ = {
+    channel: _channel_to_freq_formula(channel)
+    for band in (range(1, 15), range(36, 166))
+    for channel in band
+}
+
+
+def channel_to_freq(channel: int) -> Optional[int]:
+    """Convert WiFi channel to frequency (MHz)."""
+    return _CHANNEL_TO_FREQ.get(channel)
+
+
+def _dbm_to_quality_formula(dbm: float) -> int:
+    """Linearly map -90..-30 dBm onto 0..100 percent."""
+    return int(100 - ((-30 - dbm) / 60 * 100))
+
+
+# Quality for each whole dBm value from -90 to -30
+_DBM_QUALITY = [_dbm_to_quality_formula(dbm) for dbm in range(-90, -29)]
+
+
 def dbm_to_quality(dbm: float) -> int:
     """Convert signal strength in dBm to quality percentage."""
     if not dbm:
@@ -431,41 +850,122 @@ def dbm_to_quality(dbm: float) -> int:
     if dbm <= -90:
         return 0
     
-    # Linear interpolation
-    return int(100 - ((-30 - dbm) / 60 * 100))
+    # Scanners report whole dBm values (iw prints them as floats like -45.00)
+    whole = int(dbm)
+    if whole == dbm:
+        return _DBM_QUALITY[whole + 90]
+    return _dbm_to_quality_formula(dbm)
 
 
 def parse_capabilities(capabilities: str) -> List[str]:
     """Parse WiFi capabilities string to get encryption types."""
-    encryption = []
-    
     if not capabilities:
-        return encryption
+        return []
+    
+    # Nearby networks share a handful of capability strings
+    return list(_parse_capabilities(capabilities))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_capabilities(capabilities: str) -> Tuple[str, ...]:
+    """Cached worker for parse_capabilities (returns an immutable tuple)."""
+    # Collect every encryption token in one pass over the string
+    found = set(_CAPABILITY_RE.findall(capabilities))
+    
+    # Plain WPA only counts when no newer version is advertised
+    if 'WPA2' in found or 'WPA3' in found:
+        found.discard('WPA')
+    
+    return tuple(name for name in _CAPABILITY_ORDER if name in found)
+
+
+def _connection_from_scan(networks: List[WifiNetwork]) -> Optional[Dict[str, Any]]:
+    """
+    Build current connection info from the associated network in a scan.
     
-    if 'WPA3' in capabilities:
-        encryption.append('WPA3')
-    if 'WPA2' in capabilities:
-        encryption.append('WPA2')
-    if 'WPA' in capabilities and 'WPA2' not in capabilities and 'WPA3' not in capabilities:
-        encryption.append('WPA')
-    if 'WEP' in capabilities:
-        encryption.append('WEP')
+    Args:
+        networks: Networks parsed from 'iw scan'
     
-    return encryption
+    Returns:
+        Dictionary in the format of get_current_connection, or None
+    """
+    for net in networks:
+        if not net.associated:
+            continue
+        
+        connection = {'bssid': net.bssid}
+        if net.ssid is not None:
+            connection['ssid'] = net.ssid
+        if net.frequency is not None:
+            connection['frequency'] = net.frequency
+        if net.signal_dbm is not None:
+            connection['signal_dbm'] = int(net.signal_dbm)
+        return connection
+    
+    return None
 
 
-def run_wifi_scan(output_dir: str, verbose: bool = False) -> Dict[str, Any]:
+def _scan_interface(
+    interface: str,
+    filters: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[Dict[str, Any]], List[WifiNetwork]]:
+    """
+    Read the current connection and scan for networks on one interface.
+    
+    Args:
+        interface: Wireless interface name
+        filters: Optional ssid_filter/bssid_filter keyword arguments
+    
+    Returns:
+        Tuple of (current connection or None, discovered networks)
+    """
+    filters = filters or {}
+    
+    # Scan for networks (try nl80211 first, then iw, then iwlist)
+    networks = scan_wifi_networks_netlink(interface, **filters)
+    
+    if not networks:
+        networks = scan_wifi_networks_iw(interface, **filters)
+    
+    # nl80211 and iw flag the BSS we are associated with, which saves running
+    # 'iw link'. Its absence only means "not connected" if the scan saw
+    # networks and none were filtered out.
+    current = _connection_from_scan(networks)
+    if current is None and (not networks or any(filters.values())):
+        current = get_current_connection(interface)
+    
+    if not networks:
+        networks = scan_wifi_networks_iwlist(interface, **filters)
+    
+    if not networks:
+        # Try Termux API
+        networks = scan_wifi_networks_termux(**filters)
+    
+    return current, networks
+
+
+def run_wifi_scan(
+    output_dir: str,
+    verbose: bool = False,
+    cache: bool = True,
+    ssid_filter: Optional[Iterable[str]] = None,
+    bssid_filter: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
     """
     Run a complete WiFi scan.
     
     Args:
         output_dir: Directory to save results
         verbose: Print verbose output
+        cache: Reuse the interface list from the last INTERFACE_CACHE_TTL seconds
+        ssid_filter: Only report networks with one of these SSIDs
+        bssid_filter: Only report networks with one of these BSSIDs
     
     Returns:
         Scan results dictionary
     """
     builder = ScanResultBuilder("wifi")
+    filters = {'ssid_filter': ssid_filter, 'bssid_filter': bssid_filter}
     
     if verbose:
         print("=" * 60)
@@ -475,7 +975,7 @@ def run_wifi_scan(output_dir: str, verbose: bool = False) -> Dict[str, Any]:
     # Get wireless interfaces
     if verbose:
         print("\n[*] Detecting wireless interfaces...")
-    interfaces = get_wireless_interfaces()
+    interfaces = get_wireless_interfaces(use_cache=cache)
     builder.add_metadata("interfaces", interfaces)
     
     if not interfaces:
@@ -487,62 +987,74 @@ def run_wifi_scan(output_dir: str, verbose: bool = False) -> Dict[str, Any]:
         # Try Termux API as fallback
         if verbose:
             print("[*] Trying Termux-API...")
-        networks = scan_wifi_networks_termux()
+        networks = scan_wifi_networks_termux(**filters)
         if networks:
-            for net in networks:
-                builder.add_item(net)
+            builder.add_items(net.to_dict() for net in networks)
             if verbose:
                 print(f"[+] Found {len(networks)} networks via Termux-API")
     else:
         if verbose:
             print(f"    Found interfaces: {', '.join(interfaces)}")
         
-        all_networks = []
-        seen_bssids = set()
+        # Networks seen by several interfaces keep the strongest reading
+        by_bssid: Dict[str, WifiNetwork] = {}
         
-        for interface in interfaces:
+        # Scan all interfaces at once; each scan mostly waits on the radio
+        if verbose:
+            print(f"\n[*] Scanning on {', '.join(interfaces)}...")
+        with ThreadPoolExecutor(max_workers=len(interfaces)) as executor:
+            results = list(executor.map(
+                functools.partial(_scan_interface, filters=filters), interfaces
+            ))
+        
+        for interface, (current, networks) in zip(interfaces, results):
             if verbose:
-                print(f"\n[*] Scanning on {interface}...")
+                print(f"    {interface}: {len(networks)} networks")
             
-            # Get current connection
-            current = get_current_connection(interface)
             if current:
                 builder.add_metadata(f"current_connection_{interface}", current)
                 if verbose:
                     print(f"    Currently connected to: {current.get('ssid', 'unknown')}")
             
-            # Scan for networks (try iw first, then iwlist)
-            networks = scan_wifi_networks_iw(interface)
-            
-            if not networks:
-                networks = scan_wifi_networks_iwlist(interface)
-            
-            if not networks:
-                # Try Termux API
-                networks = scan_wifi_networks_termux()
-            
             # Add unique networks
             for net in networks:
-                bssid = net.get('bssid')
-                if bssid and bssid not in seen_bssids:
-                    seen_bssids.add(bssid)
-                    all_networks.append(net)
+                bssid = net.bssid
+                if not bssid:
+                    continue
+                current_best = by_bssid.get(bssid)
+                if current_best is None or (
+                    (net.signal_dbm or -999) > (current_best.signal_dbm or -999)
+                ):
+                    by_bssid[bssid] = net
         
-        # Sort by signal strength
-        all_networks.sort(key=lambda x: x.get('signal_dbm') or -100, reverse=True)
+        # Emit straight from the dedup table instead of copying it to a list
+        network_count = len(by_bssid)
+        builder.add_items(net.to_dict() for net in by_bssid.values())
         
-        for net in all_networks:
-            builder.add_item(net)
+        # Only the preview needs ordering; pick the top 5 without a full sort.
+        # Keys are computed once up front and compared as plain tuples
+        # (-index keeps ties in discovery order).
+        top_networks = []
+        if verbose and by_bssid:
+            keyed = [
+                (net.signal_dbm or -100, -i, net)
+                for i, net in enumerate(by_bssid.values())
+            ]
+            top_networks = [net for _, _, net in heapq.nlargest(5, keyed)]
+        
+        # The builder holds its own dicts now, so release the records early
+        by_bssid.clear()
+        results.clear()
         
         if verbose:
-            print(f"\n[+] Discovered {len(all_networks)} WiFi networks")
-            if all_networks:
+            print(f"\n[+] Discovered {network_count} WiFi networks")
+            if top_networks:
                 print("\n    Top networks by signal strength:")
-                for net in all_networks[:5]:
-                    ssid = net.get('ssid', '<unknown>')[:20]
-                    signal = net.get('signal_dbm', 'N/A')
-                    channel = net.get('channel', 'N/A')
-                    security = net.get('security', 'Unknown')
+                for net in top_networks:
+                    ssid = (net.ssid or '<unknown>')[:20]
+                    signal = net.signal_dbm if net.signal_dbm is not None else 'N/A'
+                    channel = net.channel if net.channel is not None else 'N/A'
+                    security = net.security
                     print(f"      {ssid:<20} Ch:{channel:<3} {signal}dBm {security}")
     
     # Build and save results
@@ -570,6 +1082,16 @@ def main():
         "--interface", "-i",
         help="Specific wireless interface to use"
     )
+    parser.add_argument(
+        "--ssid",
+        action="append",
+        help="Only report networks with this SSID (repeatable)"
+    )
+    parser.add_argument(
+        "--bssid",
+        action="append",
+        help="Only report networks with this BSSID (repeatable)"
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -591,9 +1113,15 @@ def main():
     
     verbose = args.verbose and not args.quiet
     
+    # Let long-running callers force fresh interface detection
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, clear_interface_cache)
+    
     result = run_wifi_scan(
         output_dir=args.output,
-        verbose=verbose
+        verbose=verbose,
+        ssid_filter=args.ssid,
+        bssid_filter=args.bssid
     )
     
     if args.json:
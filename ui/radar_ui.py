@@ -15,16 +15,35 @@ Features:
 
 import argparse
 import curses
-import json
 import math
 import os
 import sys
+import threading
 import time
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 # Add lib to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib.json_utils import load_json
+
+# Degrees the sweep advances per frame
+SWEEP_STEP = 5
+
+# (sin, cos) for every sweep angle, indexed by angle // SWEEP_STEP
+_SWEEP_LUT = [
+    (math.sin(math.radians(angle)), math.cos(math.radians(angle)))
+    for angle in range(0, 360, SWEEP_STEP)
+]
+
+
+class DeviceColumns(NamedTuple):
+    """Per-device fields used by the render loop, stored column-wise."""
+    scan_types: List[str]
+    signals: List[Any]
+    latencies: List[Any]
+    names: List[str]
 
 
 class RadarUI:
@@ -40,6 +59,17 @@ class RadarUI:
     COLOR_ALERT = 7
     COLOR_DIM = 8
     
+    # (color pair, glyph) per scan type, and for anything else
+    _TYPE_STYLE = {
+        'network': (COLOR_DEVICE_NETWORK, '◆'),
+        'wifi': (COLOR_DEVICE_WIFI, '◈'),
+        'bluetooth': (COLOR_DEVICE_BLUETOOTH, '●'),
+    }
+    _DEFAULT_STYLE = (COLOR_STATUS, '○')
+    
+    # Seconds between background reloads of the scan results
+    SCAN_RELOAD_INTERVAL = 5.0
+    
     def __init__(self, output_dir: str, refresh_rate: float = 1.0):
         """
         Initialize radar UI.
@@ -52,14 +82,46 @@ class RadarUI:
         self.refresh_rate = refresh_rate
         self.stdscr = None
         self.devices: List[Dict[str, Any]] = []
+        self.device_counts: Counter = Counter()
+        self._columns = DeviceColumns([], [], [], [])
         self.scan_angle = 0
         self.last_scan_time = None
+        self.load_error: Optional[str] = None
         self.running = True
         
+        # Parsed devices per scan file, keyed by path and tagged with the
+        # (mtime, size, inode) they were parsed at
+        self._file_cache: Dict[str, Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = {}
+        
+        # Wakes the background loader early (manual refresh or shutdown)
+        self._reload_event = threading.Event()
+        
         # UI state
         self.selected_index = 0
         self.scroll_offset = 0
         self.view_mode = 'radar'  # 'radar' or 'list'
+        
+        # Radar geometry depends only on its placement, so it is computed
+        # once per (center_y, center_x, size) instead of every frame. Cells
+        # are clipped to the screen when cached, so these are reset on resize
+        self._ring_cache: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
+        self._sweep_cache: Dict[Tuple[int, int, int, int], List[Tuple[int, int]]] = {}
+        
+        # Blip cells for the current device columns and radar placement
+        self._blip_cache: Optional[Tuple[DeviceColumns, Tuple[int, int, int], List[Tuple[int, int, str, int]]]] = None
+        
+        # Formatted device list lines for the current columns and width
+        self._list_cache: Optional[Tuple[DeviceColumns, int, List[Tuple[str, int]]]] = None
+        
+        # Box border strings per panel width, rebuilt after a resize
+        self._border_cache: Dict[int, Tuple[str, str, str]] = {}
+        
+        # Off-screen frame buffer and the contents currently on screen
+        self._frame_size: Optional[Tuple[int, int]] = None
+        self._chars: List[List[str]] = []
+        self._attrs: List[List[int]] = []
+        self._screen_chars: List[List[str]] = []
+        self._screen_attrs: List[List[int]] = []
     
     def init_colors(self):
         """Initialize color pairs."""
@@ -76,43 +138,107 @@ class RadarUI:
         curses.init_pair(self.COLOR_ALERT, curses.COLOR_RED, -1)
         curses.init_pair(self.COLOR_DIM, curses.COLOR_WHITE, -1)
     
+    def _parse_scan_file(self, filepath: str) -> List[Dict[str, Any]]:
+        """
+        Parse one scan file into device entries.
+        
+        Args:
+            filepath: Path to scan JSON file
+            
+        Returns:
+            List of devices (empty if the file can't be read or parsed)
+        """
+        devices = []
+        
+        try:
+            scan = load_json(filepath)
+            
+            # Skip files that aren't shaped like scan results
+            if not isinstance(scan, dict) or not isinstance(scan.get('data', []), list):
+                return []
+            
+            scan_type = scan.get('scan_type', 'unknown')
+            data = scan.get('data', [])
+            timestamp = scan.get('timestamp', '')
+            
+            # Tag the freshly parsed items in place instead of copying
+            # them; fields the item already has take precedence
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                item.setdefault('scan_type', scan_type)
+                item.setdefault('timestamp', timestamp)
+                devices.append(item)
+        
+        except (ValueError, OSError):
+            # json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
+            return []
+        
+        return devices
+    
+    def set_devices(self, devices: List[Dict[str, Any]]):
+        """
+        Replace the displayed devices and update the per-type counts.
+        
+        Args:
+            devices: Devices as returned by load_scan_results()
+        """
+        self.device_counts = Counter(d.get('scan_type') for d in devices)
+        
+        # The radar and device list read these columns every frame instead
+        # of doing several dict lookups per device; the detail panel still
+        # uses the full dicts
+        self._columns = DeviceColumns(
+            [d.get('scan_type', 'unknown') for d in devices],
+            [d.get('signal_dbm') for d in devices],
+            [d.get('latency_ms') for d in devices],
+            [d.get('name') or d.get('ssid') or d.get('ip') or d.get('address', 'Unknown')
+             for d in devices],
+        )
+        self.devices = devices
+    
     def load_scan_results(self) -> List[Dict[str, Any]]:
         """
         Load latest scan results from output directory.
         
+        Files whose modification time, size and inode are unchanged since
+        the previous load are not parsed again.
+        
         Returns:
             List of discovered devices
         """
         devices = []
+        file_cache = {}
         
-        if not os.path.exists(self.output_dir):
+        # Load all scan files
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    
+                    try:
+                        # Skip directories and other non-regular entries
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    
+                    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+                    cached = self._file_cache.get(entry.path)
+                    if cached is not None and cached[0] == key:
+                        file_devices = cached[1]
+                    else:
+                        file_devices = self._parse_scan_file(entry.path)
+                    
+                    file_cache[entry.path] = (key, file_devices)
+                    devices.extend(file_devices)
+        except FileNotFoundError:
             return devices
         
-        # Load all scan files
-        for filename in os.listdir(self.output_dir):
-            if not filename.endswith('.json'):
-                continue
-            
-            filepath = os.path.join(self.output_dir, filename)
-            
-            try:
-                with open(filepath, 'r') as f:
-                    scan = json.load(f)
-                
-                scan_type = scan.get('scan_type', 'unknown')
-                data = scan.get('data', [])
-                timestamp = scan.get('timestamp', '')
-                
-                for item in data:
-                    device = {
-                        'scan_type': scan_type,
-                        'timestamp': timestamp,
-                        **item
-                    }
-                    devices.append(device)
-            
-            except (json.JSONDecodeError, IOError):
-                continue
+        # Entries for files that went away are dropped here
+        self._file_cache = file_cache
         
         # Sort by scan type and then by name/IP
         devices.sort(key=lambda d: (d.get('scan_type', ''), d.get('name', d.get('ip', ''))))
@@ -120,135 +246,345 @@ class RadarUI:
         self.last_scan_time = datetime.now()
         return devices
     
+    def _begin_frame(self, height: int, width: int):
+        """
+        Start a new frame in the off-screen buffer.
+        
+        Args:
+            height: Screen height
+            width: Screen width
+        """
+        if self._frame_size != (height, width):
+            # New or resized screen: start over from a blank window
+            self.stdscr.erase()
+            self._frame_size = (height, width)
+            self._border_cache.clear()
+            self._ring_cache.clear()
+            self._sweep_cache.clear()
+            self._blip_cache = None
+            self._screen_chars = self._blank_rows(height, width, ' ')
+            self._screen_attrs = self._blank_rows(height, width, 0)
+        
+        self._chars = self._blank_rows(height, width, ' ')
+        self._attrs = self._blank_rows(height, width, 0)
+    
+    @staticmethod
+    def _blank_rows(height: int, width: int, fill: Any) -> List[List[Any]]:
+        """
+        Build an empty frame buffer.
+        
+        The bottom-right cell is left out: curses raises after writing it
+        because the cursor can't advance, and nothing is drawn there.
+        """
+        rows = [[fill] * width for _ in range(height)]
+        if rows:
+            del rows[-1][-1:]
+        return rows
+    
+    def _put(self, y: int, x: int, char: str, attr: int):
+        """Write a single cell into the frame buffer."""
+        self._chars[y][x] = char
+        self._attrs[y][x] = attr
+    
+    def _puts(self, y: int, x: int, text: str, attr: int):
+        """Write a string into the frame buffer, clipped to the row."""
+        chars = self._chars[y]
+        end = min(x + len(text), len(chars))
+        chars[x:end] = text[:end - x]
+        self._attrs[y][x:end] = [attr] * (end - x)
+    
+    def _hline(self, y: int, x: int, char: str, n: int, attr: int):
+        """Fill n cells of a row in the frame buffer, like window.hline()."""
+        if n > 0:
+            self._chars[y][x:x + n] = [char] * n
+            self._attrs[y][x:x + n] = [attr] * n
+    
+    def _vline(self, y: int, x: int, char: str, n: int, attr: int):
+        """Fill n cells of a column in the frame buffer, like window.vline()."""
+        for row in range(y, y + n):
+            self._chars[row][x] = char
+            self._attrs[row][x] = attr
+    
+    def _flush_frame(self):
+        """Send cells that differ from what is on screen, then update it."""
+        screen_chars = self._screen_chars
+        screen_attrs = self._screen_attrs
+        
+        for y, (chars, attrs) in enumerate(zip(self._chars, self._attrs)):
+            old_chars = screen_chars[y]
+            old_attrs = screen_attrs[y]
+            if chars == old_chars and attrs == old_attrs:
+                continue
+            
+            # Rewrite the span between the first and last changed cells,
+            # one addstr per run of equal attributes; curses itself skips
+            # the unchanged cells inside the span when updating the terminal
+            changed = [
+                x for x, (char, attr) in enumerate(zip(chars, attrs))
+                if char != old_chars[x] or attr != old_attrs[x]
+            ]
+            run_start = changed[0]
+            run_attr = attrs[run_start]
+            for x in range(run_start + 1, changed[-1] + 1):
+                if attrs[x] != run_attr:
+                    self.stdscr.addstr(y, run_start, ''.join(chars[run_start:x]), run_attr)
+                    run_start = x
+                    run_attr = attrs[x]
+            self.stdscr.addstr(y, run_start, ''.join(chars[run_start:changed[-1] + 1]), run_attr)
+        
+        self._screen_chars = self._chars
+        self._screen_attrs = self._attrs
+        
+        # One physical update per frame
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+    
+    def _borders(self, width: int) -> Tuple[str, str, str]:
+        """
+        Get the top, separator and bottom border strings for a box.
+        
+        Args:
+            width: Box width including the corners
+            
+        Returns:
+            Tuple of (top, separator, bottom) strings
+        """
+        borders = self._border_cache.get(width)
+        if borders is None:
+            fill = "═" * (width - 2)
+            borders = ("╔" + fill + "╗", "╠" + fill + "╣", "╚" + fill + "╝")
+            self._border_cache[width] = borders
+        return borders
+    
     def draw_header(self, height: int, width: int):
         """Draw the header section."""
         title = " ANDROID RECON - RADAR "
         
+        attr = curses.color_pair(self.COLOR_HEADER)
+        top, separator, _ = self._borders(width)
+        
         # Draw top border
-        self.stdscr.attron(curses.color_pair(self.COLOR_HEADER))
-        self.stdscr.addstr(0, 0, "╔" + "═" * (width - 2) + "╗")
+        self._puts(0, 0, top, attr)
         
         # Draw title
         title_pos = (width - len(title)) // 2
-        self.stdscr.addstr(1, 0, "║")
-        self.stdscr.addstr(1, title_pos, title, curses.A_BOLD)
-        self.stdscr.addstr(1, width - 1, "║")
+        self._puts(1, 0, "║", attr)
+        self._puts(1, title_pos, title, curses.A_BOLD)
+        self._puts(1, width - 1, "║", attr)
         
         # Draw separator
-        self.stdscr.addstr(2, 0, "╠" + "═" * (width - 2) + "╣")
-        self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER))
+        self._puts(2, 0, separator, attr)
     
-    def draw_radar(self, start_y: int, start_x: int, size: int):
+    def _ring_cells(self, center_y: int, center_x: int, size: int,
+                    max_y: int, max_x: int) -> List[Tuple[int, int]]:
         """
-        Draw animated radar sweep visualization.
+        Get the on-screen cells covered by the radar rings.
+        
+        Small rings map many angles onto the same cell, so duplicates are
+        dropped to avoid redundant writes.
         
         Args:
-            start_y: Starting Y position
-            start_x: Starting X position
+            center_y: Radar center row
+            center_x: Radar center column
             size: Radar size (radius)
+            max_y: Rows at or below this are off limits
+            max_x: Columns at or right of this are off limits
+            
+        Returns:
+            List of (y, x) cells
         """
-        center_y = start_y + size // 2
-        center_x = start_x + size
+        key = (center_y, center_x, size)
+        cells = self._ring_cache.get(key)
+        if cells is None:
+            unique: Dict[Tuple[int, int], None] = {}
+            for r in range(1, size, size // 4 or 1):
+                for angle in range(360):
+                    rad = math.radians(angle)
+                    unique[(
+                        int(center_y + r * 0.5 * math.sin(rad)),
+                        int(center_x + r * math.cos(rad))
+                    )] = None
+            cells = [(y, x) for y, x in unique if 0 <= y < max_y and 0 <= x < max_x]
+            self._ring_cache[key] = cells
+        return cells
+    
+    def _sweep_cells(self, center_y: int, center_x: int, size: int, angle: int,
+                     max_y: int, max_x: int) -> List[Tuple[int, int]]:
+        """
+        Get the on-screen cells covered by the sweep line.
         
-        self.stdscr.attron(curses.color_pair(self.COLOR_RADAR))
+        The sweep only ever takes a few dozen distinct angles, so each
+        line is computed once and reused on later turns. Filling the cache
+        after a resize reads sin/cos from a table instead of calling libm.
         
-        # Draw radar circles
-        for r in range(1, size, size // 4 or 1):
-            for angle in range(360):
+        Args:
+            center_y: Radar center row
+            center_x: Radar center column
+            size: Radar size (radius)
+            angle: Sweep angle in degrees
+            max_y: Rows at or below this are off limits
+            max_x: Columns at or right of this are off limits
+            
+        Returns:
+            List of (y, x) cells
+        """
+        key = (center_y, center_x, size, angle)
+        cells = self._sweep_cache.get(key)
+        if cells is None:
+            if angle % SWEEP_STEP == 0:
+                sin, cos = _SWEEP_LUT[angle // SWEEP_STEP % len(_SWEEP_LUT)]
+            else:
                 rad = math.radians(angle)
-                y = int(center_y + r * 0.5 * math.sin(rad))
-                x = int(center_x + r * math.cos(rad))
-                
-                if 0 <= y < curses.LINES - 1 and 0 <= x < curses.COLS - 1:
-                    try:
-                        self.stdscr.addch(y, x, '·')
-                    except curses.error:
-                        pass
-        
-        # Draw crosshairs
-        for i in range(-size, size + 1):
-            y = center_y
-            x = center_x + i
-            if 0 <= y < curses.LINES - 1 and 0 <= x < curses.COLS - 1:
-                try:
-                    self.stdscr.addch(y, x, '─')
-                except curses.error:
-                    pass
-        
-        for i in range(-size // 2, size // 2 + 1):
-            y = center_y + i
-            x = center_x
-            if 0 <= y < curses.LINES - 1 and 0 <= x < curses.COLS - 1:
-                try:
-                    self.stdscr.addch(y, x, '│')
-                except curses.error:
-                    pass
+                sin, cos = math.sin(rad), math.cos(rad)
+            cells = []
+            for r in range(1, size):
+                y = int(center_y + r * 0.5 * sin)
+                x = int(center_x + r * cos)
+                if 0 <= y < max_y and 0 <= x < max_x:
+                    cells.append((y, x))
+            self._sweep_cache[key] = cells
+        return cells
+    
+    def _blip_cells(self, center_y: int, center_x: int, size: int,
+                    max_y: int, max_x: int) -> List[Tuple[int, int, str, int]]:
+        """
+        Get the on-screen cells and glyphs of the device blips.
         
-        # Draw center
-        if 0 <= center_y < curses.LINES - 1 and 0 <= center_x < curses.COLS - 1:
-            try:
-                self.stdscr.addch(center_y, center_x, '┼')
-            except curses.error:
-                pass
+        Blip positions only depend on the device list and radar placement,
+        so they are computed once per pair instead of every frame. The
+        cache is tied to the columns object itself, so a reload on the
+        loader thread can never leave stale blips behind.
         
-        # Draw sweep line
-        sweep_rad = math.radians(self.scan_angle)
-        for r in range(1, size):
-            y = int(center_y + r * 0.5 * math.sin(sweep_rad))
-            x = int(center_x + r * math.cos(sweep_rad))
+        Args:
+            center_y: Radar center row
+            center_x: Radar center column
+            size: Radar size (radius)
+            max_y: Rows at or below this are off limits
+            max_x: Columns at or right of this are off limits
             
-            if 0 <= y < curses.LINES - 1 and 0 <= x < curses.COLS - 1:
-                try:
-                    self.stdscr.addch(y, x, '█', curses.A_BOLD)
-                except curses.error:
-                    pass
-        
-        # Draw devices as blips
-        for i, device in enumerate(self.devices[:20]):
+        Returns:
+            List of (y, x, char, attr) tuples
+        """
+        columns = self._columns
+        key = (center_y, center_x, size)
+        cache = self._blip_cache
+        if cache is not None and cache[0] is columns and cache[1] == key:
+            return cache[2]
+        
+        blips = []
+        device_count = len(columns.scan_types)
+        for i in range(min(device_count, 20)):
             # Calculate position based on device index
-            device_angle = (i * 360 / max(len(self.devices), 1)) % 360
+            device_angle = (i * 360 / max(device_count, 1)) % 360
             device_rad = math.radians(device_angle)
             
             # Distance based on signal strength if available
-            signal = device.get('signal_dbm') or device.get('latency_ms')
+            signal = columns.signals[i]
+            latency = columns.latencies[i]
             if signal:
-                if device.get('signal_dbm'):
-                    # WiFi/BT signal: -30 (near) to -90 (far)
-                    distance = max(0.2, min(0.9, (abs(signal) - 30) / 60))
-                else:
-                    # Network latency: 0 (near) to 200ms (far)
-                    distance = max(0.2, min(0.9, signal / 200))
+                # WiFi/BT signal: -30 (near) to -90 (far)
+                distance = max(0.2, min(0.9, (abs(signal) - 30) / 60))
+            elif latency:
+                # Network latency: 0 (near) to 200ms (far)
+                distance = max(0.2, min(0.9, latency / 200))
             else:
                 distance = 0.5 + (i % 5) * 0.1
             
             r = int(size * distance)
+            
+            # Choose color and character based on device type
+            color, char = self._TYPE_STYLE.get(columns.scan_types[i], self._DEFAULT_STYLE)
+            
             y = int(center_y + r * 0.5 * math.sin(device_rad))
             x = int(center_x + r * math.cos(device_rad))
+            if 0 <= y < max_y and 0 <= x < max_x:
+                blips.append((y, x, char, curses.color_pair(color)))
+        
+        self._blip_cache = (columns, key, blips)
+        return blips
+    
+    def draw_radar(self, start_y: int, start_x: int, size: int, height: int, width: int):
+        """
+        Draw animated radar sweep visualization.
+        
+        Args:
+            start_y: Starting Y position
+            start_x: Starting X position
+            size: Radar size (radius)
+            height: Screen height
+            width: Screen width
+        """
+        center_y = start_y + size // 2
+        center_x = start_x + size
+        
+        radar_attr = curses.color_pair(self.COLOR_RADAR)
+        
+        # Drawable area; cached cells are already clipped to it
+        max_y = height - 1
+        max_x = width - 1
+        
+        # Draw radar circles
+        for y, x in self._ring_cells(center_y, center_x, size, max_y, max_x):
+            self._put(y, x, '·', radar_attr)
+        
+        # Draw crosshairs, clipped to the drawable area
+        if 0 <= center_y < max_y:
+            x0 = max(0, center_x - size)
+            self._hline(center_y, x0, '─', min(max_x, center_x + size + 1) - x0, radar_attr)
+        if 0 <= center_x < max_x:
+            y0 = max(0, center_y + -size // 2)
+            self._vline(y0, center_x, '│', min(max_y, center_y + size // 2 + 1) - y0, radar_attr)
+        
+        # Draw center
+        if 0 <= center_y < max_y and 0 <= center_x < max_x:
+            self._put(center_y, center_x, '┼', radar_attr)
+        
+        # Draw sweep line
+        sweep_attr = radar_attr | curses.A_BOLD
+        for y, x in self._sweep_cells(center_y, center_x, size, self.scan_angle, max_y, max_x):
+            self._put(y, x, '█', sweep_attr)
+        
+        # Draw devices as blips
+        for y, x, char, attr in self._blip_cells(center_y, center_x, size, max_y, max_x):
+            self._put(y, x, char, attr)
+    
+    def _device_list_lines(self, columns: DeviceColumns, width: int) -> List[Tuple[str, int]]:
+        """
+        Get the formatted device list lines for a panel width.
+        
+        Lines only change with the device list or the panel width, so they
+        are built once per pair rather than for every visible row on every
+        frame.
+        
+        Args:
+            columns: Device columns snapshot the caller is drawing from;
+                the loader thread may swap self._columns at any time
+            width: Panel width
             
-            # Choose color and character based on device type
-            scan_type = device.get('scan_type', 'unknown')
-            if scan_type == 'network':
-                color = self.COLOR_DEVICE_NETWORK
-                char = '◆'
-            elif scan_type == 'wifi':
-                color = self.COLOR_DEVICE_WIFI
-                char = '◈'
-            elif scan_type == 'bluetooth':
-                color = self.COLOR_DEVICE_BLUETOOTH
-                char = '●'
-            else:
-                color = self.COLOR_STATUS
-                char = '○'
+        Returns:
+            List of (line, attr) tuples, one per device in columns
+        """
+        cache = self._list_cache
+        if cache is not None and cache[0] is columns and cache[1] == width:
+            return cache[2]
+        
+        lines = []
+        type_style = self._TYPE_STYLE
+        default_style = self._DEFAULT_STYLE
+        for scan_type, name in zip(columns.scan_types, columns.names):
+            # Choose color based on device type
+            color, icon = type_style.get(scan_type, default_style)
+            
+            # Get device display name
+            if len(name) > width - 8:
+                name = name[:width - 11] + '...'
             
-            if 0 <= y < curses.LINES - 1 and 0 <= x < curses.COLS - 1:
-                self.stdscr.attron(curses.color_pair(color))
-                try:
-                    self.stdscr.addch(y, x, char)
-                except curses.error:
-                    pass
-                self.stdscr.attroff(curses.color_pair(color))
+            line = f" {icon} {name}"
+            line = line.ljust(width - 2)
+            lines.append((line[:width - 2], curses.color_pair(color)))
         
-        self.stdscr.attroff(curses.color_pair(self.COLOR_RADAR))
+        self._list_cache = (columns, width, lines)
+        return lines
     
     def draw_device_list(self, start_y: int, start_x: int, height: int, width: int):
         """
@@ -261,69 +597,40 @@ class RadarUI:
             width: Panel width
         """
         # Draw panel border
-        self.stdscr.attron(curses.color_pair(self.COLOR_HEADER))
-        self.stdscr.addstr(start_y, start_x, "╔" + "═" * (width - 2) + "╗")
+        border_attr = curses.color_pair(self.COLOR_HEADER)
+        top, _, bottom = self._borders(width)
+        self._puts(start_y, start_x, top, border_attr)
         
         title = " DISCOVERED DEVICES "
         title_pos = start_x + (width - len(title)) // 2
-        self.stdscr.addstr(start_y, title_pos, title)
+        self._puts(start_y, title_pos, title, border_attr)
         
         for i in range(1, height - 1):
-            self.stdscr.addstr(start_y + i, start_x, "║")
-            self.stdscr.addstr(start_y + i, start_x + width - 1, "║")
+            self._put(start_y + i, start_x, "║", border_attr)
+            self._put(start_y + i, start_x + width - 1, "║", border_attr)
         
-        self.stdscr.addstr(start_y + height - 1, start_x, "╚" + "═" * (width - 2) + "╝")
-        self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER))
+        self._puts(start_y + height - 1, start_x, bottom, border_attr)
         
         # Draw device entries
         visible_height = height - 2
-        visible_devices = self.devices[self.scroll_offset:self.scroll_offset + visible_height]
+        columns = self._columns
+        device_count = len(columns.scan_types)
+        visible_end = min(device_count, self.scroll_offset + visible_height)
         
-        for i, device in enumerate(visible_devices):
-            y = start_y + 1 + i
-            
-            # Choose color based on device type
-            scan_type = device.get('scan_type', 'unknown')
-            if scan_type == 'network':
-                color = self.COLOR_DEVICE_NETWORK
-                icon = '◆'
-            elif scan_type == 'wifi':
-                color = self.COLOR_DEVICE_WIFI
-                icon = '◈'
-            elif scan_type == 'bluetooth':
-                color = self.COLOR_DEVICE_BLUETOOTH
-                icon = '●'
-            else:
-                color = self.COLOR_STATUS
-                icon = '○'
-            
-            # Get device display name
-            name = device.get('name') or device.get('ssid') or device.get('ip') or device.get('address', 'Unknown')
-            if len(name) > width - 8:
-                name = name[:width - 11] + '...'
-            
+        lines = self._device_list_lines(columns, width)
+        for i, index in enumerate(range(self.scroll_offset, visible_end)):
             # Highlight selected item
-            attr = curses.A_REVERSE if i + self.scroll_offset == self.selected_index else 0
+            line, attr = lines[index]
+            if index == self.selected_index:
+                attr |= curses.A_REVERSE
             
-            self.stdscr.attron(curses.color_pair(color) | attr)
-            line = f" {icon} {name}"
-            line = line.ljust(width - 2)
-            try:
-                self.stdscr.addstr(y, start_x + 1, line[:width - 2])
-            except curses.error:
-                pass
-            self.stdscr.attroff(curses.color_pair(color) | attr)
+            self._puts(start_y + 1 + i, start_x + 1, line, attr)
         
         # Draw scroll indicator if needed
-        if len(self.devices) > visible_height:
-            scroll_pct = self.scroll_offset / max(1, len(self.devices) - visible_height)
+        if device_count > visible_height:
+            scroll_pct = self.scroll_offset / max(1, device_count - visible_height)
             indicator_pos = start_y + 1 + int(scroll_pct * (visible_height - 1))
-            self.stdscr.attron(curses.color_pair(self.COLOR_HEADER))
-            try:
-                self.stdscr.addch(indicator_pos, start_x + width - 1, '█')
-            except curses.error:
-                pass
-            self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER))
+            self._put(indicator_pos, start_x + width - 1, '█', border_attr)
     
     def draw_detail_panel(self, start_y: int, start_x: int, height: int, width: int):
         """
@@ -336,35 +643,39 @@ class RadarUI:
             width: Panel width
         """
         # Draw panel border
-        self.stdscr.attron(curses.color_pair(self.COLOR_HEADER))
-        self.stdscr.addstr(start_y, start_x, "╔" + "═" * (width - 2) + "╗")
+        border_attr = curses.color_pair(self.COLOR_HEADER)
+        top, _, bottom = self._borders(width)
+        self._puts(start_y, start_x, top, border_attr)
         
         title = " DEVICE DETAILS "
         title_pos = start_x + (width - len(title)) // 2
-        self.stdscr.addstr(start_y, title_pos, title)
+        self._puts(start_y, title_pos, title, border_attr)
         
         for i in range(1, height - 1):
-            self.stdscr.addstr(start_y + i, start_x, "║")
-            self.stdscr.addstr(start_y + i, start_x + width - 1, "║")
+            self._put(start_y + i, start_x, "║", border_attr)
+            self._put(start_y + i, start_x + width - 1, "║", border_attr)
         
-        self.stdscr.addstr(start_y + height - 1, start_x, "╚" + "═" * (width - 2) + "╝")
-        self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER))
+        self._puts(start_y + height - 1, start_x, bottom, border_attr)
         
         # Draw selected device details
-        if 0 <= self.selected_index < len(self.devices):
-            device = self.devices[self.selected_index]
+        # Read the list once; the loader thread may replace it meanwhile
+        devices = self.devices
+        if 0 <= self.selected_index < len(devices):
+            device = devices[self.selected_index]
             
             y = start_y + 1
             
             # Display device properties
+            signal = device.get('signal_dbm')
+            latency = device.get('latency_ms')
             props = [
                 ('Type', device.get('scan_type', 'Unknown').title()),
                 ('Name', device.get('name') or device.get('ssid') or 'Unknown'),
                 ('IP', device.get('ip', '-')),
                 ('MAC', device.get('mac') or device.get('address') or device.get('bssid', '-')),
-                ('Signal', f"{device.get('signal_dbm', '-')} dBm" if device.get('signal_dbm') else '-'),
+                ('Signal', f"{signal} dBm" if signal else '-'),
                 ('Channel', str(device.get('channel', '-'))),
-                ('Latency', f"{device.get('latency_ms', '-')} ms" if device.get('latency_ms') else '-'),
+                ('Latency', f"{latency} ms" if latency else '-'),
                 ('Security', device.get('security', '-')),
                 ('State', device.get('state', '-')),
             ]
@@ -377,12 +688,7 @@ class RadarUI:
                 if len(line) > width - 2:
                     line = line[:width - 5] + '...'
                 
-                self.stdscr.attron(curses.color_pair(self.COLOR_STATUS))
-                try:
-                    self.stdscr.addstr(y, start_x + 1, line[:width - 2])
-                except curses.error:
-                    pass
-                self.stdscr.attroff(curses.color_pair(self.COLOR_STATUS))
+                self._puts(y, start_x + 1, line[:width - 2], curses.color_pair(self.COLOR_STATUS))
                 y += 1
     
     def draw_status_bar(self, height: int, width: int):
@@ -390,45 +696,48 @@ class RadarUI:
         y = height - 1
         
         # Build status text
+        counts = self.device_counts
         device_count = len(self.devices)
-        network_count = sum(1 for d in self.devices if d.get('scan_type') == 'network')
-        wifi_count = sum(1 for d in self.devices if d.get('scan_type') == 'wifi')
-        bt_count = sum(1 for d in self.devices if d.get('scan_type') == 'bluetooth')
+        network_count = counts['network']
+        wifi_count = counts['wifi']
+        bt_count = counts['bluetooth']
         
         status = f" Devices: {device_count} | Net: {network_count} | WiFi: {wifi_count} | BT: {bt_count}"
         
         if self.last_scan_time:
             status += f" | Last scan: {self.last_scan_time.strftime('%H:%M:%S')}"
         
+        if self.load_error:
+            status += f" | Reload failed: {self.load_error}"
+        
         # Draw status bar
-        self.stdscr.attron(curses.color_pair(self.COLOR_HEADER) | curses.A_REVERSE)
-        try:
-            self.stdscr.addstr(y, 0, status.ljust(width - 1)[:width - 1])
-        except curses.error:
-            pass
-        self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER) | curses.A_REVERSE)
+        self._puts(y, 0, status.ljust(width - 1)[:width - 1],
+                   curses.color_pair(self.COLOR_HEADER) | curses.A_REVERSE)
         
         # Draw help text
-        help_text = " [Q]uit [R]efresh [↑↓]Navigate "
+        help_text = " [Q]uit [R]efresh [Tab]View [↑↓]Navigate "
         help_pos = width - len(help_text) - 1
         if help_pos > len(status):
-            self.stdscr.attron(curses.color_pair(self.COLOR_DIM) | curses.A_REVERSE)
-            try:
-                self.stdscr.addstr(y, help_pos, help_text)
-            except curses.error:
-                pass
-            self.stdscr.attroff(curses.color_pair(self.COLOR_DIM) | curses.A_REVERSE)
+            self._puts(y, help_pos, help_text, curses.color_pair(self.COLOR_DIM) | curses.A_REVERSE)
     
     def draw(self):
-        """Draw the entire UI."""
-        self.stdscr.clear()
+        """
+        Draw the entire UI.
         
+        The frame is built off-screen and only cells that changed since
+        the previous frame are sent to curses, instead of clearing and
+        repainting the whole screen every tick.
+        """
         height, width = self.stdscr.getmaxyx()
+        self._begin_frame(height, width)
         
         # Minimum size check
         if height < 15 or width < 60:
-            self.stdscr.addstr(0, 0, "Terminal too small. Resize to at least 60x15.")
-            self.stdscr.refresh()
+            message = "Terminal too small. Resize to at least 60x15."
+            for row, i in enumerate(range(0, len(message), width)):
+                if row < height:
+                    self._puts(row, 0, message[i:i + width], 0)
+            self._flush_frame()
             return
         
         # Draw header
@@ -438,14 +747,19 @@ class RadarUI:
         content_start_y = 3
         content_height = height - 4  # Account for header and status bar
         
-        # Radar takes left half, device list takes right half
-        radar_width = width // 2
-        list_width = width - radar_width
-        
-        # Draw radar
-        radar_size = min(radar_width // 2 - 2, content_height - 2)
-        if radar_size > 3:
-            self.draw_radar(content_start_y + 1, 2, radar_size)
+        if self.view_mode == 'list':
+            # Device list and details take the full width, no radar
+            radar_width = 0
+            list_width = width
+        else:
+            # Radar takes left half, device list takes right half
+            radar_width = width // 2
+            list_width = width - radar_width
+            
+            # Draw radar
+            radar_size = min(radar_width // 2 - 2, content_height - 2)
+            if radar_size > 3:
+                self.draw_radar(content_start_y + 1, 2, radar_size, height, width)
         
         # Draw device list
         list_height = content_height // 2
@@ -467,7 +781,7 @@ class RadarUI:
         # Draw status bar
         self.draw_status_bar(height, width)
         
-        self.stdscr.refresh()
+        self._flush_frame()
     
     def handle_input(self):
         """Handle keyboard input."""
@@ -484,7 +798,13 @@ class RadarUI:
         if key in (ord('q'), ord('Q')):
             self.running = False
         elif key in (ord('r'), ord('R')):
-            self.devices = self.load_scan_results()
+            self._reload_event.set()
+        elif key == curses.KEY_RESIZE:
+            # Force the next frame to start from a blank window and rebuild
+            # every size-dependent cache
+            self._frame_size = None
+        elif key == ord('\t'):
+            self.view_mode = 'list' if self.view_mode == 'radar' else 'radar'
         elif key == curses.KEY_UP:
             if self.selected_index > 0:
                 self.selected_index -= 1
@@ -493,11 +813,39 @@ class RadarUI:
         elif key == curses.KEY_DOWN:
             if self.selected_index < len(self.devices) - 1:
                 self.selected_index += 1
-                height = self.stdscr.getmaxyx()[0]
+                height = self._frame_size[0] if self._frame_size else self.stdscr.getmaxyx()[0]
                 visible_height = (height - 4) // 2 - 2
                 if self.selected_index >= self.scroll_offset + visible_height:
                     self.scroll_offset = self.selected_index - visible_height + 1
     
+    def reload_devices(self):
+        """
+        Reload scan results and show them.
+        
+        If loading fails the previous devices stay on screen and the error
+        is shown in the status bar until a later reload succeeds.
+        """
+        try:
+            devices = self.load_scan_results()
+        except Exception as e:
+            self.load_error = str(e) or type(e).__name__
+            return
+        
+        # Rebinding the attributes is atomic, so the draw loop always
+        # sees either the old or the new complete list
+        self.set_devices(devices)
+        self.load_error = None
+    
+    def _scan_loop(self):
+        """Reload scan results in the background until the UI exits."""
+        while self.running:
+            self._reload_event.wait(self.SCAN_RELOAD_INTERVAL)
+            self._reload_event.clear()
+            if not self.running:
+                break
+            
+            self.reload_devices()
+    
     def run(self, stdscr):
         """
         Main UI loop.
@@ -509,32 +857,41 @@ class RadarUI:
         
         # Setup curses
         curses.curs_set(0)  # Hide cursor
+        stdscr.leaveok(True)  # Don't move the cursor after each write
         self.init_colors()
         
-        # Initial load
-        self.devices = self.load_scan_results()
+        # Initial load, then keep reloading off the render loop so JSON
+        # parsing never stalls the animation
+        self.reload_devices()
+        loader = threading.Thread(target=self._scan_loop, daemon=True)
+        loader.start()
         
-        # Main loop
-        last_refresh = 0
+        # Main loop, paced against a deadline so slow frames don't add
+        # their drawing time on top of the sleep
+        frame_period = max(0.05, self.refresh_rate / 10)
+        next_frame = time.monotonic()
         
-        while self.running:
-            current_time = time.time()
-            
-            # Auto-refresh scan results
-            if current_time - last_refresh > 5:
-                self.devices = self.load_scan_results()
-                last_refresh = current_time
-            
-            # Update radar animation
-            self.scan_angle = (self.scan_angle + 5) % 360
-            
-            # Draw and handle input
-            self.draw()
-            self.handle_input()
-            
-            # Control refresh rate with minimum threshold to avoid high CPU usage
-            sleep_time = max(0.05, self.refresh_rate / 10)
-            time.sleep(sleep_time)
+        try:
+            while self.running:
+                # Update radar animation (paused while the radar is hidden)
+                if self.view_mode == 'radar':
+                    self.scan_angle = (self.scan_angle + SWEEP_STEP) % 360
+                
+                # Draw and handle input
+                self.draw()
+                self.handle_input()
+                
+                # Sleep until the next frame is due; if we fell behind, start
+                # over from now rather than rushing out a burst of frames
+                next_frame += frame_period
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_frame = time.monotonic()
+        finally:
+            self.running = False
+            self._reload_event.set()
 
 
 def run_radar_ui(output_dir: str, refresh_rate: float = 1.0):
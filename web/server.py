@@ -7,29 +7,87 @@ Uses Flask for lightweight web serving.
 
 Features:
 - REST API for scan results
-- Real-time data updates via polling
+- Real-time data updates via server-sent events (polling fallback)
 - Responsive dashboard UI
 - Device filtering and search
 - Export functionality
 """
 
 import argparse
-import json
+import gzip
+import hashlib
+import html
 import os
+import queue
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 # Check for Flask availability
 try:
-    from flask import Flask, jsonify, render_template_string, request, send_from_directory
+    from flask import Flask, Response, request, send_from_directory
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
     print("Warning: Flask not installed. Install with: pip install flask", file=sys.stderr)
 
+# Brotli is optional; gzip from the standard library is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# msgpack is optional; when installed, API clients can ask for it instead
+# of JSON with an Accept: application/msgpack header
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Waitress is an optional production WSGI server; without it the Flask
+# development server is used in threaded mode
+try:
+    import waitress
+except ImportError:
+    waitress = None
+
 # Add lib to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib import inotify
+from lib.json_utils import dumps_json, get_timestamp, load_json
+
+# Seconds between scan directory checks when inotify is unavailable, and
+# between safety rechecks while waiting on inotify
+WATCH_POLL_INTERVAL = 2.0
+WATCH_RECHECK_INTERVAL = 30.0
+
+# Seconds between keep-alive comments on idle event streams
+STREAM_KEEPALIVE = 15.0
+
+# Worker threads when serving through waitress
+WEB_SERVER_THREADS = 8
+
+# Open /api/stream connections allowed at once. Each holds a server thread
+# for as long as it is connected, so this stays well below
+# WEB_SERVER_THREADS to leave threads for ordinary requests
+MAX_STREAMS = WEB_SERVER_THREADS // 2
+
+# Maximum threads parsing changed scan files at once
+PARSE_WORKERS = 8
+
+# Responses gzipped on the way out: their types, the smallest body worth
+# compressing, and the zlib level
+COMPRESS_MIMETYPES = ('application/json', 'application/msgpack', 'text/html')
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 6
+
+# Latest /api/export body, kept under the output directory so it can be
+# sent straight from disk
+EXPORT_CACHE_DIR = '.cache'
+EXPORT_FILENAME = 'export.json'
 
 
 # HTML Template for the dashboard
@@ -348,7 +406,7 @@ DASHBOARD_HTML = '''
         
         <footer>
             <span class="auto-refresh-indicator"></span>
-            Auto-refreshing every <span id="refresh-interval">5</span> seconds
+            <span id="refresh-mode">Auto-refreshing every <span id="refresh-interval">5</span> seconds</span>
             | Last update: <span id="last-update">-</span>
         </footer>
     </div>
@@ -357,13 +415,29 @@ DASHBOARD_HTML = '''
         let allDevices = [];
         const refreshInterval = 5000;
         
+        // ETag of the device list currently rendered
+        let lastETag = null;
+        
+        // Rendered cards by device key: { html, el }
+        let cards = new Map();
+        
         async function fetchDevices() {
             try {
-                const response = await fetch('/api/devices');
-                const data = await response.json();
-                allDevices = data.devices || [];
-                updateStats(data);
-                renderDevices(allDevices);
+                const headers = lastETag ? { 'If-None-Match': lastETag } : {};
+                const response = await fetch('/api/devices?view=dashboard', { headers: headers });
+                const etag = response.headers.get('ETag');
+                
+                // Skip parsing and rendering when nothing changed
+                if (response.status !== 304 && !(etag && etag === lastETag)) {
+                    const data = await response.json();
+                    allDevices = data.devices || [];
+                    allDevices.forEach(device => {
+                        device.search = searchText(device);
+                    });
+                    lastETag = etag;
+                    updateStats(data);
+                    renderDevices(allDevices);
+                }
                 document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
             } catch (error) {
                 console.error('Error fetching devices:', error);
@@ -388,54 +462,52 @@ DASHBOARD_HTML = '''
                         <div style="margin-top: 10px;">Run a scan to discover devices</div>
                     </div>
                 `;
+                cards = new Map();
                 return;
             }
             
-            grid.innerHTML = devices.map(device => {
-                const type = device.scan_type || 'unknown';
-                const name = device.name || device.ssid || device.ip || device.address || 'Unknown';
-                const ip = device.ip || '-';
-                const mac = device.mac || device.address || device.bssid || '-';
-                const signal = device.signal_dbm;
-                const signalQuality = device.signal_quality || (signal ? Math.max(0, Math.min(100, (signal + 100) * 2)) : null);
-                
-                let details = '';
+            // Reuse the existing card element for each device whose markup
+            // is unchanged, so a refresh only touches cards that changed
+            const nextCards = new Map();
+            const keyCounts = new Map();
+            
+            devices.forEach(device => {
+                let key = deviceKey(device);
+                const count = keyCounts.get(key) || 0;
+                keyCounts.set(key, count + 1);
+                if (count) key += '#' + count;
                 
-                if (type === 'network') {
-                    details = `
-                        <div class="row"><span class="label">IP:</span><span class="value">${ip}</span></div>
-                        <div class="row"><span class="label">MAC:</span><span class="value">${mac}</span></div>
-                        ${device.hostname ? `<div class="row"><span class="label">Host:</span><span class="value">${device.hostname}</span></div>` : ''}
-                        ${device.latency_ms ? `<div class="row"><span class="label">Latency:</span><span class="value">${device.latency_ms} ms</span></div>` : ''}
-                    `;
-                } else if (type === 'wifi') {
-                    details = `
-                        <div class="row"><span class="label">BSSID:</span><span class="value">${mac}</span></div>
-                        ${device.channel ? `<div class="row"><span class="label">Channel:</span><span class="value">${device.channel}</span></div>` : ''}
-                        ${signalQuality !== null ? `<div class="row"><span class="label">Signal:</span><span class="value">${signal || ''} dBm <span class="signal-bar" style="--signal: ${signalQuality}%"></span></span></div>` : ''}
-                        ${device.security ? `<div class="row"><span class="label">Security:</span><span class="value">${device.security} ${device.encryption ? '(' + device.encryption.join(', ') + ')' : ''}</span></div>` : ''}
-                    `;
-                } else if (type === 'bluetooth') {
-                    details = `
-                        <div class="row"><span class="label">Address:</span><span class="value">${mac}</span></div>
-                        ${device.type ? `<div class="row"><span class="label">Type:</span><span class="value">${device.type}</span></div>` : ''}
-                        ${device.device_type ? `<div class="row"><span class="label">Device:</span><span class="value">${device.device_type}</span></div>` : ''}
-                        ${device.rssi ? `<div class="row"><span class="label">RSSI:</span><span class="value">${device.rssi} dBm</span></div>` : ''}
-                    `;
+                const html = device.card;
+                let card = cards.get(key);
+                if (!card || card.html !== html) {
+                    const template = document.createElement('template');
+                    template.innerHTML = html.trim();
+                    card = { html: html, el: template.content.firstElementChild };
                 }
-                
-                return `
-                    <div class="device-card ${type}">
-                        <div class="device-header">
-                            <span class="device-name">${escapeHtml(name)}</span>
-                            <span class="device-type ${type}">${type}</span>
-                        </div>
-                        <div class="device-details">
-                            ${details}
-                        </div>
-                    </div>
-                `;
-            }).join('');
+                nextCards.set(key, card);
+            });
+            
+            const wanted = new Set();
+            nextCards.forEach(card => wanted.add(card.el));
+            Array.from(grid.children).forEach(el => {
+                if (!wanted.has(el)) el.remove();
+            });
+            
+            let cursor = grid.firstElementChild;
+            nextCards.forEach(card => {
+                if (card.el === cursor) {
+                    cursor = cursor.nextElementSibling;
+                } else {
+                    grid.insertBefore(card.el, cursor);
+                }
+            });
+            
+            cards = nextCards;
+        }
+        
+        function deviceKey(device) {
+            const id = device.mac || device.bssid || device.address || device.ip || device.ssid || device.name || '';
+            return (device.scan_type || 'unknown') + '|' + id;
         }
         
         function filterDevices() {
@@ -449,22 +521,26 @@ DASHBOARD_HTML = '''
                 
                 if (!search) return true;
                 
-                const searchFields = [
-                    device.name,
-                    device.ssid,
-                    device.ip,
-                    device.mac,
-                    device.address,
-                    device.bssid,
-                    device.hostname
-                ].filter(Boolean).join(' ').toLowerCase();
-                
-                return searchFields.includes(search);
+                return device.search.includes(search);
             });
             
             renderDevices(filtered);
         }
         
+        // Lower-cased text the search box matches, built once per fetch
+        // instead of on every keystroke
+        function searchText(device) {
+            return [
+                device.name,
+                device.ssid,
+                device.ip,
+                device.mac,
+                device.address,
+                device.bssid,
+                device.hostname
+            ].filter(Boolean).join(' ').toLowerCase();
+        }
+        
         function refreshData() {
             fetchDevices();
         }
@@ -490,22 +566,199 @@ DASHBOARD_HTML = '''
             }
         }
         
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
+        function startPolling() {
+            setInterval(fetchDevices, refreshInterval);
+            document.getElementById('refresh-mode').textContent =
+                `Auto-refreshing every ${refreshInterval / 1000} seconds`;
         }
         
-        // Initial load and auto-refresh
+        // Initial load, then refresh whenever the server reports a change;
+        // fall back to polling where server-sent events are unavailable or
+        // the server turns the stream away
         fetchDevices();
-        setInterval(fetchDevices, refreshInterval);
-        document.getElementById('refresh-interval').textContent = refreshInterval / 1000;
+        if (window.EventSource) {
+            const stream = new EventSource('/api/stream');
+            stream.onopen = () => {
+                document.getElementById('refresh-mode').textContent = 'Live updates';
+            };
+            stream.onmessage = () => fetchDevices();
+            stream.onerror = () => {
+                // CLOSED means the browser gave up reconnecting, e.g. after
+                // a 204 when the server is at its stream limit
+                if (stream.readyState === EventSource.CLOSED) {
+                    startPolling();
+                }
+            };
+        } else {
+            startPolling();
+        }
     </script>
 </body>
 </html>
 '''
 
 
+def _display(value: Any) -> str:
+    """Format a device field the way the dashboard shows it."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (list, tuple)):
+        return ', '.join(_display(v) for v in value)
+    return str(value)
+
+
+def _card_row(label: str, value: str) -> str:
+    """Render one label/value row of a device card."""
+    return (f'<div class="row"><span class="label">{label}:</span>'
+            f'<span class="value">{value}</span></div>')
+
+
+# Fields the dashboard reads from each scan type (for its search box and
+# to tell cards apart); everything else is only in the full API responses
+DASHBOARD_FIELDS = {
+    'network': ('ip', 'mac', 'hostname'),
+    'wifi': ('ssid', 'bssid'),
+    'bluetooth': ('name', 'address'),
+}
+_DEFAULT_DASHBOARD_FIELDS = ('name', 'ssid', 'ip', 'mac', 'address', 'bssid', 'hostname')
+
+
+# Readings sent as whole numbers, and latencies sent to a tenth of a
+# millisecond; finer digits are measurement noise that only costs bytes
+INTEGER_FIELDS = ('signal_dbm', 'signal_quality', 'rssi', 'channel')
+LATENCY_DECIMALS = 1
+
+
+def quantize_device(device: Dict[str, Any]):
+    """
+    Round a device's numeric readings in place.
+    
+    Args:
+        device: Device entry from a scan file
+    """
+    for field in INTEGER_FIELDS:
+        value = device.get(field)
+        if isinstance(value, float):
+            device[field] = int(round(value))
+    
+    latency = device.get('latency_ms')
+    if isinstance(latency, float):
+        device['latency_ms'] = round(latency, LATENCY_DECIMALS)
+
+
+def render_device_card(device: Dict[str, Any]) -> str:
+    """
+    Render a device as a dashboard card.
+    
+    Every device field is HTML-escaped, so the markup can be inserted
+    into the page as-is.
+    
+    Args:
+        device: Device entry tagged with its scan_type
+    
+    Returns:
+        Card HTML
+    """
+    def text(value: Any) -> str:
+        return html.escape(_display(value))
+    
+    scan_type = text(device.get('scan_type') or 'unknown')
+    name = device.get('name') or device.get('ssid') or device.get('ip') or device.get('address') or 'Unknown'
+    mac = device.get('mac') or device.get('address') or device.get('bssid') or '-'
+    
+    rows = []
+    
+    if scan_type == 'network':
+        rows.append(_card_row('IP', text(device.get('ip') or '-')))
+        rows.append(_card_row('MAC', text(mac)))
+        if device.get('hostname'):
+            rows.append(_card_row('Host', text(device['hostname'])))
+        if device.get('latency_ms'):
+            rows.append(_card_row('Latency', text(device['latency_ms']) + ' ms'))
+    
+    elif scan_type == 'wifi':
+        rows.append(_card_row('BSSID', text(mac)))
+        if device.get('channel'):
+            rows.append(_card_row('Channel', text(device['channel'])))
+        
+        signal = device.get('signal_dbm')
+        quality = device.get('signal_quality') or None
+        if quality is None and isinstance(signal, (int, float)) and signal:
+            quality = max(0, min(100, (signal + 100) * 2))
+        if quality is not None:
+            rows.append(_card_row('Signal', (
+                f'{text(signal or "")} dBm '
+                f'<span class="signal-bar" style="--signal: {text(quality)}%"></span>'
+            )))
+        
+        if device.get('security'):
+            security = text(device['security'])
+            if device.get('encryption'):
+                security += f' ({text(device["encryption"])})'
+            rows.append(_card_row('Security', security))
+    
+    elif scan_type == 'bluetooth':
+        rows.append(_card_row('Address', text(mac)))
+        if device.get('type'):
+            rows.append(_card_row('Type', text(device['type'])))
+        if device.get('device_type'):
+            rows.append(_card_row('Device', text(device['device_type'])))
+        if device.get('rssi'):
+            rows.append(_card_row('RSSI', text(device['rssi']) + ' dBm'))
+    
+    return (
+        f'<div class="device-card {scan_type}">'
+        f'<div class="device-header">'
+        f'<span class="device-name">{text(name)}</span>'
+        f'<span class="device-type {scan_type}">{scan_type}</span>'
+        f'</div>'
+        f'<div class="device-details">{"".join(rows)}</div>'
+        f'</div>'
+    )
+
+
+def dashboard_device(device: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a device to what the dashboard needs.
+    
+    Args:
+        device: Device entry tagged with its scan_type
+    
+    Returns:
+        Dict with the scan type's DASHBOARD_FIELDS that are set, the
+        scan_type and the rendered card markup
+    """
+    scan_type = device.get('scan_type')
+    fields = DASHBOARD_FIELDS.get(scan_type, _DEFAULT_DASHBOARD_FIELDS)
+    
+    summary = {field: device[field] for field in fields if field in device}
+    summary['scan_type'] = scan_type
+    summary['card'] = render_device_card(device)
+    return summary
+
+
+def accepts_encoding(header: str, encoding: str) -> bool:
+    """
+    Check whether an Accept-Encoding header allows a content coding.
+    
+    Args:
+        header: Accept-Encoding request header value
+        encoding: Content coding to look for (e.g. 'gzip')
+    
+    Returns:
+        True if the coding is listed without a zero quality value
+    """
+    for part in header.split(','):
+        name, _, params = part.partition(';')
+        if name.strip().lower() != encoding:
+            continue
+        params = params.replace(' ', '')
+        return params not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
 def create_app(output_dir: str) -> 'Flask':
     """
     Create Flask application.
@@ -522,72 +775,446 @@ def create_app(output_dir: str) -> 'Flask':
     app = Flask(__name__)
     app.config['OUTPUT_DIR'] = output_dir
     
-    def load_all_devices() -> List[Dict[str, Any]]:
-        """Load all devices from scan results."""
-        devices = []
+    def json_response(data: Dict[str, Any]) -> 'Response':
+        """Serialize data with orjson (when available) instead of jsonify."""
+        return Response(dumps_json(data, pretty=False), mimetype='application/json')
+    
+    # Gzipped bodies of responses that carry an ETag, per URL, so an
+    # unchanged cached body is compressed only once
+    gzip_bodies: Dict[Tuple[str, str], bytes] = {}
+    
+    @app.after_request
+    def compress_response(response: 'Response') -> 'Response':
+        """Gzip compressible responses for clients that accept it."""
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESS_MIMETYPES):
+            return response
         
-        if not os.path.exists(output_dir):
-            return devices
+        vary = response.headers.get('Vary')
+        response.headers['Vary'] = f'{vary}, Accept-Encoding' if vary else 'Accept-Encoding'
         
-        for filename in os.listdir(output_dir):
-            if not filename.endswith('.json'):
-                continue
+        if not accepts_encoding(request.headers.get('Accept-Encoding', ''), 'gzip'):
+            return response
+        
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+        
+        etag = response.headers.get('ETag')
+        cache_key = (request.full_path, etag)
+        body = gzip_bodies.get(cache_key) if etag else None
+        if body is None:
+            body = gzip.compress(data, compresslevel=COMPRESS_LEVEL)
+            if etag:
+                # Bodies for superseded signatures are never asked for again
+                if len(gzip_bodies) >= 16:
+                    gzip_bodies.clear()
+                gzip_bodies[cache_key] = body
+        
+        response.set_data(body)
+        response.headers['Content-Encoding'] = 'gzip'
+        if etag and not etag.startswith('W/'):
+            # The compressed bytes differ, so the tag is no longer strong
+            response.headers['ETag'] = 'W/' + etag
+        return response
+    
+    # Parsed devices and their dashboard summaries per scan file, tagged
+    # with the (mtime, size, inode) they were parsed at; shared by all
+    # request threads
+    file_cache: Dict[str, Tuple[Tuple[int, int, int], List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+    file_cache_lock = threading.Lock()
+    
+    def parse_scan_file(filepath: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Parse one scan file into devices and their dashboard summaries."""
+        try:
+            scan = load_json(filepath)
+        except (ValueError, OSError):
+            return [], []
+        
+        # Check the file's shape once here, so nothing downstream has to
+        if not isinstance(scan, dict) or not isinstance(scan.get('data', []), list):
+            return [], []
+        
+        scan_type = scan.get('scan_type', 'unknown')
+        data = [item for item in scan.get('data', []) if isinstance(item, dict)]
+        
+        # The freshly parsed items are owned here, so tag them in place
+        # rather than copying each one; an item's own scan_type wins
+        for item in data:
+            item.setdefault('scan_type', scan_type)
+            quantize_device(item)
+        
+        return data, [dashboard_device(item) for item in data]
+    
+    # Serialized /api/devices body per (view, msgpack) for the last seen
+    # scan signature
+    devices_response: Dict[Tuple[str, bool], Tuple[str, bytes]] = {}
+    
+    def list_scan_files() -> List[Tuple[str, Tuple[int, int, int]]]:
+        """
+        List the scan files in output_dir.
+        
+        Returns:
+            List of (path, stat key) tuples, where the key is the file's
+            modification time, size and inode
+        """
+        files = []
+        
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    
+                    try:
+                        # Skip directories and other non-regular entries
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    
+                    files.append((entry.path, (st.st_mtime_ns, st.st_size, st.st_ino)))
+        except FileNotFoundError:
+            pass
+        
+        return files
+    
+    def iter_scan_files():
+        """
+        Walk the scan files in output_dir, one file at a time.
+        
+        Only files whose stat key changed since they were last seen are
+        parsed again; the rest come from file_cache.
+        
+        Yields:
+            Tuple of (path, stat key, devices) for each scan file
+        """
+        for path, key in list_scan_files():
+            with file_cache_lock:
+                cached = file_cache.get(path)
             
-            filepath = os.path.join(output_dir, filename)
+            if cached is None or cached[0] != key:
+                cached = (key,) + parse_scan_file(path)
+                with file_cache_lock:
+                    file_cache[path] = cached
             
-            try:
-                with open(filepath, 'r') as f:
-                    scan = json.load(f)
-                
-                scan_type = scan.get('scan_type', 'unknown')
-                data = scan.get('data', [])
-                
-                for item in data:
-                    device = {
-                        'scan_type': scan_type,
-                        **item
-                    }
-                    devices.append(device)
+            yield path, key, cached[1]
+    
+    def files_signature(files: List[Tuple[str, Tuple[int, int, int]]]) -> str:
+        """Digest a list_scan_files() result into a short signature."""
+        return hashlib.blake2b(
+            repr(sorted(files)).encode(), digest_size=16
+        ).hexdigest()
+    
+    def load_devices_snapshot() -> Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Load all devices from scan results along with a signature of the
+        scan files they came from.
+        
+        Changed files are parsed in parallel, so a burst of new scans
+        doesn't wait on each file's read in turn.
+        
+        Returns:
+            Tuple of (signature, devices, summaries), where summaries
+            holds each device's dashboard_device(); the signature changes
+            whenever any scan file is added, removed or modified
+        """
+        files = list_scan_files()
+        
+        with file_cache_lock:
+            stale = [path for path, key in files
+                     if file_cache.get(path, (None,))[0] != key]
+        
+        if len(stale) > 1:
+            with ThreadPoolExecutor(max_workers=min(PARSE_WORKERS, len(stale))) as executor:
+                parsed = dict(zip(stale, executor.map(parse_scan_file, stale)))
+        else:
+            parsed = {path: parse_scan_file(path) for path in stale}
+        
+        devices = []
+        summaries = []
+        seen = {}
+        
+        with file_cache_lock:
+            for path, key in files:
+                if path in parsed:
+                    cached = (key,) + parsed[path]
+                else:
+                    cached = file_cache.get(path)
+                    # Another request may have dropped or replaced it since
+                    if cached is None or cached[0] != key:
+                        cached = (key,) + parse_scan_file(path)
+                seen[path] = cached
+                devices.extend(cached[1])
+                summaries.extend(cached[2])
             
-            except (json.JSONDecodeError, IOError):
-                continue
+            # Forget files that went away
+            file_cache.clear()
+            file_cache.update(seen)
+        
+        return files_signature(files), devices, summaries
+    
+    def load_all_devices() -> List[Dict[str, Any]]:
+        """Load all devices from scan results."""
+        return load_devices_snapshot()[1]
+    
+    # One queue per open /api/stream; the watcher thread starts with the
+    # first stream
+    subscribers: List['queue.Queue[str]'] = []
+    subscribers_lock = threading.Lock()
+    watcher: List[threading.Thread] = []
+    
+    def watch_scans():
+        """
+        Push the new scan signature to every stream when it changes.
         
-        return devices
+        Only the file listing is checked, so nothing is parsed here. The
+        thread exits once the last stream closes, and a failed check is
+        reported and retried instead of stopping the watcher for good.
+        """
+        fd = inotify.watch_directory(output_dir)
+        last_signature = None
+        
+        try:
+            while True:
+                with subscribers_lock:
+                    if not subscribers:
+                        watcher.clear()
+                        return
+                
+                try:
+                    signature = files_signature(list_scan_files())
+                    if last_signature is not None and signature != last_signature:
+                        with subscribers_lock:
+                            for updates in subscribers:
+                                updates.put(signature)
+                    last_signature = signature
+                except Exception as e:
+                    print(f"Warning: scan watcher check failed: {e}", file=sys.stderr)
+                
+                if fd is not None:
+                    inotify.wait_for_events(fd, WATCH_RECHECK_INTERVAL)
+                else:
+                    time.sleep(WATCH_POLL_INTERVAL)
+        finally:
+            if fd is not None:
+                os.close(fd)
+    
+    
+    # The dashboard has no template variables, so it is encoded and
+    # compressed once here rather than rendered on every request
+    dashboard_bodies = {'identity': DASHBOARD_HTML.encode('utf-8')}
+    dashboard_bodies['gzip'] = gzip.compress(dashboard_bodies['identity'], compresslevel=9)
+    if brotli is not None:
+        dashboard_bodies['br'] = brotli.compress(dashboard_bodies['identity'], quality=11)
     
     @app.route('/')
     def dashboard():
         """Serve the dashboard page."""
-        return render_template_string(DASHBOARD_HTML)
+        accept = request.headers.get('Accept-Encoding', '')
+        
+        for encoding in ('br', 'gzip'):
+            if encoding in dashboard_bodies and accepts_encoding(accept, encoding):
+                return Response(dashboard_bodies[encoding], mimetype='text/html', headers={
+                    'Content-Encoding': encoding,
+                    'Vary': 'Accept-Encoding',
+                })
+        
+        return Response(dashboard_bodies['identity'], mimetype='text/html', headers={
+            'Vary': 'Accept-Encoding',
+        })
     
     @app.route('/api/devices')
     def api_devices():
-        """API endpoint to get all devices."""
-        devices = load_all_devices()
+        """
+        API endpoint to get all devices.
+        
+        With ?view=dashboard each device is reduced to dashboard_device()
+        instead of carrying every scanned field. Clients sending
+        Accept: application/msgpack get MessagePack when msgpack is
+        installed.
+        
+        The body only changes when a scan file does, so it is cached per
+        scan signature and tagged with it as an ETag; polls with a
+        matching If-None-Match get an empty 304.
+        """
+        signature, devices, summaries = load_devices_snapshot()
+        view = 'dashboard' if request.args.get('view') == 'dashboard' else 'devices'
+        use_msgpack = (msgpack is not None
+                       and 'application/msgpack' in request.headers.get('Accept', ''))
+        
+        # Each representation of the same URL needs its own ETag
+        etag = f'"{signature}-msgpack"' if use_msgpack else f'"{signature}"'
+        headers = {'ETag': etag, 'Vary': 'Accept'}
+        
+        # Compare weakly: gzipped responses carry a W/ version of the tag
+        if etag in (tag.strip().lstrip('W/') for tag in request.headers.get('If-None-Match', '').split(',')):
+            return Response(status=304, headers=headers)
+        
+        cached = devices_response.get((view, use_msgpack))
+        if cached is not None and cached[0] == signature:
+            body = cached[1]
+        else:
+            # Count by type in a single pass
+            counts = Counter(d.get('scan_type') for d in devices)
+            
+            payload = {
+                'devices': summaries if view == 'dashboard' else devices,
+                'total': len(devices),
+                'network_count': counts['network'],
+                'wifi_count': counts['wifi'],
+                'bluetooth_count': counts['bluetooth'],
+                'timestamp': get_timestamp()
+            }
+            
+            if use_msgpack:
+                body = msgpack.packb(payload, default=str, use_bin_type=True)
+            else:
+                body = dumps_json(payload, pretty=False)
+            devices_response[(view, use_msgpack)] = (signature, body)
+        
+        headers['Cache-Control'] = 'no-cache'
+        mimetype = 'application/msgpack' if use_msgpack else 'application/json'
+        return Response(body, mimetype=mimetype, headers=headers)
+    
+    @app.route('/api/stream')
+    def api_stream():
+        """
+        Server-sent events endpoint.
         
-        # Count by type
-        network_count = sum(1 for d in devices if d.get('scan_type') == 'network')
-        wifi_count = sum(1 for d in devices if d.get('scan_type') == 'wifi')
-        bluetooth_count = sum(1 for d in devices if d.get('scan_type') == 'bluetooth')
-        
-        return jsonify({
-            'devices': devices,
-            'total': len(devices),
-            'network_count': network_count,
-            'wifi_count': wifi_count,
-            'bluetooth_count': bluetooth_count,
-            'timestamp': datetime.now().isoformat()
+        Sends the current scan signature on connect and a new one whenever
+        the scan results change, so the dashboard only refetches
+        /api/devices when there is something new. Past MAX_STREAMS open
+        streams the request gets a 204, which EventSource does not retry;
+        the dashboard polls instead.
+        """
+        updates: 'queue.Queue[str]' = queue.Queue()
+        with subscribers_lock:
+            if len(subscribers) >= MAX_STREAMS:
+                return Response(status=204)
+            subscribers.append(updates)
+            if not watcher:
+                watcher.append(threading.Thread(target=watch_scans, daemon=True))
+                watcher[0].start()
+        
+        def unsubscribe():
+            with subscribers_lock:
+                if updates in subscribers:
+                    subscribers.remove(updates)
+        
+        def events():
+            try:
+                signature = load_devices_snapshot()[0]
+                while True:
+                    yield f"data: {dumps_json({'signature': signature}, pretty=False).decode()}\n\n"
+                    
+                    # Comment lines keep proxies from timing out idle streams
+                    # and let a closed connection surface as a write error
+                    while True:
+                        try:
+                            signature = updates.get(timeout=STREAM_KEEPALIVE)
+                            break
+                        except queue.Empty:
+                            yield ": keep-alive\n\n"
+            finally:
+                unsubscribe()
+        
+        response = Response(events(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
         })
+        # A client that disconnects before the first event never runs the
+        # generator's finally, but the server still closes the response
+        response.call_on_close(unsubscribe)
+        return response
+    
+    def export_chunks(files: List[Tuple[str, Tuple[int, int, int]]]):
+        """
+        Generate the export document one scan file at a time, so the full
+        device list is never held in memory; total_devices therefore
+        comes last.
+        
+        Args:
+            files: Receives the (path, stat key) of each file exported
+        
+        Yields:
+            Chunks of the JSON document
+        """
+        yield b'{"export_timestamp":' + dumps_json(get_timestamp(), pretty=False) + b',"devices":['
+        
+        total = 0
+        for path, key, file_devices in iter_scan_files():
+            files.append((path, key))
+            if not file_devices:
+                continue
+            if total:
+                yield b','
+            # Strip the enclosing brackets so files join into one array
+            yield dumps_json(file_devices, pretty=False)[1:-1]
+            total += len(file_devices)
+        
+        yield b'],"total_devices":' + str(total).encode() + b'}'
+    
+    export_dir = os.path.join(output_dir, EXPORT_CACHE_DIR)
+    export_path = os.path.join(export_dir, EXPORT_FILENAME)
+    export_state: Dict[str, str] = {}
+    export_lock = threading.Lock()
+    
+    def refresh_export_file() -> bool:
+        """
+        Rewrite the cached export file if any scan file changed since it
+        was written.
+        
+        Returns:
+            True if the file is current, False if it couldn't be written
+        """
+        signature = files_signature(list_scan_files())
+        
+        with export_lock:
+            if export_state.get('signature') == signature and os.path.exists(export_path):
+                return True
+            
+            # Write next to the target and rename, so readers never see a
+            # partial file
+            written = []
+            tmp_path = f'{export_path}.{os.getpid()}.tmp'
+            try:
+                os.makedirs(export_dir, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    for chunk in export_chunks(written):
+                        f.write(chunk)
+                os.replace(tmp_path, export_path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                export_state.clear()
+                return False
+            
+            export_state['signature'] = files_signature(written)
+        
+        return True
     
     @app.route('/api/export')
     def api_export():
-        """API endpoint to export all scan data."""
-        devices = load_all_devices()
+        """
+        API endpoint to export all scan data.
         
-        return jsonify({
-            'export_timestamp': datetime.now().isoformat(),
-            'total_devices': len(devices),
-            'devices': devices
-        })
+        The export is written to a file once per change to the scan files
+        and sent from disk, which gives sendfile, conditional requests and
+        ranges; export_timestamp is when that file was written. If the
+        output directory isn't writable the export is streamed instead.
+        """
+        if refresh_export_file():
+            return send_from_directory(export_dir, EXPORT_FILENAME,
+                                       mimetype='application/json', conditional=True)
+        
+        return Response(export_chunks([]), mimetype='application/json')
     
     @app.route('/api/scan/<scan_type>')
     def api_scan_type(scan_type: str):
@@ -595,11 +1222,11 @@ def create_app(output_dir: str) -> 'Flask':
         devices = load_all_devices()
         filtered = [d for d in devices if d.get('scan_type') == scan_type]
         
-        return jsonify({
+        return json_response({
             'scan_type': scan_type,
             'devices': filtered,
             'count': len(filtered),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': get_timestamp()
         })
     
     return app
@@ -629,7 +1256,12 @@ def run_server(host: str = '127.0.0.1', port: int = 8080, output_dir: str = './o
     print(f"Reading scan results from: {output_dir}")
     print("Press Ctrl+C to stop")
     
-    app.run(host=host, port=port, debug=debug)
+    if waitress is not None and not debug:
+        # Event streams are capped at MAX_STREAMS, so some of these
+        # threads are always free for other requests
+        waitress.serve(app, host=host, port=port, threads=WEB_SERVER_THREADS)
+    else:
+        app.run(host=host, port=port, debug=debug, threaded=True)
 
 
 def main():